@@ -0,0 +1,189 @@
+# Copyright (c) 2025, VRAI Labs and/or its affiliates. All rights reserved.
+#
+# This software is licensed under the Apache License, Version 2.0 (the
+# "License") as published by the Apache Software Foundation.
+#
+# You may not use this file except in compliance with the License. You may
+# obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+"""
+Benchmarks of whole requests through the SuperTokens middleware of FastAPI,
+Flask and Django. The apps are called in-process (no HTTP server), for three
+kinds of requests:
+
+- passthrough: a request for the app's own API, which does not use sessions
+- verify_session: a request for an API protected by verify_session
+- refresh: a request for the refresh API, which is handled by the middleware
+"""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Any, Callable, Dict, List, Tuple
+
+from benchmarks.harness import Benchmark
+from benchmarks.session_benchmarks import init_supertokens
+from benchmarks.stub_core import StubCore
+
+# (method, path, cookie)
+RequestSpec = Tuple[str, str, str]
+
+
+def request_specs(core: StubCore) -> Dict[str, RequestSpec]:
+    access_token = core.create_access_token(5)
+    return {
+        "passthrough": ("GET", "/hello", ""),
+        "verify_session": ("GET", "/protected", f"sAccessToken={access_token}"),
+        "refresh": ("POST", "/auth/session/refresh", "sRefreshToken=refresh-token"),
+    }
+
+
+def fastapi_caller(spec: RequestSpec) -> Callable[[], Any]:
+    from fastapi import Depends, FastAPI
+    from starlette.responses import PlainTextResponse
+    from supertokens_python.framework.fastapi import get_middleware
+    from supertokens_python.recipe.session.framework.fastapi import verify_session
+
+    init_supertokens("fastapi", "asgi")
+    app = FastAPI()
+
+    @app.get("/hello")
+    async def hello():  # type: ignore
+        return PlainTextResponse("hello")
+
+    @app.get("/protected")
+    async def protected(_: Any = Depends(verify_session())):  # type: ignore
+        return PlainTextResponse("hello")
+
+    app.add_middleware(get_middleware())
+
+    method, path, cookie = spec
+    scope: Dict[str, Any] = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": method,
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "root_path": "",
+        "query_string": b"",
+        "headers": [(b"host", b"api.supertokens.io"), (b"cookie", cookie.encode())],
+        "server": ("api.supertokens.io", 80),
+    }
+    statuses: List[int] = []
+
+    async def receive() -> Dict[str, Any]:
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message: Dict[str, Any]):
+        if message["type"] == "http.response.start":
+            statuses.append(message["status"])
+
+    loop = asyncio.new_event_loop()
+
+    async def call():
+        await app(dict(scope), receive, send)
+
+    def run():
+        loop.run_until_complete(call())
+        assert statuses.pop() == 200
+
+    return run
+
+
+def flask_caller(spec: RequestSpec) -> Callable[[], Any]:
+    from flask import Flask
+    from supertokens_python.framework.flask import Middleware
+    from supertokens_python.recipe.session.framework.flask import verify_session
+    from werkzeug.test import EnvironBuilder
+
+    init_supertokens("flask", "wsgi")
+    app = Flask(__name__)
+
+    @app.route("/hello")
+    def hello():  # type: ignore
+        return "hello"
+
+    @app.route("/protected")
+    @verify_session()
+    def protected():  # type: ignore
+        return "hello"
+
+    Middleware(app)
+
+    method, path, cookie = spec
+    environ = EnvironBuilder(
+        method=method,
+        path=path,
+        base_url="http://api.supertokens.io",
+        headers={"cookie": cookie},
+    ).get_environ()
+    statuses: List[str] = []
+
+    def start_response(status: str, *_: Any):
+        statuses.append(status)
+
+    def run():
+        for _ in app.wsgi_app(dict(environ), start_response):
+            pass
+        assert statuses.pop().startswith("200")
+
+    return run
+
+
+def django_caller(spec: RequestSpec) -> Callable[[], Any]:
+    import django
+    from django.http import HttpRequest, HttpResponse
+    from django.test import RequestFactory
+    from supertokens_python.framework.django import middleware
+    from supertokens_python.recipe.session.framework.django.syncio import (
+        verify_session,
+    )
+
+    django.setup()
+    init_supertokens("django", "wsgi")
+
+    @verify_session()
+    def protected(request: HttpRequest):
+        return HttpResponse("hello")
+
+    def view(request: HttpRequest):
+        if request.path == "/protected":
+            return protected(request)
+        return HttpResponse("hello")
+
+    method, path, cookie = spec
+    factory = RequestFactory()
+    wrapped = middleware(view)
+
+    def run():
+        # Django's request objects cache what they have parsed, and the
+        # middleware stores state on them, so each call gets a fresh copy.
+        response = wrapped(factory.generic(method, path, HTTP_COOKIE=cookie))
+        assert response.status_code == 200
+
+    return run
+
+
+def get_benchmarks(core: StubCore) -> List[Benchmark]:
+    benchmarks: List[Benchmark] = []
+    callers = [
+        ("fastapi", fastapi_caller),
+        ("flask", flask_caller),
+        ("django", django_caller),
+    ]
+    for framework, caller in callers:
+        for kind, spec in request_specs(core).items():
+            benchmarks.append(
+                Benchmark(
+                    f"{framework}[{kind}]",
+                    lambda caller=caller, spec=spec: caller(spec),
+                )
+            )
+    return benchmarks
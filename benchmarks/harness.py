@@ -0,0 +1,172 @@
+# Copyright (c) 2025, VRAI Labs and/or its affiliates. All rights reserved.
+#
+# This software is licensed under the Apache License, Version 2.0 (the
+# "License") as published by the Apache Software Foundation.
+#
+# You may not use this file except in compliance with the License. You may
+# obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+from __future__ import annotations
+
+import asyncio
+import json
+import time
+import tracemalloc
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+
+class BenchmarkResult:
+    def __init__(
+        self,
+        name: str,
+        iterations: int,
+        p50_us: float,
+        p99_us: float,
+        mean_us: float,
+        peak_alloc_kib: float,
+    ):
+        self.name = name
+        self.iterations = iterations
+        self.p50_us = p50_us
+        self.p99_us = p99_us
+        self.mean_us = mean_us
+        # The largest amount of memory allocated during a single call, on average
+        self.peak_alloc_kib = peak_alloc_kib
+
+    def to_json(self) -> Dict[str, Any]:
+        return {
+            "name": self.name,
+            "iterations": self.iterations,
+            "p50_us": self.p50_us,
+            "p99_us": self.p99_us,
+            "mean_us": self.mean_us,
+            "peak_alloc_kib": self.peak_alloc_kib,
+        }
+
+
+class Benchmark:
+    """
+    A named benchmark. setup is called once before the benchmark runs and
+    returns the function to measure, which is called once per iteration.
+    teardown, if given, is called once after the benchmark has run.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        setup: Callable[[], Callable[[], Any]],
+        teardown: Optional[Callable[[], Any]] = None,
+    ):
+        self.name = name
+        self.setup = setup
+        self.teardown = teardown
+
+
+def percentile(sorted_values: List[float], p: float) -> float:
+    index = min(len(sorted_values) - 1, int(round(p / 100 * (len(sorted_values) - 1))))
+    return sorted_values[index]
+
+
+def measure(
+    name: str, fn: Callable[[], Any], iterations: int, warmup: int = 50
+) -> BenchmarkResult:
+    for _ in range(warmup):
+        fn()
+
+    timings: List[float] = []
+    perf_counter_ns = time.perf_counter_ns
+    for _ in range(iterations):
+        start = perf_counter_ns()
+        fn()
+        timings.append((perf_counter_ns() - start) / 1000)
+
+    # Tracing allocations slows calls down a lot, so it is done separately, and
+    # for fewer iterations.
+    alloc_iterations = max(1, min(iterations // 10, 200))
+    peaks: List[int] = []
+    tracemalloc.start()
+    try:
+        for _ in range(alloc_iterations):
+            tracemalloc.reset_peak()
+            before, _ = tracemalloc.get_traced_memory()
+            fn()
+            _, peak = tracemalloc.get_traced_memory()
+            peaks.append(peak - before)
+    finally:
+        tracemalloc.stop()
+
+    timings.sort()
+    return BenchmarkResult(
+        name,
+        iterations,
+        percentile(timings, 50),
+        percentile(timings, 99),
+        sum(timings) / len(timings),
+        sum(peaks) / len(peaks) / 1024,
+    )
+
+
+def run_sync(loop: asyncio.AbstractEventLoop, fn: Callable[[], Awaitable[Any]]):
+    """
+    Wraps an async function so that it can be measured. All calls run on the
+    given loop, so per loop state (like the pooled http client) is reused
+    across iterations.
+    """
+    return lambda: loop.run_until_complete(fn())
+
+
+def run_benchmarks(
+    benchmarks: List[Benchmark], iterations: int, name_filter: Optional[str] = None
+) -> List[BenchmarkResult]:
+    results: List[BenchmarkResult] = []
+    for benchmark in benchmarks:
+        if name_filter is not None and name_filter not in benchmark.name:
+            continue
+        fn = benchmark.setup()
+        try:
+            results.append(measure(benchmark.name, fn, iterations))
+        finally:
+            if benchmark.teardown is not None:
+                benchmark.teardown()
+    return results
+
+
+def print_results(
+    results: List[BenchmarkResult], baseline: Optional[Dict[str, Dict[str, Any]]]
+):
+    name_width = max([len(r.name) for r in results] + [10]) + 2
+    header = (
+        f"{'benchmark':<{name_width}}{'p50 (us)':>12}{'p99 (us)':>12}"
+        f"{'mean (us)':>12}{'peak alloc (KiB)':>18}"
+    )
+    if baseline is not None:
+        header += f"{'p50 vs baseline':>18}"
+    print(header)
+    for r in results:
+        line = (
+            f"{r.name:<{name_width}}{r.p50_us:>12.1f}{r.p99_us:>12.1f}"
+            f"{r.mean_us:>12.1f}{r.peak_alloc_kib:>18.1f}"
+        )
+        if baseline is not None:
+            previous = baseline.get(r.name)
+            if previous is None:
+                line += f"{'-':>18}"
+            else:
+                change = (r.p50_us - previous["p50_us"]) / previous["p50_us"] * 100
+                line += f"{change:>+17.1f}%"
+        print(line)
+
+
+def save_results(results: List[BenchmarkResult], path: str):
+    with open(path, "w") as f:
+        json.dump([r.to_json() for r in results], f, indent=2)
+
+
+def load_results(path: str) -> Dict[str, Dict[str, Any]]:
+    with open(path) as f:
+        return {r["name"]: r for r in json.load(f)}
@@ -0,0 +1,229 @@
+# Copyright (c) 2025, VRAI Labs and/or its affiliates. All rights reserved.
+#
+# This software is licensed under the Apache License, Version 2.0 (the
+# "License") as published by the Apache Software Foundation.
+#
+# You may not use this file except in compliance with the License. You may
+# obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+"""
+Measures the cold start cost of the SDK: each scenario is run in a fresh
+interpreter with `python -X importtime`, and the time spent importing modules
+and the number of modules imported are printed, along with the dependencies
+that took the longest to import. Modules that the interpreter imports at
+startup (site, and whatever it pulls in) are not counted. Run from the root of the repo with:
+
+    python -m benchmarks.import_time [--runs N] [-k NAME] [--json OUT] [--compare BASELINE]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import re
+import statistics
+import subprocess
+import sys
+from typing import Any, Dict, List, Optional, Tuple
+
+_INIT = """
+from supertokens_python import InputAppInfo, SupertokensConfig, init
+from supertokens_python.recipe import (
+    dashboard,
+    emailpassword,
+    emailverification,
+    passwordless,
+    session,
+    thirdparty,
+    userroles,
+)
+
+init(
+    app_info=InputAppInfo(
+        app_name="benchmark",
+        api_domain="http://localhost:3001",
+        website_domain="http://localhost:3000",
+    ),
+    supertokens_config=SupertokensConfig("http://localhost:3567"),
+    framework="{framework}",
+    recipe_list=[
+        session.init(),
+        emailpassword.init(),
+        thirdparty.init(),
+        passwordless.init(
+            contact_config=passwordless.ContactEmailOrPhoneConfig(),
+            flow_type="USER_INPUT_CODE_AND_MAGIC_LINK",
+        ),
+        emailverification.init(mode="OPTIONAL"),
+        dashboard.init(),
+        userroles.init(),
+    ],
+)
+"""
+
+SCENARIOS: Dict[str, str] = {
+    "import": "import supertokens_python",
+    "init": _INIT.format(framework="fastapi"),
+    "init_fastapi": "from supertokens_python.framework.fastapi import get_middleware\n"
+    + _INIT.format(framework="fastapi"),
+    "init_flask": "from supertokens_python.framework.flask import Middleware\n"
+    + _INIT.format(framework="flask"),
+    "init_django": "from supertokens_python.framework.django import middleware\n"
+    + _INIT.format(framework="django"),
+}
+
+_IMPORT_TIME_LINE = re.compile(r"import time:\s+(\d+) \|\s+(\d+) \| (\s*)(\S+)")
+
+
+class ImportTimeResult:
+    def __init__(
+        self,
+        name: str,
+        total_ms: float,
+        module_count: int,
+        sdk_module_count: int,
+        heaviest: List[Tuple[str, float]],
+    ):
+        self.name = name
+        # Median over the runs of the time spent importing modules
+        self.total_ms = total_ms
+        self.module_count = module_count
+        self.sdk_module_count = sdk_module_count
+        # Top level packages of the dependencies, by cumulative time
+        self.heaviest = heaviest
+
+    def to_json(self) -> Dict[str, Any]:
+        return {
+            "name": self.name,
+            "total_ms": self.total_ms,
+            "module_count": self.module_count,
+            "sdk_module_count": self.sdk_module_count,
+            "heaviest": [[name, ms] for name, ms in self.heaviest],
+        }
+
+
+def parse_import_time(output: str) -> List[Tuple[str, int, int]]:
+    """
+    Returns (module, self us, cumulative us) for each line of the output of
+    -X importtime.
+    """
+    rows: List[Tuple[str, int, int]] = []
+    for line in output.splitlines():
+        match = _IMPORT_TIME_LINE.match(line)
+        if match is not None:
+            rows.append((match.group(4), int(match.group(1)), int(match.group(2))))
+    return rows
+
+
+def import_time(code: str) -> List[Tuple[str, int, int]]:
+    env = dict(os.environ, SUPERTOKENS_ENV="testing")
+    env.setdefault("DJANGO_SETTINGS_MODULE", "tests.Django.settings")
+    process = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        text=True,
+        env=env,
+        check=False,
+    )
+    if process.returncode != 0:
+        raise Exception(f"Running {code!r} failed:\n{process.stderr}")
+    return parse_import_time(process.stderr)
+
+
+def run_scenario(name: str, code: str, runs: int) -> ImportTimeResult:
+    startup_modules = {module for module, _, _ in import_time("pass")}
+    totals: List[float] = []
+    rows: List[Tuple[str, int, int]] = []
+    for _ in range(runs):
+        rows = [row for row in import_time(code) if row[0] not in startup_modules]
+        totals.append(sum(self_us for _, self_us, _ in rows) / 1000)
+
+    cumulative_ms: Dict[str, float] = {}
+    for module, _, cumulative_us in rows:
+        package = module.split(".")[0]
+        if package != "supertokens_python":
+            cumulative_ms[package] = max(
+                cumulative_ms.get(package, 0), cumulative_us / 1000
+            )
+    heaviest = sorted(cumulative_ms.items(), key=lambda item: -item[1])[:5]
+
+    return ImportTimeResult(
+        name,
+        statistics.median(totals),
+        len(rows),
+        sum(1 for module, _, _ in rows if module.startswith("supertokens_python")),
+        heaviest,
+    )
+
+
+def print_results(
+    results: List[ImportTimeResult], baseline: Optional[Dict[str, Dict[str, Any]]]
+):
+    name_width = max([len(r.name) for r in results] + [10]) + 2
+    header = (
+        f"{'scenario':<{name_width}}{'time (ms)':>12}{'modules':>10}{'sdk modules':>14}"
+    )
+    if baseline is not None:
+        header += f"{'time vs baseline':>18}{'modules vs baseline':>21}"
+    print(header)
+    for r in results:
+        line = (
+            f"{r.name:<{name_width}}{r.total_ms:>12.1f}{r.module_count:>10}"
+            f"{r.sdk_module_count:>14}"
+        )
+        if baseline is not None:
+            previous = baseline.get(r.name)
+            if previous is None:
+                line += f"{'-':>18}{'-':>21}"
+            else:
+                change = (
+                    (r.total_ms - previous["total_ms"]) / previous["total_ms"] * 100
+                )
+                line += f"{change:>+17.1f}%"
+                line += f"{r.module_count - previous['module_count']:>+21}"
+        print(line)
+
+    print()
+    for r in results:
+        heaviest = ", ".join(f"{name} {ms:.1f}ms" for name, ms in r.heaviest)
+        print(f"{r.name}: {heaviest}")
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "--runs", type=int, default=5, help="the median of this many runs is shown"
+    )
+    parser.add_argument(
+        "-k", dest="name_filter", help="only run scenarios whose name contains this"
+    )
+    parser.add_argument("--json", dest="json_path", help="save the results here")
+    parser.add_argument(
+        "--compare", dest="baseline_path", help="results saved earlier with --json"
+    )
+    args = parser.parse_args()
+
+    results = [
+        run_scenario(name, code, args.runs)
+        for name, code in SCENARIOS.items()
+        if args.name_filter is None or args.name_filter in name
+    ]
+
+    baseline: Optional[Dict[str, Dict[str, Any]]] = None
+    if args.baseline_path:
+        with open(args.baseline_path) as f:
+            baseline = {r["name"]: r for r in json.load(f)}
+    print_results(results, baseline)
+    if args.json_path:
+        with open(args.json_path, "w") as f:
+            json.dump([r.to_json() for r in results], f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,203 @@
+# Copyright (c) 2025, VRAI Labs and/or its affiliates. All rights reserved.
+#
+# This software is licensed under the Apache License, Version 2.0 (the
+# "License") as published by the Apache Software Foundation.
+#
+# You may not use this file except in compliance with the License. You may
+# obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+"""
+Measures the per request overhead that the SuperTokens middleware adds to
+requests that are not for SuperTokens APIs, in FastAPI, Flask and Django.
+
+Each framework's app is called in-process (no HTTP server), once without the
+middleware, once with it, and once with it but with the path check in
+Supertokens.can_skip_middleware turned off, which is how every request was
+handled before that check was added.
+
+No SuperTokens core is needed. Run with:
+
+    python benchmarks/middleware_passthrough.py [iterations]
+"""
+
+import asyncio
+import os
+import sys
+import time
+from typing import Any, Callable, Dict, List, Tuple
+from unittest.mock import patch
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+os.environ.setdefault("SUPERTOKENS_ENV", "testing")
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "tests.Django.settings")
+
+from supertokens_python import (  # noqa: E402
+    InputAppInfo,
+    Supertokens,
+    SupertokensConfig,
+    init,
+)
+from supertokens_python.recipe import emailpassword, session  # noqa: E402
+from tests.utils import reset  # noqa: E402
+
+
+def init_supertokens(framework: Any, mode: Any):
+    reset()
+    init(
+        supertokens_config=SupertokensConfig("http://localhost:3567"),
+        app_info=InputAppInfo(
+            app_name="ST",
+            api_domain="http://api.supertokens.io",
+            website_domain="http://supertokens.io",
+            api_base_path="/auth",
+        ),
+        framework=framework,
+        mode=mode,
+        recipe_list=[session.init(), emailpassword.init()],
+    )
+
+
+def time_per_call(fn: Callable[[], Any], iterations: int) -> float:
+    for _ in range(min(iterations, 100)):
+        fn()
+    start = time.perf_counter()
+    for _ in range(iterations):
+        fn()
+    return (time.perf_counter() - start) / iterations * 1e6
+
+
+def bench_fastapi(iterations: int) -> Tuple[Callable[[], Any], Callable[[], Any]]:
+    from fastapi import FastAPI
+    from starlette.responses import PlainTextResponse
+    from supertokens_python.framework.fastapi import get_middleware
+
+    init_supertokens("fastapi", "asgi")
+
+    def make_app(with_middleware: bool):
+        app = FastAPI()
+
+        @app.get("/hello")
+        async def hello():  # type: ignore
+            return PlainTextResponse("hello")
+
+        if with_middleware:
+            app.add_middleware(get_middleware())
+        return app
+
+    loop = asyncio.new_event_loop()
+
+    def caller(app: Any) -> Callable[[], Any]:
+        scope: Dict[str, Any] = {
+            "type": "http",
+            "asgi": {"version": "3.0"},
+            "http_version": "1.1",
+            "method": "GET",
+            "scheme": "http",
+            "path": "/hello",
+            "raw_path": b"/hello",
+            "root_path": "",
+            "query_string": b"",
+            "headers": [(b"host", b"api.supertokens.io")],
+            "server": ("api.supertokens.io", 80),
+        }
+
+        async def receive() -> Dict[str, Any]:
+            return {"type": "http.request", "body": b"", "more_body": False}
+
+        async def send(_: Dict[str, Any]):
+            pass
+
+        async def call():
+            await app(dict(scope), receive, send)
+
+        return lambda: loop.run_until_complete(call())
+
+    return caller(make_app(False)), caller(make_app(True))
+
+
+def bench_flask(iterations: int) -> Tuple[Callable[[], Any], Callable[[], Any]]:
+    from flask import Flask
+    from supertokens_python.framework.flask import Middleware
+    from werkzeug.test import EnvironBuilder
+
+    init_supertokens("flask", "wsgi")
+
+    def make_app(with_middleware: bool):
+        app = Flask(__name__)
+
+        @app.route("/hello")
+        def hello():  # type: ignore
+            return "hello"
+
+        if with_middleware:
+            Middleware(app)
+        return app
+
+    environ = EnvironBuilder(
+        path="/hello", base_url="http://api.supertokens.io"
+    ).get_environ()
+
+    def caller(app: Any) -> Callable[[], Any]:
+        def start_response(*_: Any):
+            pass
+
+        def call():
+            for _ in app.wsgi_app(dict(environ), start_response):
+                pass
+
+        return call
+
+    return caller(make_app(False)), caller(make_app(True))
+
+
+def bench_django(iterations: int) -> Tuple[Callable[[], Any], Callable[[], Any]]:
+    import django
+    from django.http import HttpRequest, HttpResponse
+    from django.test import RequestFactory
+    from supertokens_python.framework.django import middleware
+
+    django.setup()
+    init_supertokens("django", "wsgi")
+
+    def view(_: HttpRequest):
+        return HttpResponse("hello")
+
+    request = RequestFactory().get("/hello")
+    wrapped = middleware(view)
+    return (lambda: view(request)), (lambda: wrapped(request))
+
+
+def main():
+    iterations = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+    rows: List[Tuple[str, float, float, float]] = []
+    for name, bench in [
+        ("fastapi", bench_fastapi),
+        ("flask", bench_flask),
+        ("django", bench_django),
+    ]:
+        without_middleware, with_middleware = bench(iterations)
+        base = time_per_call(without_middleware, iterations)
+        fast_path = time_per_call(with_middleware, iterations)
+        with patch.object(Supertokens, "can_skip_middleware", return_value=False):
+            full = time_per_call(with_middleware, iterations)
+        rows.append((name, base, fast_path, full))
+
+    print(f"Pass-through request overhead, {iterations} iterations (microseconds)")
+    print(
+        f"{'framework':<10}{'no middleware':>16}{'middleware':>14}{'overhead':>12}"
+        f"{'without skip':>16}{'overhead':>12}"
+    )
+    for name, base, fast_path, full in rows:
+        print(
+            f"{name:<10}{base:>16.1f}{fast_path:>14.1f}{fast_path - base:>12.1f}"
+            f"{full:>16.1f}{full - base:>12.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
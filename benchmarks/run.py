@@ -0,0 +1,72 @@
+# Copyright (c) 2025, VRAI Labs and/or its affiliates. All rights reserved.
+#
+# This software is licensed under the Apache License, Version 2.0 (the
+# "License") as published by the Apache Software Foundation.
+#
+# You may not use this file except in compliance with the License. You may
+# obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+"""
+Runs the micro-benchmarks against an in-process stub core and prints the p50
+and p99 latency and the peak allocations of each one. Run from the root of the
+repo with:
+
+    python -m benchmarks.run [--iterations N] [-k NAME] [--json OUT] [--compare BASELINE]
+
+To check a change for regressions, save the results before it with --json and
+pass that file to --compare after it.
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+
+os.environ.setdefault("SUPERTOKENS_ENV", "testing")
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "tests.Django.settings")
+
+from benchmarks import framework_benchmarks, session_benchmarks  # noqa: E402
+from benchmarks.harness import (  # noqa: E402
+    load_results,
+    print_results,
+    run_benchmarks,
+    save_results,
+)
+from benchmarks.stub_core import StubCore  # noqa: E402
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--iterations", type=int, default=2000)
+    parser.add_argument(
+        "-k", dest="name_filter", help="only run benchmarks whose name contains this"
+    )
+    parser.add_argument("--json", dest="json_path", help="save the results here")
+    parser.add_argument(
+        "--compare", dest="baseline_path", help="results saved earlier with --json"
+    )
+    args = parser.parse_args()
+
+    core = StubCore()
+    core.start()
+    try:
+        benchmarks = session_benchmarks.get_benchmarks(
+            core
+        ) + framework_benchmarks.get_benchmarks(core)
+        results = run_benchmarks(benchmarks, args.iterations, args.name_filter)
+    finally:
+        core.stop()
+
+    baseline = load_results(args.baseline_path) if args.baseline_path else None
+    print_results(results, baseline)
+    if args.json_path:
+        save_results(results, args.json_path)
+
+
+if __name__ == "__main__":
+    main()
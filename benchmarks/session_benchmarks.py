@@ -0,0 +1,200 @@
+# Copyright (c) 2025, VRAI Labs and/or its affiliates. All rights reserved.
+#
+# This software is licensed under the Apache License, Version 2.0 (the
+# "License") as published by the Apache Software Foundation.
+#
+# You may not use this file except in compliance with the License. You may
+# obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+"""
+Benchmarks of the session functions and the Querier, called directly (not
+through a framework's middleware). The requests are starlette requests, which
+is the cheapest request type to build.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+from benchmarks.harness import Benchmark, run_sync
+from benchmarks.stub_core import STUB_CORE_URL, StubCore
+from starlette.requests import Request
+from supertokens_python import InputAppInfo, SupertokensConfig, init
+from supertokens_python.normalised_url_path import NormalisedURLPath
+from supertokens_python.querier import Querier
+from supertokens_python.recipe import session
+from supertokens_python.recipe.session.asyncio import (
+    create_new_session,
+    get_session,
+    refresh_session,
+)
+from supertokens_python.recipe.session.claims import BooleanClaim
+from supertokens_python.types import RecipeUserId
+from tests.utils import reset
+
+BenchClaim = BooleanClaim("bench-claim", fetch_value=lambda *_: True)  # type: ignore
+
+
+def init_supertokens(framework: str = "fastapi", mode: Any = "asgi"):
+    reset()
+    init(
+        supertokens_config=SupertokensConfig(STUB_CORE_URL),
+        app_info=InputAppInfo(
+            app_name="ST",
+            api_domain="http://api.supertokens.io",
+            website_domain="http://supertokens.io",
+            api_base_path="/auth",
+        ),
+        framework=framework,  # type: ignore
+        mode=mode,
+        recipe_list=[session.init()],
+    )
+
+
+def make_request(
+    method: str = "GET",
+    path: str = "/",
+    headers: Optional[List[Tuple[str, str]]] = None,
+) -> Request:
+    scope: Dict[str, Any] = {
+        "type": "http",
+        "method": method,
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "root_path": "",
+        "query_string": b"",
+        "headers": [(b"host", b"api.supertokens.io")]
+        + [(k.lower().encode(), v.encode()) for k, v in headers or []],
+        "server": ("api.supertokens.io", 80),
+    }
+    return Request(scope)
+
+
+def token_headers(transfer_method: str, access_token: str) -> List[Tuple[str, str]]:
+    if transfer_method == "cookie":
+        return [("cookie", f"sAccessToken={access_token}")]
+    return [("authorization", f"Bearer {access_token}")]
+
+
+def get_session_benchmark(
+    core: StubCore,
+    transfer_method: str,
+    version: int,
+    check_database: bool = False,
+    with_claim: bool = False,
+) -> Benchmark:
+    name = f"get_session[{transfer_method},v{version}]"
+    if check_database:
+        name = f"get_session[{transfer_method},v{version},check_database]"
+    if with_claim:
+        name = f"validate_claims[{transfer_method},v{version}]"
+
+    def setup():
+        init_supertokens()
+        loop = asyncio.new_event_loop()
+        payload: Dict[str, Any] = {}
+        if with_claim:
+            payload = {
+                BenchClaim.key: {"v": True, "t": int(time.time() * 1000)},
+            }
+        access_token = core.create_access_token(version, payload=payload)
+
+        def override_claim_validators(*_: Any):
+            return [BenchClaim.validators.is_true(max_age=3600)]
+
+        async def call():
+            request = make_request(headers=token_headers(transfer_method, access_token))
+            s = await get_session(
+                request,
+                check_database=check_database,
+                override_global_claim_validators=(
+                    override_claim_validators if with_claim else None
+                ),
+            )
+            assert s is not None
+
+        return run_sync(loop, call)
+
+    return Benchmark(name, setup)
+
+
+def create_new_session_benchmark() -> Benchmark:
+    def setup():
+        init_supertokens()
+        loop = asyncio.new_event_loop()
+
+        async def call():
+            await create_new_session(make_request(), "public", RecipeUserId("userId"))
+
+        return run_sync(loop, call)
+
+    return Benchmark("create_new_session", setup)
+
+
+def refresh_session_benchmark() -> Benchmark:
+    def setup():
+        init_supertokens()
+        loop = asyncio.new_event_loop()
+
+        async def call():
+            request = make_request(
+                "POST",
+                "/auth/session/refresh",
+                [("cookie", "sRefreshToken=refresh-token")],
+            )
+            await refresh_session(request)
+
+        return run_sync(loop, call)
+
+    return Benchmark("refresh_session", setup)
+
+
+def querier_benchmarks() -> List[Benchmark]:
+    def setup_get():
+        init_supertokens()
+        loop = asyncio.new_event_loop()
+        querier = Querier.get_instance()
+        path = NormalisedURLPath("/recipe/user/metadata")
+
+        async def call():
+            # A new user context each time, so the per request cache is not used
+            await querier.send_get_request(path, {"userId": "userId"}, {})
+
+        return run_sync(loop, call)
+
+    def setup_post():
+        init_supertokens()
+        loop = asyncio.new_event_loop()
+        querier = Querier.get_instance()
+        path = NormalisedURLPath("/recipe/session/refresh")
+
+        async def call():
+            await querier.send_post_request(path, {"refreshToken": "refresh-token"}, {})
+
+        return run_sync(loop, call)
+
+    return [
+        Benchmark("querier[GET]", setup_get),
+        Benchmark("querier[POST]", setup_post),
+    ]
+
+
+def get_benchmarks(core: StubCore) -> List[Benchmark]:
+    benchmarks: List[Benchmark] = []
+    for transfer_method in ["cookie", "header"]:
+        for version in [2, 3, 4, 5]:
+            benchmarks.append(get_session_benchmark(core, transfer_method, version))
+    benchmarks.append(get_session_benchmark(core, "cookie", 5, check_database=True))
+    benchmarks.append(get_session_benchmark(core, "cookie", 5, with_claim=True))
+    benchmarks.append(create_new_session_benchmark())
+    benchmarks.append(refresh_session_benchmark())
+    benchmarks.extend(querier_benchmarks())
+    return benchmarks
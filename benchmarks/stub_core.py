@@ -0,0 +1,234 @@
+# Copyright (c) 2025, VRAI Labs and/or its affiliates. All rights reserved.
+#
+# This software is licensed under the Apache License, Version 2.0 (the
+# "License") as published by the Apache Software Foundation.
+#
+# You may not use this file except in compliance with the License. You may
+# obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+"""
+An in-process stand-in for the SuperTokens core, for benchmarks. Requests to
+STUB_CORE_URL are answered by respx (no sockets are opened), so the benchmarks
+measure the SDK and httpx, not the network or the core.
+
+Only the APIs used by the benchmarks are implemented. Any other request fails
+with a 404 that names the path, so that it is easy to see what is missing.
+"""
+
+from __future__ import annotations
+
+import json
+import time
+import uuid
+from base64 import b64encode
+from typing import Any, Dict, Optional
+
+import httpx
+import jwt
+import respx
+from cryptography.hazmat.primitives import hashes
+from cryptography.hazmat.primitives.asymmetric import padding, rsa
+from jwt.algorithms import RSAAlgorithm
+
+STUB_CORE_URL = "http://localhost:3567"
+
+KID = "d-1700000000000"
+
+
+class StubCore:
+    def __init__(self):
+        self.private_key = rsa.generate_private_key(
+            public_exponent=65537, key_size=2048
+        )
+        jwk = json.loads(RSAAlgorithm.to_jwk(self.private_key.public_key()))
+        jwk.update({"kid": KID, "alg": "RS256", "use": "sig"})
+        self.jwks = {"keys": [jwk]}
+        self.router = respx.MockRouter(base_url=STUB_CORE_URL, assert_all_called=False)
+        self._add_routes()
+
+    def start(self):
+        self.router.start()
+
+    def stop(self):
+        self.router.stop()
+
+    def create_access_token(
+        self,
+        version: int,
+        session_handle: Optional[str] = None,
+        user_id: str = "userId",
+        payload: Optional[Dict[str, Any]] = None,
+    ) -> str:
+        now = int(time.time())
+        session_handle = session_handle or str(uuid.uuid4())
+        if version == 2:
+            return self._create_v2_access_token(session_handle, user_id, payload)
+
+        claims: Dict[str, Any] = {
+            **(payload or {}),
+            "sub": user_id,
+            "exp": now + 3600,
+            "iat": now,
+            "sessionHandle": session_handle,
+            "refreshTokenHash1": "refresh-token-hash",
+            "parentRefreshTokenHash1": None,
+            "antiCsrfToken": None,
+        }
+        if version >= 4:
+            claims["tId"] = "public"
+        if version >= 5:
+            claims["rsub"] = user_id
+        return jwt.encode(
+            claims,
+            self.private_key,
+            algorithm="RS256",
+            headers={"kid": KID, "version": str(version)},
+        )
+
+    def _create_v2_access_token(
+        self,
+        session_handle: str,
+        user_id: str,
+        payload: Optional[Dict[str, Any]],
+    ) -> str:
+        now_ms = int(time.time() * 1000)
+        header = b64encode(
+            json.dumps(
+                {"alg": "RS256", "typ": "JWT", "version": "2"},
+                separators=(",", ":"),
+                sort_keys=True,
+            ).encode()
+        ).decode()
+        body = b64encode(
+            json.dumps(
+                {
+                    "sessionHandle": session_handle,
+                    "userId": user_id,
+                    "refreshTokenHash1": "refresh-token-hash",
+                    "parentRefreshTokenHash1": None,
+                    "userData": payload or {},
+                    "antiCsrfToken": None,
+                    "expiryTime": now_ms + 3600 * 1000,
+                    "timeCreated": now_ms,
+                    "lmrt": now_ms,
+                }
+            ).encode()
+        ).decode()
+        signature = self.private_key.sign(
+            f"{header}.{body}".encode(), padding.PKCS1v15(), hashes.SHA256()
+        )
+        return f"{header}.{body}.{b64encode(signature).decode()}"
+
+    def _session_response(
+        self, user_id: str, access_token_payload: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        now_ms = int(time.time() * 1000)
+        session_handle = str(uuid.uuid4())
+        return {
+            "status": "OK",
+            "session": {
+                "handle": session_handle,
+                "userId": user_id,
+                "recipeUserId": user_id,
+                "userDataInJWT": access_token_payload,
+                "tenantId": "public",
+            },
+            "accessToken": {
+                "token": self.create_access_token(
+                    5, session_handle, user_id, access_token_payload
+                ),
+                "expiry": now_ms + 3600 * 1000,
+                "createdTime": now_ms,
+            },
+            "refreshToken": {
+                "token": str(uuid.uuid4()),
+                "expiry": now_ms + 100 * 24 * 3600 * 1000,
+                "createdTime": now_ms,
+            },
+        }
+
+    def _add_routes(self):
+        router = self.router
+
+        router.get("/apiversion").mock(httpx.Response(200, json={"versions": ["5.2"]}))
+        router.get("/.well-known/jwks.json").mock(
+            side_effect=lambda _: httpx.Response(200, json=self.jwks)
+        )
+
+        def create_session(request: httpx.Request) -> httpx.Response:
+            body = json.loads(request.content)
+            return httpx.Response(
+                200, json=self._session_response(body["userId"], body["userDataInJWT"])
+            )
+
+        router.post(url__regex=r".*/recipe/session$").mock(side_effect=create_session)
+        router.post("/recipe/session/refresh").mock(
+            side_effect=lambda _: httpx.Response(
+                200, json=self._session_response("userId", {})
+            )
+        )
+
+        def verify_session(request: httpx.Request) -> httpx.Response:
+            body = json.loads(request.content)
+            payload = jwt.decode(
+                body["accessToken"], options={"verify_signature": False}
+            )
+            return httpx.Response(
+                200,
+                json={
+                    "status": "OK",
+                    "session": {
+                        "handle": payload["sessionHandle"],
+                        "userId": payload["sub"],
+                        "recipeUserId": payload["sub"],
+                        "userDataInJWT": payload,
+                        "tenantId": "public",
+                    },
+                },
+            )
+
+        router.post("/recipe/session/verify").mock(side_effect=verify_session)
+
+        def get_user(request: httpx.Request) -> httpx.Response:
+            user_id = request.url.params["userId"]
+            time_joined = 1700000000000
+            return httpx.Response(
+                200,
+                json={
+                    "status": "OK",
+                    "user": {
+                        "id": user_id,
+                        "isPrimaryUser": False,
+                        "tenantIds": ["public"],
+                        "emails": ["user@example.com"],
+                        "phoneNumbers": [],
+                        "thirdParty": [],
+                        "timeJoined": time_joined,
+                        "loginMethods": [
+                            {
+                                "recipeId": "emailpassword",
+                                "recipeUserId": user_id,
+                                "tenantIds": ["public"],
+                                "email": "user@example.com",
+                                "timeJoined": time_joined,
+                                "verified": True,
+                            }
+                        ],
+                    },
+                },
+            )
+
+        router.get("/user/id").mock(side_effect=get_user)
+        router.get("/recipe/user/metadata").mock(
+            httpx.Response(200, json={"status": "OK", "metadata": {}})
+        )
+        router.route().mock(
+            side_effect=lambda request: httpx.Response(
+                404, text=f"Not implemented by the stub core: {request.url.path}"
+            )
+        )
@@ -9,6 +9,10 @@ with open(path.join(here, "README.md"), mode="r", encoding="utf-8") as f:
     long_description = f.read()
 
 extras_require = {
+    "http2": (["httpx[http2]>=0.15.0,<1.0.0"]),
+    # faster JSON encoding and decoding, see supertokens_python/json_backend.py
+    "orjson": (["orjson>=3.6.0"]),
+    "ujson": (["ujson>=5.4.0"]),
     # we want to fix the versions of the libraries that
     # we use to develop the SDK with otherwise we get
     # a bunch of type errors on make dev-install depending
@@ -20,6 +20,9 @@ from supertokens_python.framework.request import BaseRequest
 from supertokens_python.types import RecipeUserId
 
 from . import supertokens
+from .core_concurrency_limiter import CoreConcurrencyLimiterStats
+from .core_host_health import CoreHostStats
+from .querier import Querier
 from .recipe_module import RecipeModule
 
 InputAppInfo = supertokens.InputAppInfo
@@ -46,6 +49,21 @@ def get_all_cors_headers() -> List[str]:
     return supertokens.Supertokens.get_instance().get_all_cors_headers()
 
 
+def get_core_host_stats() -> List[CoreHostStats]:
+    """
+    Returns the health of each host in connection_uri, for monitoring.
+    """
+    return Querier.get_host_stats()
+
+
+def get_core_concurrency_limiter_stats() -> Optional[CoreConcurrencyLimiterStats]:
+    """
+    Returns the state of the limit on concurrent requests to the core (see
+    core_concurrency_limiter in SupertokensConfig), for monitoring.
+    """
+    return Querier.get_concurrency_limiter_stats()
+
+
 def get_request_from_user_context(
     user_context: Optional[Dict[str, Any]],
 ) -> Optional[BaseRequest]:
@@ -13,8 +13,10 @@
 # under the License.
 
 import asyncio
+import contextvars
+import threading
 from os import getenv
-from typing import Any, Coroutine, TypeVar
+from typing import Any, Coroutine, Optional, TypeVar
 
 _T = TypeVar("_T")
 
@@ -23,6 +25,87 @@ def nest_asyncio_enabled():
     return getenv("SUPERTOKENS_NEST_ASYNCIO", "") == "1"
 
 
+def background_event_loop_enabled():
+    return getenv("SUPERTOKENS_BACKGROUND_EVENT_LOOP", "") == "1"
+
+
+async def _run_in_context(ctx: contextvars.Context, co: Coroutine[Any, Any, _T]) -> _T:
+    # The task runs in a copy of the loop thread's context. Setting the
+    # caller's context variables in it makes things like Flask's request
+    # proxy work as they would on the caller's thread.
+    for var, value in ctx.items():
+        var.set(value)
+    return await co
+
+
+class BackgroundEventLoop:
+    """
+    An event loop that runs forever in a daemon thread. Coroutines submitted
+    with run are executed on it, and the calling thread blocks until they
+    complete. Because every sync caller shares the same loop, they also share
+    everything that is bound to it, like the pooled HTTP clients, the JWKS
+    cache refresh and in-flight request de-duplication.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+
+    def _get_loop(self) -> asyncio.AbstractEventLoop:
+        with self._lock:
+            if self._loop is not None:
+                return self._loop
+
+            loop = asyncio.new_event_loop()
+            ready = threading.Event()
+
+            def run():
+                asyncio.set_event_loop(loop)
+                loop.call_soon(ready.set)
+                loop.run_forever()
+
+            thread = threading.Thread(
+                target=run, name="supertokens-event-loop", daemon=True
+            )
+            thread.start()
+            ready.wait()
+            self._loop = loop
+            self._thread = thread
+            return loop
+
+    def run(self, co: Coroutine[Any, Any, _T]) -> _T:
+        loop = self._get_loop()
+        if threading.current_thread() is self._thread:
+            co.close()
+            raise Exception(
+                "sync was called from code running on the background event loop. "
+                "Use the asyncio functions instead."
+            )
+        future = asyncio.run_coroutine_threadsafe(
+            _run_in_context(contextvars.copy_context(), co), loop
+        )
+        return future.result()
+
+    def stop(self):
+        with self._lock:
+            loop, thread = self._loop, self._thread
+            self._loop = None
+            self._thread = None
+        if loop is None or thread is None:
+            return
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join()
+        loop.close()
+
+
+_background_event_loop = BackgroundEventLoop()
+
+
+def get_background_event_loop() -> BackgroundEventLoop:
+    return _background_event_loop
+
+
 def create_or_get_event_loop() -> asyncio.AbstractEventLoop:
     try:
         return asyncio.get_event_loop()
@@ -41,5 +124,7 @@ def create_or_get_event_loop() -> asyncio.AbstractEventLoop:
 
 
 def sync(co: Coroutine[Any, Any, _T]) -> _T:
+    if background_event_loop_enabled():
+        return _background_event_loop.run(co)
     loop = create_or_get_event_loop()
     return loop.run_until_complete(co)
@@ -171,3 +171,30 @@ async def list_users_by_account_info(
         do_union_of_account_info,
         user_context,
     )
+
+
+async def close_connection_pools() -> None:
+    from supertokens_python.ingredients.emaildelivery.services.smtp import (
+        close_smtp_connections,
+    )
+    from supertokens_python.querier import Querier
+    from supertokens_python.recipe.thirdparty.providers.http_client import (
+        close_provider_http_client,
+    )
+
+    await Querier.close_http_client()
+    await close_provider_http_client()
+    await close_smtp_connections()
+
+
+async def flush_delivery_queues(timeout_sec: Optional[float] = None) -> bool:
+    """
+    Waits for the emails and SMSs queued by QueuedEmailDeliveryService and
+    QueuedSMSDeliveryService to be sent. Call this during a graceful shutdown.
+    Returns False if they were not all sent within timeout_sec.
+    """
+    from supertokens_python.ingredients.delivery_queue import (
+        flush_delivery_queues as flush_queues,
+    )
+
+    return await flush_queues(timeout_sec)
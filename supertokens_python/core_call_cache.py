@@ -0,0 +1,274 @@
+# Copyright (c) 2025, VRAI Labs and/or its affiliates. All rights reserved.
+#
+# This software is licensed under the Apache License, Version 2.0 (the
+# "License") as published by the Apache Software Foundation.
+#
+# You may not use this file except in compliance with the License. You may
+# obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+from __future__ import annotations
+
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional
+
+from .single_flight import SingleFlight
+
+if TYPE_CHECKING:
+    from httpx import Response
+
+
+class CoreCallCachePolicy:
+    """
+    Describes which GET requests to the core may be shared across requests.
+
+    - path_prefix: GET requests whose path (ignoring a leading tenant id) starts
+      with this are cached for ttl_sec.
+    - invalidated_by: a POST, PUT or DELETE to a path starting with any of these
+      prefixes drops the cached responses of this policy.
+    - key_param: if set, only the cached responses whose query param of this
+      name matches the value sent in the write are dropped (for example, only
+      the metadata of the user that was updated).
+    """
+
+    def __init__(
+        self,
+        path_prefix: str,
+        ttl_sec: float,
+        invalidated_by: List[str],
+        key_param: Optional[str] = None,
+    ):
+        self.path_prefix = path_prefix
+        self.ttl_sec = ttl_sec
+        self.invalidated_by = invalidated_by
+        self.key_param = key_param
+
+
+# Tenant configs and the permissions of a role are not covered, as the
+# multitenancy and user roles recipes have their own caches for them (see
+# tenant_config_cache_ttl_sec and role_permissions_cache_ttl_sec)
+DEFAULT_CORE_CALL_CACHE_POLICIES: List[CoreCallCachePolicy] = [
+    CoreCallCachePolicy(
+        "/recipe/permission/roles",
+        ttl_sec=60,
+        invalidated_by=["/recipe/role"],
+    ),
+    CoreCallCachePolicy(
+        "/recipe/roles",
+        ttl_sec=60,
+        invalidated_by=["/recipe/role"],
+    ),
+    CoreCallCachePolicy(
+        "/recipe/user/metadata",
+        ttl_sec=60,
+        invalidated_by=["/recipe/user/metadata", "/user/remove"],
+        key_param="userId",
+    ),
+]
+
+
+class CoreCallCacheInvalidationChannel(ABC):
+    """
+    Carries invalidations between processes that each have their own shared
+    core call cache, for example over Redis pub/sub. Only the write path and
+    the values of the policies' key_params are published, never the full
+    request body.
+    """
+
+    @abstractmethod
+    def publish(self, write_path: str, key_params: Dict[str, Any]) -> None:
+        pass
+
+    @abstractmethod
+    def subscribe(self, callback: Callable[[str, Dict[str, Any]], None]) -> None:
+        pass
+
+
+class LocalInvalidationChannel(CoreCallCacheInvalidationChannel):
+    """
+    An in-process stand-in for an external invalidation channel, useful for
+    tests and for running several caches in one process.
+    """
+
+    def __init__(self):
+        self.subscribers: List[Callable[[str, Dict[str, Any]], None]] = []
+
+    def publish(self, write_path: str, key_params: Dict[str, Any]) -> None:
+        for subscriber in list(self.subscribers):
+            subscriber(write_path, key_params)
+
+    def subscribe(self, callback: Callable[[str, Dict[str, Any]], None]) -> None:
+        self.subscribers.append(callback)
+
+
+class SharedCoreCallCacheConfig:
+    def __init__(
+        self,
+        policies: Optional[List[CoreCallCachePolicy]] = None,
+        max_entries: int = 10000,
+        invalidation_channel: Optional[CoreCallCacheInvalidationChannel] = None,
+    ):
+        self.policies = (
+            policies if policies is not None else DEFAULT_CORE_CALL_CACHE_POLICIES
+        )
+        self.max_entries = max_entries
+        self.invalidation_channel = invalidation_channel
+
+
+def strip_tenant_id(path: str) -> str:
+    # Tenant specific core APIs are called as /<tenant id>/recipe/...
+    if path.startswith("/recipe/"):
+        return path
+    second_slash = path.find("/", 1)
+    if second_slash != -1 and path.startswith("/recipe/", second_slash):
+        return path[second_slash:]
+    return path
+
+
+class _CacheEntry:
+    def __init__(
+        self,
+        policy: CoreCallCachePolicy,
+        params: Dict[str, Any],
+        response: Response,
+        expires_at: float,
+    ):
+        self.policy = policy
+        self.params = params
+        self.response = response
+        self.expires_at = expires_at
+
+
+class SharedCoreCallCache:
+    """
+    A process wide cache of successful GET responses from the core, shared by
+    all requests. Unlike the per request cache in the user_context, a write to
+    the core only drops the entries it can affect.
+    """
+
+    def __init__(self, config: SharedCoreCallCacheConfig):
+        self.config = config
+        self._entries: OrderedDict[str, _CacheEntry] = OrderedDict()
+        # Incremented by every write that drops entries. A GET response is
+        # only stored if no such write happened while it was being fetched,
+        # since the core may have produced it before the write.
+        self._generation = 0
+        self._lock = threading.Lock()
+        if config.invalidation_channel is not None:
+            config.invalidation_channel.subscribe(self.invalidate)
+
+    def get_policy(self, path: str) -> Optional[CoreCallCachePolicy]:
+        path = strip_tenant_id(path)
+        for policy in self.config.policies:
+            if path.startswith(policy.path_prefix):
+                return policy
+        return None
+
+    def get(self, unique_key: str) -> Optional[Response]:
+        with self._lock:
+            entry = self._entries.get(unique_key)
+            if entry is None:
+                return None
+            if entry.expires_at <= time.monotonic():
+                del self._entries[unique_key]
+                return None
+            self._entries.move_to_end(unique_key)
+            return entry.response
+
+    def get_generation(self) -> int:
+        """
+        To be read before sending the GET request whose response is passed to
+        set.
+        """
+        with self._lock:
+            return self._generation
+
+    def set(
+        self,
+        unique_key: str,
+        path: str,
+        params: Dict[str, Any],
+        response: Response,
+        generation: int,
+    ):
+        policy = self.get_policy(path)
+        if policy is None:
+            return
+        with self._lock:
+            if generation != self._generation:
+                return
+            self._entries[unique_key] = _CacheEntry(
+                policy, params, response, time.monotonic() + policy.ttl_sec
+            )
+            self._entries.move_to_end(unique_key)
+            while len(self._entries) > self.config.max_entries:
+                self._entries.popitem(last=False)
+
+    def on_write(self, path: str, data: Dict[str, Any]):
+        """
+        Called for every POST, PUT and DELETE request to the core. data is the
+        request body and query params combined.
+        """
+        write_path = strip_tenant_id(path)
+        key_params: Dict[str, Any] = {}
+        for policy in self.config.policies:
+            if policy.key_param is not None and policy.key_param in data:
+                key_params[policy.key_param] = data[policy.key_param]
+
+        self.invalidate(write_path, key_params)
+        if self.config.invalidation_channel is not None:
+            self.config.invalidation_channel.publish(write_path, key_params)
+
+    def invalidate(self, write_path: str, key_params: Dict[str, Any]):
+        affected_policies = [
+            policy
+            for policy in self.config.policies
+            if any(write_path.startswith(prefix) for prefix in policy.invalidated_by)
+        ]
+        if len(affected_policies) == 0:
+            return
+
+        with self._lock:
+            self._generation += 1
+            for unique_key, entry in list(self._entries.items()):
+                if entry.policy not in affected_policies:
+                    continue
+                key_param = entry.policy.key_param
+                if (
+                    key_param is not None
+                    and key_param in key_params
+                    and str(entry.params.get(key_param)) != str(key_params[key_param])
+                ):
+                    continue
+                del self._entries[unique_key]
+
+    def clear(self):
+        with self._lock:
+            self._generation += 1
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class CoreCallSingleFlight(SingleFlight["Response"]):
+    """
+    Lets concurrent identical GET requests to the core share a single round
+    trip: a request whose unique key matches one that is already in flight
+    waits for that request's response instead of sending its own.
+    """
+
+    def on_write(self):
+        """
+        Called after every POST, PUT and DELETE request to the core, so that
+        GET requests sent after a write never get a response that the core
+        may have produced before it.
+        """
+        self.forget()
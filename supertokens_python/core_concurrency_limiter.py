@@ -0,0 +1,273 @@
+# Copyright (c) 2025, VRAI Labs and/or its affiliates. All rights reserved.
+#
+# This software is licensed under the Apache License, Version 2.0 (the
+# "License") as published by the Apache Software Foundation.
+#
+# You may not use this file except in compliance with the License. You may
+# obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+from __future__ import annotations
+
+import asyncio
+import random
+import threading
+import time
+from collections import deque
+from email.utils import parsedate_to_datetime
+from typing import Any, Deque, Dict, Optional
+
+from .exceptions import GeneralError
+
+# A rate limited request to the core is not retried if the core asks for a
+# longer wait than this
+MAX_RETRY_AFTER_SEC = 5.0
+
+
+class CoreOverloadedError(GeneralError):
+    """
+    Raised instead of sending a request to the core when too many requests
+    are already waiting for one of the limited slots.
+    """
+
+
+class CoreConcurrencyLimiterConfig:
+    """
+    Limits the number of requests to the core that are in flight at once.
+    The limit adapts to the core: it grows by about one for every `limit` requests
+    that succeed, and is multiplied by backoff_ratio when the core rate limits
+    a request (AIMD).
+
+    - initial_limit, min_limit and max_limit: bounds of the adaptive limit.
+    - max_queue_size: requests beyond the limit wait in a queue of this size;
+      once it is full, requests fail immediately with CoreOverloadedError.
+    - max_queue_wait_sec: a request that waited this long for a slot fails
+      with CoreOverloadedError.
+    """
+
+    def __init__(
+        self,
+        initial_limit: int = 50,
+        min_limit: int = 1,
+        max_limit: int = 500,
+        backoff_ratio: float = 0.5,
+        max_queue_size: int = 1000,
+        max_queue_wait_sec: float = 5.0,
+    ):
+        if not 1 <= min_limit <= initial_limit <= max_limit:
+            raise ValueError(
+                "min_limit, initial_limit and max_limit must satisfy 1 <= min_limit <= initial_limit <= max_limit"
+            )
+        if not 0 < backoff_ratio < 1:
+            raise ValueError("backoff_ratio must be in (0, 1)")
+        if max_queue_size < 0:
+            raise ValueError("max_queue_size must be a positive number")
+        if max_queue_wait_sec < 0:
+            raise ValueError("max_queue_wait_sec must be a positive number")
+        self.initial_limit = initial_limit
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.backoff_ratio = backoff_ratio
+        self.max_queue_size = max_queue_size
+        self.max_queue_wait_sec = max_queue_wait_sec
+
+
+class CoreConcurrencyLimiterStats:
+    def __init__(
+        self,
+        limit: int,
+        in_flight: int,
+        queue_depth: int,
+        waited_count: int,
+        rejected_count: int,
+        mean_wait_ms: float,
+        max_wait_ms: float,
+    ):
+        self.limit = limit
+        self.in_flight = in_flight
+        self.queue_depth = queue_depth
+        # Requests that had to wait for a slot
+        self.waited_count = waited_count
+        # Requests that failed because the queue was full or they waited for
+        # too long
+        self.rejected_count = rejected_count
+        # Over the requests that had to wait
+        self.mean_wait_ms = mean_wait_ms
+        self.max_wait_ms = max_wait_ms
+
+    def to_json(self) -> Dict[str, Any]:
+        return {
+            "limit": self.limit,
+            "inFlight": self.in_flight,
+            "queueDepth": self.queue_depth,
+            "waitedCount": self.waited_count,
+            "rejectedCount": self.rejected_count,
+            "meanWaitMs": self.mean_wait_ms,
+            "maxWaitMs": self.max_wait_ms,
+        }
+
+
+class _Waiter:
+    def __init__(self, loop: asyncio.AbstractEventLoop):
+        self.loop = loop
+        self.future: "asyncio.Future[None]" = loop.create_future()
+        # Set (under the lock) when a slot has been handed to this waiter
+        self.granted = False
+
+
+def _wake(future: "asyncio.Future[None]"):
+    if not future.done():
+        future.set_result(None)
+
+
+class CoreConcurrencyLimiter:
+    """
+    The state is shared by all threads and event loops of the process; each
+    waiter is woken up on its own loop.
+    """
+
+    def __init__(self, config: CoreConcurrencyLimiterConfig):
+        self.config = config
+        self.limit = float(config.initial_limit)
+        self.in_flight = 0
+        self.waiters: Deque[_Waiter] = deque()
+        # Incremented every time the limit is decreased. A rate limited
+        # request that was sent before the last decrease does not decrease it
+        # again, so that a burst of 429s only halves the limit once.
+        self.epoch = 0
+        self.waited_count = 0
+        self.rejected_count = 0
+        self.total_wait_ms = 0.0
+        self.max_wait_ms = 0.0
+        self.lock = threading.Lock()
+
+    async def acquire(self) -> int:
+        """
+        Waits for a slot, and returns the epoch to pass to release.
+        """
+        loop = asyncio.get_running_loop()
+        with self.lock:
+            if self.in_flight < int(self.limit) and len(self.waiters) == 0:
+                self.in_flight += 1
+                return self.epoch
+            if len(self.waiters) >= self.config.max_queue_size:
+                self.rejected_count += 1
+                raise CoreOverloadedError(
+                    "Too many requests to the SuperTokens core are waiting to be sent"
+                )
+            waiter = _Waiter(loop)
+            self.waiters.append(waiter)
+
+        start = time.monotonic()
+        try:
+            await asyncio.wait_for(
+                waiter.future, timeout=self.config.max_queue_wait_sec
+            )
+        except asyncio.TimeoutError:
+            # A slot may have been handed over just as the wait timed out, in
+            # which case it is used
+            if not self._abandon(waiter):
+                with self.lock:
+                    self.rejected_count += 1
+                raise CoreOverloadedError(
+                    "Timed out waiting to send a request to the SuperTokens core"
+                )
+        except BaseException:
+            if self._abandon(waiter):
+                with self.lock:
+                    self.in_flight -= 1
+                    self._grant_slots()
+            raise
+
+        wait_ms = (time.monotonic() - start) * 1000
+        with self.lock:
+            self.waited_count += 1
+            self.total_wait_ms += wait_ms
+            self.max_wait_ms = max(self.max_wait_ms, wait_ms)
+            return self.epoch
+
+    def release(self, epoch: int, rate_limited: Optional[bool]):
+        """
+        rate_limited is None if the request failed without a response, in
+        which case the limit is left as it is.
+        """
+        with self.lock:
+            self.in_flight -= 1
+            if rate_limited is None:
+                pass
+            elif rate_limited:
+                if epoch == self.epoch:
+                    self.epoch += 1
+                    self.limit = max(
+                        float(self.config.min_limit),
+                        self.limit * self.config.backoff_ratio,
+                    )
+            else:
+                self.limit = min(
+                    float(self.config.max_limit), self.limit + 1 / self.limit
+                )
+            self._grant_slots()
+
+    def get_stats(self) -> CoreConcurrencyLimiterStats:
+        with self.lock:
+            return CoreConcurrencyLimiterStats(
+                int(self.limit),
+                self.in_flight,
+                len(self.waiters),
+                self.waited_count,
+                self.rejected_count,
+                self.total_wait_ms / self.waited_count
+                if self.waited_count > 0
+                else 0.0,
+                self.max_wait_ms,
+            )
+
+    def _grant_slots(self):
+        while len(self.waiters) > 0 and self.in_flight < int(self.limit):
+            waiter = self.waiters.popleft()
+            waiter.granted = True
+            self.in_flight += 1
+            waiter.loop.call_soon_threadsafe(_wake, waiter.future)
+
+    def _abandon(self, waiter: _Waiter) -> bool:
+        """
+        Removes a waiter that stopped waiting from the queue. Returns whether
+        it had been given a slot already.
+        """
+        with self.lock:
+            if not waiter.granted:
+                self.waiters.remove(waiter)
+                return False
+        return True
+
+
+def get_retry_after_sec(retry_after: Optional[str]) -> Optional[float]:
+    """
+    Parses a Retry-After header, which is either a number of seconds or an
+    HTTP date.
+    """
+    if retry_after is None:
+        return None
+    try:
+        return max(float(retry_after), 0)
+    except ValueError:
+        pass
+    try:
+        return max(parsedate_to_datetime(retry_after).timestamp() - time.time(), 0)
+    except (TypeError, ValueError):
+        return None
+
+
+def get_backoff_sec(
+    attempts_made: int, base_sec: float = 0.05, max_sec: float = 2.0
+) -> float:
+    """
+    Exponential backoff with jitter, so that requests that were rate limited
+    together are not retried together.
+    """
+    backoff = min(max_sec, base_sec * (2**attempts_made))
+    return backoff / 2 + random.uniform(0, backoff / 2)
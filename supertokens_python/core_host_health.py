@@ -0,0 +1,256 @@
+# Copyright (c) 2025, VRAI Labs and/or its affiliates. All rights reserved.
+#
+# This software is licensed under the Apache License, Version 2.0 (the
+# "License") as published by the Apache Software Foundation.
+#
+# You may not use this file except in compliance with the License. You may
+# obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+from __future__ import annotations
+
+import random
+import threading
+import time
+from typing import Any, Dict, List, Optional
+
+from typing_extensions import Literal
+
+HostSelectionStrategy = Literal["round_robin", "least_latency", "power_of_two_choices"]
+
+
+class CoreHostSelectionConfig:
+    """
+    Configures how a core host is picked for each request when
+    connection_uri lists several hosts.
+
+    - strategy: round_robin sends requests to each host in turn,
+      least_latency to the host with the lowest average latency, and
+      power_of_two_choices to the faster of two randomly picked hosts (which
+      spreads load better than least_latency when many processes share the
+      hosts).
+    - failure_threshold: after this many consecutive failures (connection
+      errors, timeouts or 5xx responses) a host's circuit opens and it is
+      skipped, unless every host is failing.
+    - open_duration_sec: how long a circuit stays open. After that, a single
+      request is let through to probe the host; the circuit closes if it
+      succeeds and opens again if it fails.
+    - latency_ewma_alpha: the weight of the latest request in the
+      exponentially weighted average of a host's latency.
+    """
+
+    def __init__(
+        self,
+        strategy: HostSelectionStrategy = "round_robin",
+        failure_threshold: int = 5,
+        open_duration_sec: float = 10.0,
+        latency_ewma_alpha: float = 0.2,
+    ):
+        if failure_threshold < 1:
+            raise ValueError("failure_threshold must be at least 1")
+        if open_duration_sec < 0:
+            raise ValueError("open_duration_sec must be a positive number")
+        if not 0 < latency_ewma_alpha <= 1:
+            raise ValueError("latency_ewma_alpha must be in (0, 1]")
+        self.strategy = strategy
+        self.failure_threshold = failure_threshold
+        self.open_duration_sec = open_duration_sec
+        self.latency_ewma_alpha = latency_ewma_alpha
+
+
+class CoreHostStats:
+    def __init__(
+        self,
+        host: str,
+        state: Literal["closed", "open", "half_open"],
+        latency_ewma_ms: Optional[float],
+        consecutive_failures: int,
+        request_count: int,
+        failure_count: int,
+    ):
+        self.host = host
+        # closed: the host is used normally, open: the host is skipped,
+        # half_open: the next request probes whether the host has recovered
+        self.state = state
+        # None until a request to the host has completed
+        self.latency_ewma_ms = latency_ewma_ms
+        self.consecutive_failures = consecutive_failures
+        self.request_count = request_count
+        self.failure_count = failure_count
+
+    def to_json(self) -> Dict[str, Any]:
+        return {
+            "host": self.host,
+            "state": self.state,
+            "latencyEwmaMs": self.latency_ewma_ms,
+            "consecutiveFailures": self.consecutive_failures,
+            "requestCount": self.request_count,
+            "failureCount": self.failure_count,
+        }
+
+
+class _HostHealth:
+    def __init__(self, host: str):
+        self.host = host
+        self.latency_ewma_ms: Optional[float] = None
+        self.consecutive_failures = 0
+        self.request_count = 0
+        self.failure_count = 0
+        # Set while the circuit is open (or half open)
+        self.opened_at: Optional[float] = None
+        self.probe_started_at: Optional[float] = None
+
+
+class CoreHostHealth:
+    """
+    Tracks the latency and failures of each core host, and picks the host to
+    send each request to. Hosts whose circuit is open are skipped; if every
+    host is failing, the one whose circuit opened first is tried anyway, so
+    that requests are never refused without trying the core.
+    """
+
+    def __init__(self, hosts: List[str], config: Optional[CoreHostSelectionConfig]):
+        self.config = config if config is not None else CoreHostSelectionConfig()
+        self.hosts = hosts
+        self.health: Dict[str, _HostHealth] = {
+            host: _HostHealth(host) for host in hosts
+        }
+        # Longest first, so that a url is matched to the most specific host
+        self.hosts_by_length = sorted(hosts, key=len, reverse=True)
+        self.next_index = 0
+        self.lock = threading.Lock()
+
+    def select_host(self, exclude: Optional[List[str]] = None) -> str:
+        """
+        Returns the host to send the next request to. exclude lists the hosts
+        that already failed for this request; they are only returned if
+        there is no other host.
+        """
+        with self.lock:
+            now = time.monotonic()
+            candidates = [h for h in self.hosts if exclude is None or h not in exclude]
+            if len(candidates) == 0:
+                candidates = self.hosts
+
+            available = [h for h in candidates if self._is_available(h, now)]
+            if len(available) == 0:
+                host = min(
+                    candidates, key=lambda h: self.health[h].opened_at or float("-inf")
+                )
+            else:
+                host = self._pick(available)
+
+            health = self.health[host]
+            if health.opened_at is not None:
+                health.probe_started_at = now
+            return host
+
+    def record_success(self, url: str, latency_ms: float):
+        with self.lock:
+            health = self._get_health_for_url(url)
+            if health is None:
+                return
+            self._record_latency(health, latency_ms)
+            health.consecutive_failures = 0
+            health.opened_at = None
+            health.probe_started_at = None
+
+    def record_failure(self, url: str, latency_ms: float):
+        with self.lock:
+            health = self._get_health_for_url(url)
+            if health is None:
+                return
+            self._record_latency(health, latency_ms)
+            health.failure_count += 1
+            health.consecutive_failures += 1
+            if (
+                health.opened_at is not None
+                or health.consecutive_failures >= self.config.failure_threshold
+            ):
+                # A failed probe opens the circuit again for a full period
+                health.opened_at = time.monotonic()
+                health.probe_started_at = None
+
+    def get_stats(self) -> List[CoreHostStats]:
+        with self.lock:
+            now = time.monotonic()
+            return [
+                CoreHostStats(
+                    health.host,
+                    self._get_state(health, now),
+                    health.latency_ewma_ms,
+                    health.consecutive_failures,
+                    health.request_count,
+                    health.failure_count,
+                )
+                for health in self.health.values()
+            ]
+
+    def _get_state(
+        self, health: _HostHealth, now: float
+    ) -> Literal["closed", "open", "half_open"]:
+        if health.opened_at is None:
+            return "closed"
+        if now - health.opened_at < self.config.open_duration_sec:
+            return "open"
+        return "half_open"
+
+    def _is_available(self, host: str, now: float) -> bool:
+        health = self.health[host]
+        state = self._get_state(health, now)
+        if state == "closed":
+            return True
+        if state == "open":
+            return False
+        # Only one probe at a time. A probe that never reported back (for
+        # example because the request was cancelled) is given up on after
+        # another open period.
+        return (
+            health.probe_started_at is None
+            or now - health.probe_started_at >= self.config.open_duration_sec
+        )
+
+    def _pick(self, available: List[str]) -> str:
+        strategy = self.config.strategy
+        if len(available) == 1:
+            return available[0]
+        if strategy == "least_latency":
+            return min(available, key=self._latency_for_selection)
+        if strategy == "power_of_two_choices":
+            first, second = random.sample(available, 2)
+            if self._latency_for_selection(second) < self._latency_for_selection(first):
+                return second
+            return first
+
+        # round_robin: the next available host after the last one used
+        for offset in range(len(self.hosts)):
+            index = (self.next_index + offset) % len(self.hosts)
+            if self.hosts[index] in available:
+                self.next_index = (index + 1) % len(self.hosts)
+                return self.hosts[index]
+        return available[0]
+
+    def _latency_for_selection(self, host: str) -> float:
+        # Hosts that have not been used yet are tried first
+        latency = self.health[host].latency_ewma_ms
+        return latency if latency is not None else 0.0
+
+    def _record_latency(self, health: _HostHealth, latency_ms: float):
+        health.request_count += 1
+        if health.latency_ewma_ms is None:
+            health.latency_ewma_ms = latency_ms
+        else:
+            alpha = self.config.latency_ewma_alpha
+            health.latency_ewma_ms = (
+                alpha * latency_ms + (1 - alpha) * health.latency_ewma_ms
+            )
+
+    def _get_health_for_url(self, url: str) -> Optional[_HostHealth]:
+        for host in self.hosts_by_length:
+            if url == host or url.startswith(host + "/"):
+                return self.health[host]
+        return None
@@ -14,14 +14,13 @@
 from __future__ import annotations
 
 import asyncio
-from typing import Any, Optional, Union
-
-from asgiref.sync import async_to_sync
+from typing import Any, Dict, Optional, Union
 
 from supertokens_python.framework import BaseResponse
 
 
 def middleware(get_response: Any):
+    from asgiref.sync import async_to_sync
     from django.http import HttpRequest
 
     from supertokens_python import Supertokens
@@ -32,10 +31,16 @@ def middleware(get_response: Any):
     from supertokens_python.supertokens import manage_session_post_response
     from supertokens_python.utils import default_user_context
 
+    def get_user_context(request: HttpRequest) -> Dict[str, Any]:
+        return default_user_context(DjangoRequest(request))
+
     if asyncio.iscoroutinefunction(get_response):
 
         async def __asyncMiddleware(request: HttpRequest):
             st = Supertokens.get_instance()
+            if st.can_skip_middleware(request.path):
+                return await __async_pass_through(request)
+
             custom_request = DjangoRequest(request)
             from django.http import HttpResponse
 
@@ -68,10 +73,79 @@ def middleware(get_response: Any):
 
             raise Exception("Should never come here")
 
+        async def __async_pass_through(request: HttpRequest):
+            # Same as below, but the request is only wrapped if it is needed
+            st = Supertokens.get_instance()
+            try:
+                result = await get_response(request)
+                if hasattr(request, "supertokens") and isinstance(
+                    request.supertokens,  # type: ignore
+                    SessionContainer,
+                ):
+                    response = DjangoResponse(result)
+                    manage_session_post_response(
+                        request.supertokens,  # type: ignore
+                        response,
+                        get_user_context(request),
+                    )
+                    return response.response
+                return result
+            except SuperTokensError as e:
+                from django.http import HttpResponse
+
+                custom_request = DjangoRequest(request)
+                result = await st.handle_supertokens_error(
+                    custom_request,
+                    e,
+                    DjangoResponse(HttpResponse()),
+                    get_user_context(request),
+                )
+                if isinstance(result, DjangoResponse):
+                    return result.response
+
+            raise Exception("Should never come here")
+
         return __asyncMiddleware
 
+    def __sync_pass_through(request: HttpRequest):
+        # Same as __syncMiddleware, but the request is only wrapped if it is needed
+        st = Supertokens.get_instance()
+        try:
+            result = get_response(request)
+            if hasattr(request, "supertokens") and isinstance(
+                request.supertokens,  # type: ignore
+                SessionContainer,
+            ):
+                response = DjangoResponse(result)
+                manage_session_post_response(
+                    request.supertokens,  # type: ignore
+                    response,
+                    get_user_context(request),
+                )
+                return response.response
+            return result
+        except SuperTokensError as e:
+            from django.http import HttpResponse
+
+            custom_request = DjangoRequest(request)
+            error_result: Optional[BaseResponse] = async_to_sync(
+                st.handle_supertokens_error
+            )(
+                custom_request,
+                e,
+                DjangoResponse(HttpResponse()),
+                get_user_context(request),
+            )
+            if isinstance(error_result, DjangoResponse):
+                return error_result.response
+
+        raise Exception("Should never come here")
+
     def __syncMiddleware(request: HttpRequest):
         st = Supertokens.get_instance()
+        if st.can_skip_middleware(request.path):
+            return __sync_pass_through(request)
+
         custom_request = DjangoRequest(request)
         from django.http import HttpResponse
 
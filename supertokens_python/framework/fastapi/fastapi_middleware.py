@@ -11,7 +11,7 @@
 # WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
 # License for the specific language governing permissions and limitations
 # under the License.
-from typing import Union
+from typing import Any, Dict, Optional, Union
 
 
 def get_middleware():
@@ -32,6 +32,9 @@ def get_middleware():
     from supertokens_python.supertokens import manage_session_post_response
     from supertokens_python.utils import default_user_context
 
+    def get_user_context(request: Request) -> Dict[str, Any]:
+        return default_user_context(FastApiRequest(request))
+
     class ASGIMiddleware:
         def __init__(self, app: ASGIApp) -> None:
             self.app = app
@@ -43,6 +46,29 @@ def get_middleware():
 
             st = Supertokens.get_instance()
 
+            # Same as FastApiRequest.get_path, but without creating any objects, so
+            # that requests that are not for SuperTokens APIs have little overhead.
+            path: str = scope["path"]
+            root_path: str = scope.get("root_path", "")
+            if root_path != "" and path.startswith(root_path):
+                path = path[len(root_path) :]
+
+            if st.can_skip_middleware(path):
+                try:
+                    await self.call_app(scope, receive, send, None)
+                    return
+                except SuperTokensError as e:
+                    request = Request(scope, receive=receive)
+                    await self.handle_error(
+                        scope,
+                        receive,
+                        send,
+                        request,
+                        e,
+                        get_user_context(request),
+                    )
+                    return
+
             request = Request(scope, receive=receive)
             custom_request = FastApiRequest(request)
             user_context = default_user_context(custom_request)
@@ -56,28 +82,7 @@ def get_middleware():
                     # This means that the supertokens middleware did not handle the request,
                     # however, we may need to handle the header changes in the response,
                     # based on response mutators used by the session.
-                    async def send_wrapper(message: Message):
-                        if message["type"] == "http.response.start":
-                            # Start message has the headers, so we update the headers here
-                            # by using `manage_session_post_response` function, which will
-                            # apply all the Response Mutators. In the end, we just replace
-                            # the updated headers in the message.
-                            if hasattr(request.state, "supertokens") and isinstance(
-                                request.state.supertokens, SessionContainer
-                            ):
-                                fapi_response = Response()
-                                fapi_response.raw_headers = message["headers"]
-                                response = FastApiResponse(fapi_response)
-                                manage_session_post_response(
-                                    request.state.supertokens, response, user_context
-                                )
-                                message["headers"] = fapi_response.raw_headers
-
-                        # For `http.response.start` message, we might have the headers updated,
-                        # otherwise, we just send all the messages as is
-                        await send(message)
-
-                    await self.app(scope, receive, send_wrapper)
+                    await self.call_app(scope, receive, send, user_context)
                     return
 
                 # This means that the request was handled by the supertokens middleware
@@ -96,13 +101,60 @@ def get_middleware():
                 return
 
             except SuperTokensError as e:
-                response = FastApiResponse(Response())
-                result: Union[BaseResponse, None] = await st.handle_supertokens_error(
-                    FastApiRequest(request), e, response, user_context
-                )
-                if isinstance(result, FastApiResponse):
-                    await result.response(scope, receive, send)
-                    return
+                await self.handle_error(scope, receive, send, request, e, user_context)
+                return
+
+        async def call_app(
+            self,
+            scope: Scope,
+            receive: Receive,
+            send: Send,
+            user_context: Optional[Dict[str, Any]],
+        ):
+            async def send_wrapper(message: Message):
+                nonlocal user_context
+                if message["type"] == "http.response.start":
+                    # Start message has the headers, so we update the headers here
+                    # by using `manage_session_post_response` function, which will
+                    # apply all the Response Mutators. In the end, we just replace
+                    # the updated headers in the message.
+                    request = Request(scope)
+                    if hasattr(request.state, "supertokens") and isinstance(
+                        request.state.supertokens, SessionContainer
+                    ):
+                        if user_context is None:
+                            user_context = get_user_context(request)
+                        fapi_response = Response()
+                        fapi_response.raw_headers = message["headers"]
+                        response = FastApiResponse(fapi_response)
+                        manage_session_post_response(
+                            request.state.supertokens, response, user_context
+                        )
+                        message["headers"] = fapi_response.raw_headers
+
+                # For `http.response.start` message, we might have the headers updated,
+                # otherwise, we just send all the messages as is
+                await send(message)
+
+            await self.app(scope, receive, send_wrapper)
+
+        async def handle_error(
+            self,
+            scope: Scope,
+            receive: Receive,
+            send: Send,
+            request: Request,
+            err: SuperTokensError,
+            user_context: Dict[str, Any],
+        ):
+            st = Supertokens.get_instance()
+            response = FastApiResponse(Response())
+            result: Union[BaseResponse, None] = await st.handle_supertokens_error(
+                FastApiRequest(request), err, response, user_context
+            )
+            if isinstance(result, FastApiResponse):
+                await result.response(scope, receive, send)
+                return
 
             raise Exception("Should never come here")
 
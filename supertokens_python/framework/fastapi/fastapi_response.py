@@ -11,11 +11,11 @@
 # WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
 # License for the specific language governing permissions and limitations
 # under the License.
-import json
 from math import ceil
 from typing import Any, Dict, Literal, Optional
 
 from supertokens_python.framework.response import BaseResponse
+from supertokens_python.json_backend import json_dumps_bytes
 from supertokens_python.utils import get_timestamp_ms
 
 
@@ -83,13 +83,7 @@ class FastApiResponse(BaseResponse):
 
     def set_json_content(self, content: Dict[str, Any]):
         if not self.response_sent:
-            body = json.dumps(
-                content,
-                ensure_ascii=False,
-                allow_nan=False,
-                indent=None,
-                separators=(",", ":"),
-            ).encode("utf-8")
+            body = json_dumps_bytes(content)
             self.set_header("Content-Type", "application/json; charset=utf-8")
             self.set_header("Content-Length", str(len(body)))
             self.response.body = body
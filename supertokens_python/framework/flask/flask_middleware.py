@@ -49,6 +49,17 @@ class Middleware:
 
             st = Supertokens.get_instance()
 
+            # FlaskRequest.get_path uses request.base_url, which is built from
+            # these. Checking them first avoids creating the wrappers and
+            # running the event loop for requests that are not for SuperTokens.
+            environ = request.environ
+            path = environ.get("PATH_INFO", "")
+            script_name = environ.get("SCRIPT_NAME", "")
+            if script_name != "":
+                path = script_name + path
+            if st.can_skip_middleware(path):
+                return None
+
             request_ = FlaskRequest(request)
             response_ = FlaskResponse(Response())
             user_context = default_user_context(request_)
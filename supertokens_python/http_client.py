@@ -0,0 +1,118 @@
+# Copyright (c) 2025, VRAI Labs and/or its affiliates. All rights reserved.
+#
+# This software is licensed under the Apache License, Version 2.0 (the
+# "License") as published by the Apache Software Foundation.
+#
+# You may not use this file except in compliance with the License. You may
+# obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+from __future__ import annotations
+
+import asyncio
+from typing import TYPE_CHECKING, List, MutableMapping, Optional
+from weakref import WeakKeyDictionary
+
+if TYPE_CHECKING:
+    from httpx import AsyncClient
+
+
+class HttpClientConfig:
+    def __init__(
+        self,
+        timeout: float = 30.0,
+        connect_timeout: Optional[float] = None,
+        http2: bool = False,
+        max_connections: Optional[int] = 100,
+        max_keepalive_connections: Optional[int] = 20,
+        keepalive_expiry: Optional[float] = 5.0,
+    ):
+        self.timeout = timeout
+        self.connect_timeout = connect_timeout
+        self.http2 = http2
+        self.max_connections = max_connections
+        self.max_keepalive_connections = max_keepalive_connections
+        self.keepalive_expiry = keepalive_expiry
+
+
+class PooledAsyncClient:
+    """
+    Keeps one long-lived httpx.AsyncClient per event loop so that connections
+    (and TLS sessions) are reused across calls. httpx clients are bound to the
+    loop they were first used on, so a new client is created transparently
+    whenever the calling loop changes (for example, the per-thread loops used
+    by the syncio functions).
+    """
+
+    def __init__(self, config: Optional[HttpClientConfig] = None):
+        if config is None:
+            config = HttpClientConfig()
+        if config.http2:
+            try:
+                import h2  # type: ignore # pylint: disable=unused-import # noqa: F401
+            except ImportError:
+                raise Exception(
+                    "http2 is enabled, but the 'h2' package is not installed. "
+                    "Please install it using: pip install supertokens_python[http2]"
+                )
+        self.config = config
+        self._clients: MutableMapping[asyncio.AbstractEventLoop, AsyncClient] = (
+            WeakKeyDictionary()
+        )
+
+    def _create_client(self) -> AsyncClient:
+        # httpx is imported on first use to keep it out of the import time of
+        # the SDK
+        from httpx import AsyncClient, Limits, Timeout
+
+        config = self.config
+        timeout = Timeout(config.timeout)
+        if config.connect_timeout is not None:
+            timeout = Timeout(config.timeout, connect=config.connect_timeout)
+        return AsyncClient(
+            timeout=timeout,
+            limits=Limits(
+                max_connections=config.max_connections,
+                max_keepalive_connections=config.max_keepalive_connections,
+                keepalive_expiry=config.keepalive_expiry,
+            ),
+            http2=config.http2,
+        )
+
+    def get_client(self) -> AsyncClient:
+        loop = asyncio.get_running_loop()
+        client = self._clients.get(loop)
+        if client is None or client.is_closed:
+            client = self._create_client()
+            self._clients[loop] = client
+        return client
+
+    async def aclose(self):
+        """
+        Closes the client bound to the running loop. Clients bound to other
+        loops are closed on their own loop if it is still running, and
+        dropped otherwise.
+        """
+        try:
+            current_loop: Optional[asyncio.AbstractEventLoop] = (
+                asyncio.get_running_loop()
+            )
+        except RuntimeError:
+            current_loop = None
+
+        to_close: List[AsyncClient] = []
+        for loop, client in list(self._clients.items()):
+            if client.is_closed:
+                continue
+            if loop is current_loop:
+                to_close.append(client)
+            elif loop.is_running() and not loop.is_closed():
+                asyncio.run_coroutine_threadsafe(client.aclose(), loop)
+        self._clients.clear()
+
+        for client in to_close:
+            await client.aclose()
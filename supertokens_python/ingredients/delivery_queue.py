@@ -0,0 +1,309 @@
+# Copyright (c) 2025, VRAI Labs and/or its affiliates. All rights reserved.
+#
+# This software is licensed under the Apache License, Version 2.0 (the
+# "License") as published by the Apache Software Foundation.
+#
+# You may not use this file except in compliance with the License. You may
+# obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+from __future__ import annotations
+
+import asyncio
+import atexit
+import concurrent.futures
+import random
+import threading
+import time
+from typing import Any, Awaitable, Callable, Dict, Optional
+from weakref import WeakSet
+
+from supertokens_python.logger import log_debug_message
+
+
+class DeliveryQueueConfig:
+    def __init__(
+        self,
+        max_size: int = 1000,
+        concurrency: int = 4,
+        max_attempts: int = 5,
+        initial_backoff_sec: float = 1.0,
+        max_backoff_sec: float = 60.0,
+        shutdown_timeout_sec: float = 10.0,
+    ):
+        if max_size < 1:
+            raise ValueError("max_size must be at least 1")
+        if concurrency < 1:
+            raise ValueError("concurrency must be at least 1")
+        if max_attempts < 1:
+            raise ValueError("max_attempts must be at least 1")
+        self.max_size = max_size
+        self.concurrency = concurrency
+        self.max_attempts = max_attempts
+        self.initial_backoff_sec = initial_backoff_sec
+        self.max_backoff_sec = max_backoff_sec
+        # How long the exit handler waits for queued messages to be sent
+        self.shutdown_timeout_sec = shutdown_timeout_sec
+
+
+class RateLimiter:
+    """
+    A token bucket that allows rate_per_sec sends per second on average, and
+    bursts of up to burst sends. Used to stay under a provider's rate limit.
+    """
+
+    def __init__(self, rate_per_sec: float, burst: Optional[int] = None):
+        if rate_per_sec <= 0:
+            raise ValueError("rate_per_sec must be greater than 0")
+        self.rate_per_sec = rate_per_sec
+        self.burst = burst if burst is not None else max(1, int(rate_per_sec))
+        self._tokens = float(self.burst)
+        self._updated_at = time.monotonic()
+
+    def _refill(self):
+        now = time.monotonic()
+        self._tokens = min(
+            self.burst, self._tokens + (now - self._updated_at) * self.rate_per_sec
+        )
+        self._updated_at = now
+
+    async def acquire(self):
+        # Only called from the queue's event loop, so no lock is needed
+        self._refill()
+        while self._tokens < 1:
+            await asyncio.sleep((1 - self._tokens) / self.rate_per_sec)
+            self._refill()
+        self._tokens -= 1
+
+
+class _DeliveryJob:
+    def __init__(
+        self,
+        send: Callable[[], Awaitable[None]],
+        description: str,
+        rate_limiter: Optional[RateLimiter],
+    ):
+        self.send = send
+        self.description = description
+        self.rate_limiter = rate_limiter
+        self.attempts = 0
+
+
+class DeliveryQueue:
+    """
+    Sends emails and SMSs in the background, so that the APIs that trigger
+    them can respond without waiting for the provider.
+
+    The queue runs its workers on an event loop in a separate daemon thread.
+    This works the same way in asgi and wsgi mode: in wsgi mode the loop
+    used by the syncio functions is only running while a request is being
+    handled, so work scheduled on it would not make progress in between.
+
+    Failed sends are retried with exponential backoff (with jitter), up to
+    max_attempts times in total. Queued messages are lost if the process
+    exits before they are sent; an exit handler waits up to
+    shutdown_timeout_sec for them, and flush can be called explicitly as
+    part of a graceful shutdown.
+    """
+
+    def __init__(self, config: Optional[DeliveryQueueConfig] = None):
+        self.config = config if config is not None else DeliveryQueueConfig()
+        self._lock = threading.Lock()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._queue: Optional[asyncio.Queue[_DeliveryJob]] = None
+        # Jobs that have been enqueued but not finished, including the ones
+        # waiting to be retried
+        self._pending = 0
+        self._idle: Optional[asyncio.Event] = None
+        _queues.add(self)
+
+    def enqueue(
+        self,
+        send: Callable[[], Awaitable[None]],
+        description: str,
+        rate_limiter: Optional[RateLimiter] = None,
+    ) -> bool:
+        """
+        Queues send to be called in the background. Returns False, without
+        queueing it, if the queue is full. Can be called from any thread.
+        """
+        job = _DeliveryJob(send, description, rate_limiter)
+        with self._lock:
+            if self._pending >= self.config.max_size:
+                return False
+            self._pending += 1
+            loop = self._start()
+        loop.call_soon_threadsafe(self._put, job)
+        return True
+
+    def __len__(self) -> int:
+        return self._pending
+
+    async def flush(self, timeout_sec: Optional[float] = None) -> bool:
+        """
+        Waits until every queued message has been sent (or has failed for the
+        last time). Returns False if that did not happen within timeout_sec.
+        """
+        loop = self._loop
+        if loop is None:
+            return True
+        future = asyncio.run_coroutine_threadsafe(self._wait_until_idle(), loop)
+        try:
+            await asyncio.wait_for(asyncio.wrap_future(future), timeout_sec)
+            return True
+        except asyncio.TimeoutError:
+            return False
+
+    def flush_sync(self, timeout_sec: Optional[float] = None) -> bool:
+        loop = self._loop
+        if loop is None:
+            return True
+        future = asyncio.run_coroutine_threadsafe(self._wait_until_idle(), loop)
+        try:
+            future.result(timeout_sec)
+            return True
+        except concurrent.futures.TimeoutError:
+            future.cancel()
+            return False
+
+    def _start(self) -> asyncio.AbstractEventLoop:
+        # Called with self._lock held
+        if self._loop is not None:
+            return self._loop
+
+        loop = asyncio.new_event_loop()
+        ready = threading.Event()
+
+        def run():
+            asyncio.set_event_loop(loop)
+            self._queue = asyncio.Queue()
+            self._idle = asyncio.Event()
+            for _ in range(self.config.concurrency):
+                loop.create_task(self._worker())
+            ready.set()
+            loop.run_forever()
+
+        threading.Thread(
+            target=run, name="supertokens-delivery-queue", daemon=True
+        ).start()
+        ready.wait()
+        self._loop = loop
+        atexit.register(self._flush_on_exit)
+        return loop
+
+    def _put(self, job: _DeliveryJob):
+        assert self._queue is not None
+        self._queue.put_nowait(job)
+
+    def _done(self):
+        assert self._idle is not None
+        with self._lock:
+            self._pending -= 1
+            if self._pending == 0:
+                self._idle.set()
+
+    async def _wait_until_idle(self):
+        assert self._idle is not None
+        with self._lock:
+            if self._pending == 0:
+                return
+        # _done only runs on this loop, so it cannot set the event between
+        # the check above and this
+        self._idle.clear()
+        await self._idle.wait()
+
+    async def _worker(self):
+        assert self._queue is not None
+        while True:
+            job = await self._queue.get()
+            try:
+                await self._run(job)
+            except Exception as e:  # pylint: disable=broad-except
+                log_debug_message("Unexpected error in delivery queue: %s", e)
+                self._done()
+
+    async def _run(self, job: _DeliveryJob):
+        if job.rate_limiter is not None:
+            await job.rate_limiter.acquire()
+        job.attempts += 1
+        try:
+            await job.send()
+        except Exception as e:  # pylint: disable=broad-except
+            if job.attempts >= self.config.max_attempts:
+                log_debug_message(
+                    "Giving up on sending %s after %d attempts: %s",
+                    job.description,
+                    job.attempts,
+                    e,
+                )
+                self._done()
+                return
+            backoff = min(
+                self.config.max_backoff_sec,
+                self.config.initial_backoff_sec * 2 ** (job.attempts - 1),
+            ) * random.uniform(0.5, 1)
+            log_debug_message(
+                "Sending %s failed (attempt %d), retrying in %.1fs: %s",
+                job.description,
+                job.attempts,
+                backoff,
+                e,
+            )
+            # The job stays pending while it waits, but does not hold up a
+            # worker
+            asyncio.get_running_loop().call_later(backoff, self._put, job)
+            return
+        self._done()
+
+    def _flush_on_exit(self):
+        if self._pending > 0:
+            log_debug_message(
+                "Waiting for %d queued messages to be sent before exiting",
+                self._pending,
+            )
+            self.flush_sync(self.config.shutdown_timeout_sec)
+
+
+_queues: "WeakSet[DeliveryQueue]" = WeakSet()
+_default_queue: Optional[DeliveryQueue] = None
+_default_queue_lock = threading.Lock()
+
+
+def get_default_delivery_queue() -> DeliveryQueue:
+    global _default_queue
+    with _default_queue_lock:
+        if _default_queue is None:
+            _default_queue = DeliveryQueue()
+        return _default_queue
+
+
+async def flush_delivery_queues(timeout_sec: Optional[float] = None) -> bool:
+    # Flushed together, so that timeout_sec bounds the whole call
+    results = await asyncio.gather(
+        *(queue.flush(timeout_sec) for queue in list(_queues))
+    )
+    return all(results)
+
+
+# Parts of the SDK's state in the user context that belong to the request, and
+# are not safe to use from the delivery queue's thread once it has responded
+_REQUEST_BOUND_DEFAULT_KEYS = ("request", "core_call_cache", "user_cache")
+
+
+def get_background_user_context(user_context: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Returns the user context to send a queued message with: a copy of the
+    request's user context without the request and the per request caches.
+    """
+    background_user_context = dict(user_context)
+    if "_default" in user_context:
+        background_user_context["_default"] = {
+            k: v
+            for k, v in user_context["_default"].items()
+            if k not in _REQUEST_BOUND_DEFAULT_KEYS
+        }
+    return background_user_context
@@ -0,0 +1,65 @@
+# Copyright (c) 2025, VRAI Labs and/or its affiliates. All rights reserved.
+#
+# This software is licensed under the Apache License, Version 2.0 (the
+# "License") as published by the Apache Software Foundation.
+#
+# You may not use this file except in compliance with the License. You may
+# obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+from typing import Any, Dict, Optional, TypeVar
+
+from supertokens_python.ingredients.delivery_queue import (
+    DeliveryQueue,
+    RateLimiter,
+    get_background_user_context,
+    get_default_delivery_queue,
+)
+from supertokens_python.ingredients.emaildelivery.types import EmailDeliveryInterface
+from supertokens_python.logger import log_debug_message
+
+_T = TypeVar("_T")
+
+
+class QueuedEmailDeliveryService(EmailDeliveryInterface[_T]):
+    """
+    Wraps an email delivery service so that emails are sent in the background
+    by a DeliveryQueue, and send_email returns as soon as the email is queued.
+    If the queue is full, the email is sent right away instead.
+
+    For example, to queue the emails of the default service:
+
+        emailpassword.init(
+            email_delivery=EmailDeliveryConfig(
+                override=lambda original: QueuedEmailDeliveryService(original)
+            )
+        )
+    """
+
+    def __init__(
+        self,
+        service: EmailDeliveryInterface[_T],
+        queue: Optional[DeliveryQueue] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+    ) -> None:
+        self.service = service
+        self.queue = queue if queue is not None else get_default_delivery_queue()
+        # Shared by every email sent through this service, so it limits the
+        # rate at which this provider is called
+        self.rate_limiter = rate_limiter
+
+    async def send_email(self, template_vars: _T, user_context: Dict[str, Any]) -> None:
+        # The email is sent after the API responds, from another thread, so
+        # it does not get the request or the per request caches
+        background_user_context = get_background_user_context(user_context)
+
+        async def send():
+            await self.service.send_email(template_vars, background_user_context)
+
+        if not self.queue.enqueue(send, "email", self.rate_limiter):
+            log_debug_message("Delivery queue is full, sending email right away")
+            await self.service.send_email(template_vars, user_context)
@@ -13,11 +13,25 @@
 # under the License.
 
 
+from __future__ import annotations
+
+import asyncio
 import ssl
+import time
 from email.mime.text import MIMEText
-from typing import Any, Dict, TypeVar
-
-import aiosmtplib
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    List,
+    MutableMapping,
+    Optional,
+    Tuple,
+    TypeVar,
+)
+from weakref import WeakKeyDictionary, WeakSet
 
 from supertokens_python.ingredients.emaildelivery.types import (
     EmailContent,
@@ -25,14 +39,173 @@ from supertokens_python.ingredients.emaildelivery.types import (
 )
 from supertokens_python.logger import log_debug_message
 
+if TYPE_CHECKING:
+    import aiosmtplib
+
 _T = TypeVar("_T")
 
 
+class _PooledConnection:
+    def __init__(self, smtp: aiosmtplib.SMTP):
+        self.smtp = smtp
+        self.last_used = time.monotonic()
+
+
+class SMTPConnectionPool:
+    """
+    Keeps authenticated SMTP connections open between emails, so that the
+    connect, STARTTLS and login round trips are paid once per connection
+    instead of once per email. At most max_connections are open (or being
+    opened) at a time; other senders wait for a connection to be released.
+    Connections that have not been used for idle_timeout_sec are closed.
+
+    A pool is bound to the event loop it was created on.
+    """
+
+    def __init__(
+        self,
+        connect: Callable[[], Awaitable[aiosmtplib.SMTP]],
+        max_connections: int,
+        idle_timeout_sec: float,
+    ):
+        self._connect = connect
+        self.idle_timeout_sec = idle_timeout_sec
+        self._semaphore = asyncio.Semaphore(max_connections)
+        # Most recently used last, so that busy periods keep reusing the same
+        # (warm) connections, and the rest expire.
+        self._idle: List[_PooledConnection] = []
+        self._idle_check: Optional[asyncio.TimerHandle] = None
+        # The loop only keeps a weak reference to tasks, so the one closing
+        # expired connections is kept here until it is done
+        self._idle_check_task: Optional["asyncio.Task[None]"] = None
+
+    async def acquire(self) -> Tuple[_PooledConnection, bool]:
+        """
+        Returns (connection, reused). reused is False if the connection was
+        opened for this call.
+        """
+        await self._semaphore.acquire()
+        try:
+            while self._idle:
+                connection = self._idle.pop()
+                if self._is_expired(connection) or not connection.smtp.is_connected:
+                    await self._close(connection)
+                    continue
+                return connection, True
+            return _PooledConnection(await self._connect()), False
+        except BaseException:
+            self._semaphore.release()
+            raise
+
+    async def release(self, connection: _PooledConnection, reusable: bool):
+        try:
+            if reusable and self.idle_timeout_sec > 0 and connection.smtp.is_connected:
+                connection.last_used = time.monotonic()
+                self._idle.append(connection)
+                self._schedule_idle_check()
+            elif reusable:
+                await self._close(connection)
+            else:
+                # The connection may be in an unknown state, so it is dropped
+                # without a QUIT.
+                connection.smtp.close()
+        finally:
+            self._semaphore.release()
+
+    async def aclose(self):
+        if self._idle_check is not None:
+            self._idle_check.cancel()
+            self._idle_check = None
+        if self._idle_check_task is not None:
+            self._idle_check_task.cancel()
+            self._idle_check_task = None
+        idle, self._idle = self._idle, []
+        for connection in idle:
+            await self._close(connection)
+
+    def _is_expired(self, connection: _PooledConnection) -> bool:
+        return time.monotonic() - connection.last_used >= self.idle_timeout_sec
+
+    def _schedule_idle_check(self):
+        if self._idle_check is not None:
+            return
+        loop = asyncio.get_running_loop()
+        self._idle_check = loop.call_later(
+            self.idle_timeout_sec, self._start_idle_check
+        )
+
+    def _start_idle_check(self):
+        self._idle_check = None
+        task = asyncio.get_running_loop().create_task(self._close_expired())
+        self._idle_check_task = task
+
+        def on_done(t: "asyncio.Task[None]"):
+            if self._idle_check_task is t:
+                self._idle_check_task = None
+
+        task.add_done_callback(on_done)
+
+    async def _close_expired(self):
+        expired = [c for c in self._idle if self._is_expired(c)]
+        self._idle = [c for c in self._idle if c not in expired]
+        for connection in expired:
+            await self._close(connection)
+        if self._idle:
+            self._schedule_idle_check()
+
+    @staticmethod
+    async def _close(connection: _PooledConnection):
+        try:
+            if connection.smtp.is_connected:
+                await connection.smtp.quit()
+        except Exception as e:
+            log_debug_message("Error while closing SMTP connection: %s", e)
+            connection.smtp.close()
+
+
+_transporters: "WeakSet[Transporter]" = WeakSet()
+
+
 class Transporter:
     def __init__(self, smtp_settings: SMTPSettings) -> None:
         self.smtp_settings = smtp_settings
+        # aiosmtplib connections are bound to the loop they were opened on,
+        # so there is one pool per event loop (like the core http client).
+        self._pools: MutableMapping[asyncio.AbstractEventLoop, SMTPConnectionPool] = (
+            WeakKeyDictionary()
+        )
+        self._html_headers: Optional[str] = None
+        _transporters.add(self)
+
+    def _get_pool(self) -> SMTPConnectionPool:
+        loop = asyncio.get_running_loop()
+        pool = self._pools.get(loop)
+        if pool is None:
+            pool = SMTPConnectionPool(
+                self._connect,
+                self.smtp_settings.max_connections,
+                self.smtp_settings.idle_timeout_sec,
+            )
+            self._pools[loop] = pool
+        return pool
+
+    async def close(self) -> None:
+        """
+        Closes the idle connections of the pool bound to the running loop.
+        Pools bound to other loops are dropped.
+        """
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            loop = None
+        pool = self._pools.get(loop) if loop is not None else None
+        self._pools.clear()
+        if pool is not None:
+            await pool.aclose()
 
     async def _connect(self):
+        import aiosmtplib
+
         try:
             tls_context = ssl.create_default_context()
             if self.smtp_settings.secure:
@@ -74,23 +247,80 @@ class Transporter:
             raise e
 
     async def send_email(self, input_: EmailContent, _: Dict[str, Any]) -> None:
-        connection = await self._connect()
+        import aiosmtplib
+
+        pool = self._get_pool()
+        while True:
+            connection, reused = await pool.acquire()
+            try:
+                await self._send(connection.smtp, input_)
+            except aiosmtplib.SMTPServerDisconnected as e:
+                await pool.release(connection, reusable=False)
+                if reused:
+                    # The server closed the connection while it was idle.
+                    # The pool may hold more such connections, so we keep
+                    # trying until we get a new one.
+                    log_debug_message(
+                        "SMTP connection was closed by the server, reconnecting"
+                    )
+                    continue
+                log_debug_message("Error in sending email: %s", e)
+                raise e
+            except Exception as e:
+                await pool.release(connection, reusable=False)
+                log_debug_message("Error in sending email: %s", e)
+                raise e
+            await pool.release(connection, reusable=True)
+            return
 
+    async def _send(self, connection: aiosmtplib.SMTP, input_: EmailContent) -> None:
         from_ = self.smtp_settings.from_
-        try:
-            from_addr = f"{from_.name} <{from_.email}>"
-            if input_.is_html:
-                email_content = MIMEText(input_.body, "html")
-                email_content["From"] = from_addr
-                email_content["To"] = input_.to_email
-                email_content["Subject"] = input_.subject
-                await connection.sendmail(
-                    from_.email, input_.to_email, email_content.as_string()
+        from_addr = f"{from_.name} <{from_.email}>"
+        if input_.is_html:
+            await connection.sendmail(
+                from_.email,
+                input_.to_email,
+                self._get_html_message(from_addr, input_),
+            )
+        else:
+            await connection.sendmail(from_addr, input_.to_email, input_.body)
+
+    def _get_html_message(self, from_addr: str, input_: EmailContent) -> str:
+        values = (from_addr, input_.to_email, input_.subject)
+        if (
+            input_.body.isascii()
+            and "\r" not in input_.body
+            and _is_plain_header(values)
+        ):
+            # This is what MIMEText(body, "html").as_string() produces for such
+            # emails, without going through the email generator, which writes
+            # the body line by line. The headers that are the same for every
+            # email are built once.
+            if self._html_headers is None:
+                self._html_headers = (
+                    'Content-Type: text/html; charset="us-ascii"\n'
+                    "MIME-Version: 1.0\n"
+                    "Content-Transfer-Encoding: 7bit\n"
+                    f"From: {from_addr}\n"
                 )
-            else:
-                await connection.sendmail(from_addr, input_.to_email, input_.body)
-        except Exception as e:
-            log_debug_message("Error in sending email: %s", e)
-            raise e
-        finally:
-            await connection.quit()
+            return (
+                f"{self._html_headers}To: {input_.to_email}\n"
+                f"Subject: {input_.subject}\n\n{input_.body}"
+            )
+
+        email_content = MIMEText(input_.body, "html")
+        email_content["From"] = from_addr
+        email_content["To"] = input_.to_email
+        email_content["Subject"] = input_.subject
+        return email_content.as_string()
+
+
+def _is_plain_header(values: Tuple[str, ...]) -> bool:
+    return all(
+        value.isascii() and "\n" not in value and "\r" not in value for value in values
+    )
+
+
+async def close_smtp_connections() -> None:
+    for transporter in list(_transporters):
+        await transporter.close()
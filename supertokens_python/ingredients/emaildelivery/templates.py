@@ -0,0 +1,79 @@
+# Copyright (c) 2025, VRAI Labs and/or its affiliates. All rights reserved.
+#
+# This software is licensed under the Apache License, Version 2.0 (the
+# "License") as published by the Apache Software Foundation.
+#
+# You may not use this file except in compliance with the License. You may
+# obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+from __future__ import annotations
+
+from functools import lru_cache
+from string import Template
+from typing import Any, List
+
+
+def minify_html(html: str) -> str:
+    """
+    Removes the indentation and blank lines of an HTML template. Line breaks
+    are kept (a line break renders the same as a space, and keeping them keeps
+    the lines of the email well under the SMTP line length limit). This must
+    not be used on HTML with <pre> or <textarea> elements.
+    """
+    lines = (line.strip() for line in html.splitlines())
+    return "\n".join(line for line in lines if line != "")
+
+
+class CompiledTemplate:
+    """
+    A string.Template that has been split into its literal parts and
+    placeholders once, so that rendering it is a single join. render behaves
+    like Template.substitute: every placeholder must be given a value, which is
+    converted with str.
+    """
+
+    def __init__(self, template: str):
+        # Alternating literal text and placeholder names, starting and ending
+        # with literal text
+        self.literals: List[str] = []
+        self.names: List[str] = []
+
+        literal: List[str] = []
+        position = 0
+        for match in Template.pattern.finditer(template):
+            literal.append(template[position : match.start()])
+            position = match.end()
+            if match.group("escaped") is not None:
+                literal.append(Template.delimiter)
+                continue
+            name = match.group("named") or match.group("braced")
+            if name is None:
+                raise ValueError(
+                    f"Invalid placeholder in template at position {match.start()}"
+                )
+            self.literals.append("".join(literal))
+            self.names.append(name)
+            literal = []
+        literal.append(template[position:])
+        self.literals.append("".join(literal))
+
+    def render(self, **values: Any) -> str:
+        parts: List[str] = [self.literals[0]]
+        for name, literal in zip(self.names, self.literals[1:]):
+            parts.append(str(values[name]))
+            parts.append(literal)
+        return "".join(parts)
+
+
+@lru_cache(maxsize=None)
+def compile_html_template(template: str) -> CompiledTemplate:
+    """
+    Minifies and compiles an HTML email template. The result is cached, so
+    each template is only processed the first time it is used.
+    """
+    return CompiledTemplate(minify_html(template))
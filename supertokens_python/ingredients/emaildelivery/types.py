@@ -68,13 +68,24 @@ class SMTPSettings:
         password: Union[str, None] = None,
         secure: Union[bool, None] = None,
         username: Union[str, None] = None,
+        max_connections: int = 5,
+        idle_timeout_sec: float = 30,
     ) -> None:
+        if max_connections < 1:
+            raise ValueError("max_connections must be at least 1")
+        if idle_timeout_sec < 0:
+            raise ValueError("idle_timeout_sec must be greater than or equal to 0")
         self.host = host
         self.from_ = from_
         self.password = password
         self.port = port
         self.secure = secure
         self.username = username
+        # Connections are kept open and reused for up to idle_timeout_sec
+        # after each email. Set it to 0 to close the connection after every
+        # email instead.
+        self.max_connections = max_connections
+        self.idle_timeout_sec = idle_timeout_sec
 
 
 class EmailContent:
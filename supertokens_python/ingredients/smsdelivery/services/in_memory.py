@@ -0,0 +1,36 @@
+# Copyright (c) 2025, VRAI Labs and/or its affiliates. All rights reserved.
+#
+# This software is licensed under the Apache License, Version 2.0 (the
+# "License") as published by the Apache Software Foundation.
+#
+# You may not use this file except in compliance with the License. You may
+# obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+from typing import Any, Dict, List, TypeVar
+
+from supertokens_python.ingredients.smsdelivery.types import SMSDeliveryInterface
+
+_T = TypeVar("_T")
+
+
+class InMemorySMSDeliveryService(SMSDeliveryInterface[_T]):
+    """
+    Keeps the SMSs in memory instead of sending them, for tests. The first
+    fail_times calls raise an exception, to test retries.
+    """
+
+    def __init__(self, fail_times: int = 0) -> None:
+        self.sent: List[_T] = []
+        self.fail_times = fail_times
+        self.calls = 0
+
+    async def send_sms(self, template_vars: _T, user_context: Dict[str, Any]) -> None:
+        self.calls += 1
+        if self.calls <= self.fail_times:
+            raise Exception("InMemorySMSDeliveryService: simulated failure")
+        self.sent.append(template_vars)
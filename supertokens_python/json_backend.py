@@ -0,0 +1,182 @@
+# Copyright (c) 2025, VRAI Labs and/or its affiliates. All rights reserved.
+#
+# This software is licensed under the Apache License, Version 2.0 (the
+# "License") as published by the Apache Software Foundation.
+#
+# You may not use this file except in compliance with the License. You may
+# obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+"""
+JSON encoding and decoding for the hot paths of the SDK: responses from the
+core, access token payloads, the front token and the JSON bodies sent to the
+frontend.
+
+The standard library is used by default. orjson or ujson can be used instead
+with SupertokensConfig(json_backend=...), if it is installed. The output is
+compact (no spaces) whichever library is used, and values that the faster
+library would handle differently from the standard library are left to the
+standard library, so that the results and the errors raised are the same:
+
+- integers that do not fit in 64 bits (53 bits when encoding with orjson)
+- NaN and infinity, which orjson encodes as null
+- datetime objects and dataclasses, which orjson encodes itself
+
+The one difference left is that orjson encodes UUID objects as strings, where
+the standard library raises a TypeError.
+"""
+
+from __future__ import annotations
+
+import json
+import math
+import re
+from typing import Any, Callable, Optional, Union
+
+from typing_extensions import Literal
+
+JsonBackendName = Literal["orjson", "ujson", "json"]
+
+_backend_name: JsonBackendName = "json"
+# None when the standard library is used
+_dumps: Optional[Callable[[Any, bool], bytes]] = None
+_loads: Optional[Callable[[Union[str, bytes]], Any]] = None
+
+# orjson decodes integers that do not fit in 64 bits as floats. Any integer
+# with fewer than 19 digits fits, so JSON with longer runs of digits is left
+# to the standard library.
+_LONG_DIGIT_RUN = re.compile(r"[0-9]{19}")
+_LONG_DIGIT_RUN_BYTES = re.compile(rb"[0-9]{19}")
+
+
+def _not_serializable(obj: Any) -> Any:
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _has_non_finite_float(obj: Any) -> bool:
+    if isinstance(obj, float):
+        return not math.isfinite(obj)
+    if isinstance(obj, dict):
+        return any(_has_non_finite_float(v) for v in obj.values())  # type: ignore
+    if isinstance(obj, (list, tuple)):
+        return any(_has_non_finite_float(v) for v in obj)  # type: ignore
+    return False
+
+
+def _use_orjson():
+    import orjson
+
+    global _dumps, _loads
+    base_option = (
+        orjson.OPT_NON_STR_KEYS
+        | orjson.OPT_STRICT_INTEGER
+        | orjson.OPT_PASSTHROUGH_DATETIME
+        | orjson.OPT_PASSTHROUGH_DATACLASS
+    )
+
+    def dumps(obj: Any, sort_keys: bool) -> bytes:
+        option = base_option
+        if sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        data = orjson.dumps(obj, default=_not_serializable, option=option)
+        # NaN and infinity are encoded as null, so the payloads that have a
+        # null are checked for them
+        if b"null" in data and _has_non_finite_float(obj):
+            raise ValueError("Out of range float values are not JSON compliant")
+        return data
+
+    def loads(data: Union[str, bytes]) -> Any:
+        pattern = _LONG_DIGIT_RUN if isinstance(data, str) else _LONG_DIGIT_RUN_BYTES
+        if pattern.search(data) is not None:  # type: ignore
+            raise ValueError("May hold an integer that does not fit in 64 bits")
+        return orjson.loads(data)
+
+    _dumps = dumps
+    _loads = loads
+
+
+def _use_ujson():
+    import ujson
+
+    global _dumps, _loads
+
+    def dumps(obj: Any, sort_keys: bool) -> bytes:
+        return ujson.dumps(
+            obj,
+            ensure_ascii=False,
+            escape_forward_slashes=False,
+            sort_keys=sort_keys,
+            allow_nan=False,
+        ).encode("utf-8")
+
+    _dumps = dumps
+    _loads = ujson.loads
+
+
+def set_json_backend(name: Optional[JsonBackendName]):
+    """
+    Picks the library used to encode and decode JSON. None picks the standard
+    library. Raises an ImportError if orjson or ujson is picked but not
+    installed.
+    """
+    global _backend_name, _dumps, _loads
+    if name not in (None, "orjson", "ujson", "json"):
+        raise ValueError("json_backend must be one of orjson, ujson or json")
+    _dumps = None
+    _loads = None
+
+    if name == "orjson":
+        _use_orjson()
+    elif name == "ujson":
+        _use_ujson()
+    _backend_name = name if name is not None else "json"
+
+
+def get_json_backend() -> JsonBackendName:
+    return _backend_name
+
+
+def json_dumps_bytes(
+    obj: Any, sort_keys: bool = False, ensure_ascii: bool = False
+) -> bytes:
+    """
+    Returns obj encoded as compact UTF-8 JSON. With ensure_ascii, non ASCII
+    characters are escaped, as json.dumps does by default.
+    """
+    if _dumps is not None:
+        try:
+            data = _dumps(obj, sort_keys)
+        except (TypeError, ValueError, OverflowError):
+            data = None
+        # Neither library can escape non ASCII characters the way json.dumps
+        # does, so such payloads are left to it
+        if data is not None and (not ensure_ascii or data.isascii()):
+            return data
+    return json.dumps(
+        obj,
+        ensure_ascii=ensure_ascii,
+        allow_nan=False,
+        separators=(",", ":"),
+        sort_keys=sort_keys,
+    ).encode("utf-8")
+
+
+def json_dumps(obj: Any, sort_keys: bool = False, ensure_ascii: bool = False) -> str:
+    return json_dumps_bytes(obj, sort_keys, ensure_ascii).decode("utf-8")
+
+
+def json_loads(data: Union[str, bytes]) -> Any:
+    """
+    Raises json.JSONDecodeError (or UnicodeDecodeError for bytes that are not
+    valid UTF-8), as json.loads does.
+    """
+    if _loads is not None:
+        try:
+            return _loads(data)
+        except ValueError:
+            pass
+    return json.loads(data)
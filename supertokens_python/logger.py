@@ -72,6 +72,11 @@ _logger.addHandler(streamHandler)
 log_debug_message = _logger.debug
 
 
+def is_debug_logging_enabled() -> bool:
+    # Used to skip building values that are only needed for debug logs
+    return _logger.isEnabledFor(logging.DEBUG)
+
+
 def get_maybe_none_as_str(o: Union[str, None]) -> str:
     if o is None:
         return "None"
@@ -14,11 +14,20 @@
 from __future__ import annotations
 
 import asyncio
+import time
 from json import JSONDecodeError
 from os import environ
-from typing import TYPE_CHECKING, Any, Awaitable, Callable, Dict, Optional, Tuple
-
-from httpx import AsyncClient, ConnectTimeout, NetworkError, Response
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    Iterator,
+    MutableMapping,
+    Optional,
+    Tuple,
+)
 
 from .constants import (
     API_KEY_HEADER,
@@ -28,9 +37,28 @@ from .constants import (
     RID_KEY_HEADER,
     SUPPORTED_CDI_VERSIONS,
 )
+from .core_call_cache import (
+    CoreCallSingleFlight,
+    SharedCoreCallCache,
+    SharedCoreCallCacheConfig,
+)
+from .core_concurrency_limiter import (
+    MAX_RETRY_AFTER_SEC,
+    CoreConcurrencyLimiter,
+    CoreConcurrencyLimiterConfig,
+    CoreConcurrencyLimiterStats,
+    get_backoff_sec,
+    get_retry_after_sec,
+)
+from .core_host_health import CoreHostHealth, CoreHostSelectionConfig, CoreHostStats
+from .http_client import HttpClientConfig, PooledAsyncClient
+from .json_backend import json_loads
 from .normalised_url_path import NormalisedURLPath
+from .request_user_cache import RequestUserCache, keeps_request_user_cache
 
 if TYPE_CHECKING:
+    from httpx import AsyncClient, Headers, Response
+
     from .supertokens import Host
 
 from typing import List, Set, Union
@@ -49,7 +77,6 @@ class Querier:
     __hosts: List[Host] = []
     __api_key: Union[None, str] = None
     api_version = None
-    __last_tried_index: int = 0
     __hosts_alive_for_testing: Set[str] = set()
     network_interceptor: Optional[
         Callable[
@@ -72,6 +99,11 @@ class Querier:
     ] = None
     __global_cache_tag = get_timestamp_ms()
     __disable_cache = False
+    __http_client: Optional[PooledAsyncClient] = None
+    __shared_cache: Optional[SharedCoreCallCache] = None
+    __host_health: Optional[CoreHostHealth] = None
+    __single_flight: Optional[CoreCallSingleFlight] = None
+    __limiter: Optional[CoreConcurrencyLimiter] = None
 
     def __init__(self, hosts: List[Host], rid_to_core: Union[None, str] = None):
         self.__hosts = hosts
@@ -86,6 +118,11 @@ class Querier:
         ):
             raise Exception("calling testing function in non testing env")
         Querier.__init_called = False
+        Querier.__http_client = None
+        Querier.__shared_cache = None
+        Querier.__host_health = None
+        Querier.__single_flight = None
+        Querier.__limiter = None
 
     @staticmethod
     def get_hosts_alive_for_testing():
@@ -103,20 +140,37 @@ class Querier:
         *args: Any,
         **kwargs: Any,
     ) -> Response:
+        from httpx import NetworkError, TimeoutException
+
         if attempts_remaining == 0:
             raise Exception("Retry request failed")
 
         try:
-            async with AsyncClient(timeout=30.0) as client:
-                if method == "GET":
-                    return await client.get(url, *args, **kwargs)  # type: ignore
-                if method == "POST":
-                    return await client.post(url, *args, **kwargs)  # type: ignore
-                if method == "PUT":
-                    return await client.put(url, *args, **kwargs)  # type: ignore
-                if method == "DELETE":
-                    return await client.delete(url, *args, **kwargs)  # type: ignore
+            client = Querier.get_http_client()
+            if method not in ("GET", "POST", "PUT", "DELETE"):
                 raise Exception("Shouldn't come here")
+            host_health = Querier.__host_health
+            limiter = Querier.__limiter
+            epoch = await limiter.acquire() if limiter is not None else 0
+            rate_limited: Optional[bool] = None
+            start = time.monotonic()
+            try:
+                response = await client.request(method, url, *args, **kwargs)  # type: ignore
+                rate_limited = response.status_code == RATE_LIMIT_STATUS_CODE
+            except (ConnectionError, NetworkError, TimeoutException):
+                if host_health is not None:
+                    host_health.record_failure(url, (time.monotonic() - start) * 1000)
+                raise
+            finally:
+                if limiter is not None:
+                    limiter.release(epoch, rate_limited)
+            if host_health is not None:
+                latency_ms = (time.monotonic() - start) * 1000
+                if is_5xx_error(response.status_code):
+                    host_health.record_failure(url, latency_ms)
+                else:
+                    host_health.record_success(url, latency_ms)
+            return response
         except AsyncLibraryNotFoundError:
             # Retry
             loop = create_or_get_event_loop()
@@ -124,6 +178,47 @@ class Querier:
                 self.api_request(url, method, attempts_remaining - 1, *args, **kwargs)
             )
 
+    @staticmethod
+    def get_http_client() -> AsyncClient:
+        """
+        Returns the pooled client bound to the running event loop. This is
+        also used for calls to the core that are not made through the
+        querier, like fetching the JWKS.
+        """
+        if Querier.__http_client is None:
+            Querier.__http_client = PooledAsyncClient()
+        return Querier.__http_client.get_client()
+
+    @staticmethod
+    def get_host_stats() -> List[CoreHostStats]:
+        """
+        Returns the health of each core host: its circuit breaker state, the
+        average latency of requests to it, and its failure counts.
+        """
+        if Querier.__host_health is None:
+            return []
+        return Querier.__host_health.get_stats()
+
+    @staticmethod
+    def get_concurrency_limiter_stats() -> Optional[CoreConcurrencyLimiterStats]:
+        """
+        Returns the current limit on concurrent requests to the core, the
+        number of requests in flight and waiting, and how long they waited.
+        None if no limiter is configured.
+        """
+        if Querier.__limiter is None:
+            return None
+        return Querier.__limiter.get_stats()
+
+    @staticmethod
+    async def close_http_client():
+        """
+        Closes the pooled connections to the core. A new pool is created
+        automatically if the querier is used again afterwards.
+        """
+        if Querier.__http_client is not None:
+            await Querier.__http_client.aclose()
+
     async def get_api_version(self, user_context: Union[Dict[str, Any], None] = None):
         if user_context is None:
             user_context = {}
@@ -219,16 +314,39 @@ class Querier:
             ]
         ] = None,
         disable_cache: bool = False,
+        http_client_config: Optional[HttpClientConfig] = None,
+        shared_cache_config: Optional[SharedCoreCallCacheConfig] = None,
+        host_selection_config: Optional[CoreHostSelectionConfig] = None,
+        concurrency_limiter_config: Optional[CoreConcurrencyLimiterConfig] = None,
     ):
         if not Querier.__init_called:
             Querier.__init_called = True
             Querier.__hosts = hosts
             Querier.__api_key = api_key
             Querier.api_version = None
-            Querier.__last_tried_index = 0
             Querier.__hosts_alive_for_testing = set()
             Querier.network_interceptor = network_interceptor
             Querier.__disable_cache = disable_cache
+            Querier.__http_client = PooledAsyncClient(http_client_config)
+            Querier.__shared_cache = (
+                SharedCoreCallCache(shared_cache_config)
+                if shared_cache_config is not None
+                else None
+            )
+            Querier.__host_health = CoreHostHealth(
+                [get_host_string(h) for h in hosts], host_selection_config
+            )
+            # Identical GET requests that are in flight at the same time share
+            # a single round trip to the core. Like the per request cache,
+            # this is turned off by disable_cache.
+            Querier.__single_flight = (
+                CoreCallSingleFlight() if not disable_cache else None
+            )
+            Querier.__limiter = (
+                CoreConcurrencyLimiter(concurrency_limiter_config)
+                if concurrency_limiter_config is not None
+                else None
+            )
 
     async def __get_headers_with_api_version(
         self, path: NormalisedURLPath, user_context: Union[Dict[str, Any], None]
@@ -287,6 +405,21 @@ class Querier:
                 ).get("core_call_cache", {}):
                     return user_context["_default"]["core_call_cache"][unique_key]
 
+            shared_cache = Querier.__shared_cache
+            if Querier.network_interceptor is not None:
+                # The interceptor may change the request based on the
+                # user_context, so its responses are not shared with other
+                # requests (see single_flight below)
+                shared_cache = None
+            shared_cache_generation = 0
+            if shared_cache is not None:
+                shared_cache_generation = shared_cache.get_generation()
+                cached_response = shared_cache.get(unique_key)
+                if cached_response is not None:
+                    return cached_response
+            cache_params = params
+
+            single_flight = Querier.__single_flight
             if Querier.network_interceptor is not None:
                 (
                     url,
@@ -297,14 +430,25 @@ class Querier:
                 ) = Querier.network_interceptor(  # pylint:disable=not-callable
                     url, method, headers, params, {}, user_context
                 )
-
-            response = await self.api_request(
-                url,
-                method,
-                2,
-                headers=headers,
-                params=params,
-            )
+                # The interceptor may change the request based on the
+                # user_context, so it cannot be shared with other requests
+                single_flight = None
+
+            if single_flight is not None:
+                response = await single_flight.run(
+                    unique_key,
+                    lambda: self.api_request(
+                        url, method, 2, headers=headers, params=params
+                    ),
+                )
+            else:
+                response = await self.api_request(
+                    url,
+                    method,
+                    2,
+                    headers=headers,
+                    params=params,
+                )
 
             if (
                 response.status_code == 200
@@ -320,6 +464,15 @@ class Querier:
                     "global_cache_tag": Querier.__global_cache_tag,
                 }
 
+            if response.status_code == 200 and shared_cache is not None:
+                shared_cache.set(
+                    unique_key,
+                    path.get_as_string_dangerous(),
+                    cache_params,
+                    response,
+                    shared_cache_generation,
+                )
+
             return response
 
         return await self.__send_request_helper(path, "GET", f, len(self.__hosts))
@@ -331,7 +484,7 @@ class Querier:
         user_context: Union[Dict[str, Any], None],
         test: bool = False,
     ) -> Dict[str, Any]:
-        self.invalidate_core_call_cache(user_context)
+        self.invalidate_core_call_cache(user_context, write_path=path)
         if data is None:
             data = {}
 
@@ -365,7 +518,10 @@ class Querier:
                 json=data,
             )
 
-        return await self.__send_request_helper(path, "POST", f, len(self.__hosts))
+        try:
+            return await self.__send_request_helper(path, "POST", f, len(self.__hosts))
+        finally:
+            self.__invalidate_shared_cache(path, data)
 
     async def send_delete_request(
         self,
@@ -373,7 +529,7 @@ class Querier:
         params: Union[Dict[str, Any], None],
         user_context: Union[Dict[str, Any], None],
     ) -> Dict[str, Any]:
-        self.invalidate_core_call_cache(user_context)
+        self.invalidate_core_call_cache(user_context, write_path=path)
         if params is None:
             params = {}
 
@@ -398,7 +554,12 @@ class Querier:
                 params=params,
             )
 
-        return await self.__send_request_helper(path, "DELETE", f, len(self.__hosts))
+        try:
+            return await self.__send_request_helper(
+                path, "DELETE", f, len(self.__hosts)
+            )
+        finally:
+            self.__invalidate_shared_cache(path, params)
 
     async def send_put_request(
         self,
@@ -407,7 +568,7 @@ class Querier:
         query_params: Union[Dict[str, Any], None],
         user_context: Union[Dict[str, Any], None],
     ) -> Dict[str, Any]:
-        self.invalidate_core_call_cache(user_context)
+        self.invalidate_core_call_cache(user_context, write_path=path)
         if data is None:
             data = {}
         if query_params is None:
@@ -432,12 +593,16 @@ class Querier:
                 url, method, 2, headers=headers, json=data, params=query_params
             )
 
-        return await self.__send_request_helper(path, "PUT", f, len(self.__hosts))
+        try:
+            return await self.__send_request_helper(path, "PUT", f, len(self.__hosts))
+        finally:
+            self.__invalidate_shared_cache(path, {**query_params, **data})
 
     def invalidate_core_call_cache(
         self,
         user_context: Union[Dict[str, Any], None],
         upd_global_cache_tag_if_necessary: bool = True,
+        write_path: Optional[NormalisedURLPath] = None,
     ):
         if user_context is None:
             # this is done so that the code below runs as expected.
@@ -451,10 +616,55 @@ class Querier:
             # there can be race conditions here, but i think we can ignore them.
             Querier.__global_cache_tag = get_timestamp_ms()
 
-        user_context["_default"] = {
+        default = {
             **user_context.get("_default", {}),
             "core_call_cache": {},
         }
+        # The users cached for the request are kept for writes that cannot
+        # change them
+        if write_path is None or not keeps_request_user_cache(
+            write_path.get_as_string_dangerous()
+        ):
+            default.pop("user_cache", None)
+        user_context["_default"] = default
+
+    def get_request_user_cache(
+        self, user_context: Union[Dict[str, Any], None]
+    ) -> Optional[RequestUserCache]:
+        """
+        Returns the users fetched from the core so far in this request (see
+        RequestUserCache), or None if the core call cache is disabled.
+        """
+        if Querier.__disable_cache or user_context is None:
+            return None
+        if (
+            user_context.get("_default", {}).get("global_cache_tag", -1)
+            != Querier.__global_cache_tag
+        ):
+            self.invalidate_core_call_cache(user_context, False)
+
+        user_cache = user_context["_default"].get("user_cache")
+        if user_cache is None:
+            user_cache = RequestUserCache()
+            user_context["_default"] = {
+                **user_context["_default"],
+                "user_cache": user_cache,
+                "global_cache_tag": Querier.__global_cache_tag,
+            }
+        return user_cache
+
+    def __invalidate_shared_cache(
+        self, path: NormalisedURLPath, data: Optional[Dict[str, Any]]
+    ):
+        # This runs after the write (even if it failed), so that GETs sent
+        # after the write do not share a response with one sent before it. A
+        # GET that was in flight during the write does not store its response
+        # in the shared cache either, as it may hold the old value (see
+        # SharedCoreCallCache.get_generation).
+        if Querier.__single_flight is not None:
+            Querier.__single_flight.on_write()
+        if Querier.__shared_cache is not None:
+            Querier.__shared_cache.on_write(path.get_as_string_dangerous(), data or {})
 
     def get_all_core_urls_for_path(self, path: str) -> List[str]:
         normalized_path = NormalisedURLPath(path)
@@ -479,20 +689,23 @@ class Querier:
         http_function: Callable[[str, str], Awaitable[Response]],
         no_of_tries: int,
         retry_info_map: Optional[Dict[str, int]] = None,
+        failed_hosts: Optional[List[str]] = None,
     ) -> Dict[str, Any]:
+        from httpx import ConnectTimeout, NetworkError
+
         if no_of_tries == 0:
             raise Exception("No SuperTokens core available to query")
 
+        if failed_hosts is None:
+            failed_hosts = []
+
+        host_health = Querier.__host_health
+        if host_health is not None:
+            current_host = host_health.select_host(failed_hosts)
+        else:
+            current_host = get_host_string(self.__hosts[0])
+
         try:
-            current_host_domain = self.__hosts[
-                Querier.__last_tried_index
-            ].domain.get_as_string_dangerous()
-            current_host_base_path = self.__hosts[
-                Querier.__last_tried_index
-            ].base_path.get_as_string_dangerous()
-            current_host: str = current_host_domain + current_host_base_path
-            Querier.__last_tried_index += 1
-            Querier.__last_tried_index %= len(self.__hosts)
             url = current_host + path.get_as_string_dangerous()
 
             max_retries = 5
@@ -515,15 +728,30 @@ class Querier:
             if response.status_code == RATE_LIMIT_STATUS_CODE:
                 retries_left = retry_info_map[url]
 
-                if retries_left > 0:
+                # The core's Retry-After is honoured, unless it asks us to wait
+                # for longer than a request can reasonably be held up, in
+                # which case the error is returned straight away
+                retry_after = get_retry_after_sec(response.headers.get("Retry-After"))
+                if retries_left > 0 and (
+                    retry_after is None or retry_after <= MAX_RETRY_AFTER_SEC
+                ):
                     retry_info_map[url] = retries_left - 1
 
                     attempts_made = max_retries - retries_left
-                    delay = (10 + attempts_made * 250) / 1000
+                    delay = (
+                        retry_after
+                        if retry_after is not None
+                        else get_backoff_sec(attempts_made)
+                    )
 
                     await asyncio.sleep(delay)
                     return await self.__send_request_helper(
-                        path, method, http_function, no_of_tries, retry_info_map
+                        path,
+                        method,
+                        http_function,
+                        no_of_tries,
+                        retry_info_map,
+                        failed_hosts,
                     )
 
             if is_4xx_error(response.status_code) or is_5xx_error(response.status_code):  # type: ignore
@@ -538,16 +766,66 @@ class Querier:
                     + response.text  # type: ignore
                 )
 
-            res: Dict[str, Any] = {"_headers": dict(response.headers)}
-
+            # Each call parses the response again, even when it comes from a
+            # cache, so the parsed dict can be returned as is
+            res: Dict[str, Any]
             try:
-                res.update(response.json())
+                res = json_loads(response.content)
             except JSONDecodeError:
-                res["_text"] = response.text
+                res = {"_text": response.text}
+            res["_headers"] = CoreResponseHeaders(response.headers)
 
             return res
 
         except (ConnectionError, NetworkError, ConnectTimeout) as _:
+            failed_hosts.append(current_host)
             return await self.__send_request_helper(
-                path, method, http_function, no_of_tries - 1, retry_info_map
+                path,
+                method,
+                http_function,
+                no_of_tries - 1,
+                retry_info_map,
+                failed_hosts,
             )
+
+
+class CoreResponseHeaders(MutableMapping[str, str]):
+    """
+    The headers of a response from the core, as a dict with lower case keys.
+    They are only copied out of the response the first time they are read,
+    since most callers never look at them.
+    """
+
+    def __init__(self, headers: Headers):
+        self.__headers: Optional[Headers] = headers
+        self.__dict: Optional[Dict[str, str]] = None
+
+    def __get_dict(self) -> Dict[str, str]:
+        if self.__dict is None:
+            self.__dict = dict(self.__headers or {})
+            self.__headers = None
+        return self.__dict
+
+    def __getitem__(self, key: str) -> str:
+        return self.__get_dict()[key]
+
+    def __setitem__(self, key: str, value: str):
+        self.__get_dict()[key] = value
+
+    def __delitem__(self, key: str):
+        del self.__get_dict()[key]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.__get_dict())
+
+    def __len__(self) -> int:
+        return len(self.__get_dict())
+
+    def __repr__(self) -> str:
+        return repr(self.__get_dict())
+
+
+def get_host_string(host: Host) -> str:
+    return (
+        host.domain.get_as_string_dangerous() + host.base_path.get_as_string_dangerous()
+    )
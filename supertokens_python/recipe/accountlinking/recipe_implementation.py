@@ -142,10 +142,16 @@ class RecipeImplementation(RecipeInterface):
             },
             user_context,
         )
+        user_cache = self.querier.get_request_user_cache(user_context)
+        if user_cache is not None:
+            user_cache.invalidate_users([recipe_user_id.get_as_string()])
 
         if response["status"] == "OK":
+            user = User.from_json(response["user"])
+            if user_cache is not None:
+                user_cache.set_user(user.id, user)
             return CreatePrimaryUserOkResult(
-                User.from_json(response["user"]),
+                user,
                 response["wasAlreadyAPrimaryUser"],
             )
         elif (
@@ -225,6 +231,11 @@ class RecipeImplementation(RecipeInterface):
             },
             user_context,
         )
+        user_cache = self.querier.get_request_user_cache(user_context)
+        if user_cache is not None:
+            user_cache.invalidate_users(
+                [recipe_user_id.get_as_string(), primary_user_id]
+            )
 
         if response["status"] in [
             "OK",
@@ -306,6 +317,9 @@ class RecipeImplementation(RecipeInterface):
             },
             user_context,
         )
+        user_cache = self.querier.get_request_user_cache(user_context)
+        if user_cache is not None:
+            user_cache.invalidate_users([recipe_user_id.get_as_string()])
         return UnlinkAccountOkResult(
             response["wasRecipeUserDeleted"], response["wasLinked"]
         )
@@ -313,6 +327,10 @@ class RecipeImplementation(RecipeInterface):
     async def get_user(
         self, user_id: str, user_context: Dict[str, Any]
     ) -> Optional[User]:
+        user_cache = self.querier.get_request_user_cache(user_context)
+        if user_cache is not None and user_cache.has_user(user_id):
+            return user_cache.get_user(user_id)
+
         response = await self.querier.send_get_request(
             NormalisedURLPath("/user/id"),
             {
@@ -320,9 +338,11 @@ class RecipeImplementation(RecipeInterface):
             },
             user_context,
         )
-        if response["status"] == "OK":
-            return User.from_json(response["user"])
-        return None
+        user = User.from_json(response["user"]) if response["status"] == "OK" else None
+        user_cache = self.querier.get_request_user_cache(user_context)
+        if user_cache is not None:
+            user_cache.set_user(user_id, user)
+        return user
 
     async def list_users_by_account_info(
         self,
@@ -343,13 +363,26 @@ class RecipeImplementation(RecipeInterface):
             params["thirdPartyId"] = account_info.third_party.id
             params["thirdPartyUserId"] = account_info.third_party.user_id
 
+        cache_key = f"{tenant_id or 'public'};" + ";".join(
+            f"{key}={value}" for key, value in sorted(params.items())
+        )
+        user_cache = self.querier.get_request_user_cache(user_context)
+        if user_cache is not None:
+            cached_users = user_cache.get_users_by_account_info(cache_key)
+            if cached_users is not None:
+                return list(cached_users)
+
         response = await self.querier.send_get_request(
             NormalisedURLPath(f"/{tenant_id or 'public'}/users/by-accountinfo"),
             params,
             user_context,
         )
 
-        return [User.from_json(u) for u in response["users"]]
+        users = [User.from_json(u) for u in response["users"]]
+        user_cache = self.querier.get_request_user_cache(user_context)
+        if user_cache is not None:
+            user_cache.set_users_by_account_info(cache_key, users)
+        return list(users)
 
     async def delete_user(
         self,
@@ -365,3 +398,6 @@ class RecipeImplementation(RecipeInterface):
             },
             user_context,
         )
+        user_cache = self.querier.get_request_user_cache(user_context)
+        if user_cache is not None:
+            user_cache.invalidate_users([user_id])
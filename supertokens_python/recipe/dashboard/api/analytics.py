@@ -16,8 +16,6 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING, Any, Dict
 
-from httpx import AsyncClient
-
 from supertokens_python import Supertokens
 from supertokens_python.constants import (
     TELEMETRY_SUPERTOKENS_API_URL,
@@ -40,6 +38,8 @@ async def handle_analytics_post(
     api_options: APIOptions,
     _user_context: Dict[str, Any],
 ) -> AnalyticsResponse:
+    from httpx import AsyncClient
+
     if not Supertokens.get_instance().telemetry:
         return AnalyticsResponse()
     body = await api_options.request.json()
@@ -14,8 +14,6 @@
 
 from typing import Any, Dict, Union
 
-from phonenumbers import PhoneNumberFormat, format_number
-from phonenumbers import parse as parse_phone_number
 from typing_extensions import Literal
 
 from supertokens_python.exceptions import BadInputError
@@ -88,6 +86,9 @@ async def create_passwordless_user(
     CreatePasswordlessUserEmailValidationErrorResponse,
     CreatePasswordlessUserPhoneValidationErrorResponse,
 ]:
+    from phonenumbers import PhoneNumberFormat, format_number
+    from phonenumbers import parse as parse_phone_number
+
     passwordless_recipe: PasswordlessRecipe
     try:
         passwordless_recipe = PasswordlessRecipe.get_instance()
@@ -13,11 +13,10 @@
 # under the License.
 from __future__ import annotations
 
-import asyncio
-from typing import TYPE_CHECKING, Any, Awaitable, Dict, List
+from typing import TYPE_CHECKING, Any, Dict, List
 
 from ...usermetadata import UserMetadataRecipe
-from ...usermetadata.asyncio import get_user_metadata
+from ...usermetadata.asyncio import get_users_metadata
 from ..interfaces import DashboardUsersGetResponse
 from ..utils import UserWithMetadata
 
@@ -72,40 +71,19 @@ async def handle_users_get_api(
             users_with_metadata, users_response.next_pagination_token
         )
 
-    users_with_metadata: List[UserWithMetadata] = [
-        UserWithMetadata().from_user(user) for user in users_response.users
-    ]
-    metadata_fetch_awaitables: List[Awaitable[Any]] = []
-
-    async def get_user_metadata_and_update_user(user_idx: int) -> None:
-        user = users_response.users[user_idx]
-        user_metadata = await get_user_metadata(user.id)
-        first_name = user_metadata.metadata.get("first_name")
-        last_name = user_metadata.metadata.get("last_name")
-
-        users_with_metadata[user_idx].first_name = first_name
-        users_with_metadata[user_idx].last_name = last_name
-
-    for i, _ in enumerate(users_response.users):
-        metadata_fetch_awaitables.append(get_user_metadata_and_update_user(i))
-
-    promise_arr_start_position = 0
-    batch_size = 5
-
-    while promise_arr_start_position < len(metadata_fetch_awaitables):
-        # We want to query only 5 in parallel at a time
-        promises_to_call = [
-            metadata_fetch_awaitables[i]
-            for i in range(
-                promise_arr_start_position,
-                min(
-                    promise_arr_start_position + batch_size,
-                    len(metadata_fetch_awaitables),
-                ),
-            )
-        ]
-        await asyncio.gather(*promises_to_call)
-        promise_arr_start_position += batch_size
+    metadata_by_user_id = (
+        await get_users_metadata(
+            [user.id for user in users_response.users], user_context
+        )
+    ).metadata
+
+    users_with_metadata = []
+    for user in users_response.users:
+        user_with_metadata = UserWithMetadata().from_user(user)
+        metadata = metadata_by_user_id[user.id]
+        user_with_metadata.first_name = metadata.get("first_name")
+        user_with_metadata.last_name = metadata.get("last_name")
+        users_with_metadata.append(user_with_metadata)
 
     return DashboardUsersGetResponse(
         users_with_metadata,
@@ -16,8 +16,6 @@ from __future__ import annotations
 from os import environ
 from typing import Any, Dict
 
-from httpx import AsyncClient
-
 from supertokens_python.ingredients.emaildelivery.types import EmailDeliveryInterface
 from supertokens_python.logger import log_debug_message
 from supertokens_python.recipe.emailpassword.interfaces import (
@@ -36,6 +34,8 @@ async def create_and_send_email_using_supertokens_service(
     user: PasswordResetEmailTemplateVarsUser,
     password_reset_url_with_token: str,
 ) -> None:
+    from httpx import AsyncClient
+
     if ("SUPERTOKENS_ENV" in environ) and (environ["SUPERTOKENS_ENV"] == "testing"):
         return
 
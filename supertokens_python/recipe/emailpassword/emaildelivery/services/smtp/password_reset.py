@@ -12,14 +12,12 @@
 # License for the specific language governing permissions and limitations
 # under the License.
 
-from string import Template
 
+from supertokens_python.ingredients.emaildelivery.templates import compile_html_template
 from supertokens_python.ingredients.emaildelivery.types import EmailContent
 from supertokens_python.recipe.emailpassword.types import PasswordResetEmailTemplateVars
 from supertokens_python.supertokens import Supertokens
 
-from .password_reset_email import html_template
-
 
 def get_password_reset_email_content(
     email_input: PasswordResetEmailTemplateVars,
@@ -36,6 +34,9 @@ def get_password_reset_email_content(
 
 
 def get_password_reset_email_html(app_name: str, email: str, reset_link: str):
-    return Template(html_template).substitute(
+    # The template is only loaded the first time an email is sent
+    from .password_reset_email import html_template
+
+    return compile_html_template(html_template).render(
         appname=app_name, resetLink=reset_link, toEmail=email
     )
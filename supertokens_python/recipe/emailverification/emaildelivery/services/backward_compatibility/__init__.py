@@ -15,8 +15,6 @@
 from os import environ
 from typing import Any, Dict
 
-from httpx import AsyncClient
-
 from supertokens_python.ingredients.emaildelivery.types import EmailDeliveryInterface
 from supertokens_python.logger import log_debug_message
 from supertokens_python.recipe.emailverification.types import (
@@ -30,6 +28,8 @@ from supertokens_python.utils import handle_httpx_client_exceptions
 async def create_and_send_email_using_supertokens_service(
     app_info: AppInfo, user: EmailVerificationUser, email_verification_url: str
 ) -> None:
+    from httpx import AsyncClient
+
     if ("SUPERTOKENS_ENV" in environ) and (environ["SUPERTOKENS_ENV"] == "testing"):
         return
 
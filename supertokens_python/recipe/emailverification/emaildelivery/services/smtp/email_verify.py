@@ -12,16 +12,14 @@
 # License for the specific language governing permissions and limitations
 # under the License.
 
-from string import Template
 
+from supertokens_python.ingredients.emaildelivery.templates import compile_html_template
 from supertokens_python.ingredients.emaildelivery.types import EmailContent
 from supertokens_python.recipe.emailverification.types import (
     VerificationEmailTemplateVars,
 )
 from supertokens_python.supertokens import Supertokens
 
-from .email_verify_email import html_template
-
 
 def get_email_verify_email_content(
     email_input: VerificationEmailTemplateVars,
@@ -37,6 +35,9 @@ def get_email_verify_email_content(
 
 
 def get_email_verify_email_html(app_name: str, email: str, verification_link: str):
-    return Template(html_template).substitute(
+    # The template is only loaded the first time an email is sent
+    from .email_verify_email import html_template
+
+    return compile_html_template(html_template).render(
         appname=app_name, verificationLink=verification_link, toEmail=email
     )
@@ -90,6 +90,18 @@ async def list_all_tenants(
     return await recipe.recipe_implementation.list_all_tenants(user_context)
 
 
+async def warm_up_tenant_config_cache(
+    user_context: Optional[Dict[str, Any]] = None,
+) -> None:
+    """
+    Fills the tenant config cache with every tenant, so that get_tenant does not
+    need to query the core for them. This should be called once on startup, and
+    does nothing useful unless tenant_config_cache_ttl_sec is set in
+    multitenancy.init.
+    """
+    await list_all_tenants(user_context)
+
+
 async def create_or_update_third_party_config(
     tenant_id: str,
     config: ProviderConfig,
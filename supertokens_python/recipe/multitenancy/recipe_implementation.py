@@ -46,6 +46,7 @@ if TYPE_CHECKING:
 from supertokens_python.querier import NormalisedURLPath
 
 from .constants import DEFAULT_TENANT_ID
+from .tenant_config_cache import TenantConfigCache
 
 
 def parse_tenant_config(tenant: Dict[str, Any]) -> TenantConfig:
@@ -123,6 +124,15 @@ class RecipeImplementation(RecipeInterface):
         super().__init__()
         self.querier = querier
         self.config = config
+        self.tenant_config_cache: Optional[TenantConfigCache] = None
+        if config.tenant_config_cache_ttl_sec > 0:
+            self.tenant_config_cache = TenantConfigCache(
+                config.tenant_config_cache_ttl_sec
+            )
+
+    def invalidate_tenant_config_cache(self, tenant_id: Optional[str]):
+        if self.tenant_config_cache is not None:
+            self.tenant_config_cache.invalidate(tenant_id or DEFAULT_TENANT_ID)
 
     async def get_tenant_id(
         self, tenant_id_from_frontend: str, user_context: Dict[str, Any]
@@ -147,12 +157,16 @@ class RecipeImplementation(RecipeInterface):
                 )
             json_body["coreConfig"] = config.core_config
 
-        response = await self.querier.send_put_request(
-            NormalisedURLPath("/recipe/multitenancy/tenant/v2"),
-            json_body,
-            None,
-            user_context=user_context,
-        )
+        try:
+            response = await self.querier.send_put_request(
+                NormalisedURLPath("/recipe/multitenancy/tenant/v2"),
+                json_body,
+                None,
+                user_context=user_context,
+            )
+        finally:
+            # Even if the request failed, the core may have applied the write
+            self.invalidate_tenant_config_cache(tenant_id)
         return CreateOrUpdateTenantOkResult(
             created_new=response["createdNew"],
         )
@@ -160,11 +174,15 @@ class RecipeImplementation(RecipeInterface):
     async def delete_tenant(
         self, tenant_id: str, user_context: Dict[str, Any]
     ) -> DeleteTenantOkResult:
-        response = await self.querier.send_post_request(
-            NormalisedURLPath("/recipe/multitenancy/tenant/remove"),
-            {"tenantId": tenant_id},
-            user_context=user_context,
-        )
+        try:
+            response = await self.querier.send_post_request(
+                NormalisedURLPath("/recipe/multitenancy/tenant/remove"),
+                {"tenantId": tenant_id},
+                user_context=user_context,
+            )
+        finally:
+            # Even if the request failed, the core may have applied the write
+            self.invalidate_tenant_config_cache(tenant_id)
         return DeleteTenantOkResult(
             did_exist=response["didExist"],
         )
@@ -172,17 +190,28 @@ class RecipeImplementation(RecipeInterface):
     async def get_tenant(
         self, tenant_id: Optional[str], user_context: Dict[str, Any]
     ) -> Optional[TenantConfig]:
+        tenant_id = tenant_id or DEFAULT_TENANT_ID
+        generation = 0
+        if self.tenant_config_cache is not None:
+            found, cached = self.tenant_config_cache.get(tenant_id)
+            if found:
+                return None if cached is None else parse_tenant_config(cached)
+            generation = self.tenant_config_cache.get_generation()
+
         res = await self.querier.send_get_request(
-            NormalisedURLPath(
-                f"{tenant_id or DEFAULT_TENANT_ID}/recipe/multitenancy/tenant/v2"
-            ),
+            NormalisedURLPath(f"{tenant_id}/recipe/multitenancy/tenant/v2"),
             None,
             user_context=user_context,
         )
 
         if res["status"] == "TENANT_NOT_FOUND_ERROR":
+            if self.tenant_config_cache is not None:
+                self.tenant_config_cache.set(tenant_id, None, generation)
             return None
 
+        if self.tenant_config_cache is not None:
+            self.tenant_config_cache.set(tenant_id, res, generation)
+
         tenant_config = parse_tenant_config(res)
 
         return tenant_config
@@ -190,12 +219,18 @@ class RecipeImplementation(RecipeInterface):
     async def list_all_tenants(
         self, user_context: Dict[str, Any]
     ) -> ListAllTenantsOkResult:
+        generation = 0
+        if self.tenant_config_cache is not None:
+            generation = self.tenant_config_cache.get_generation()
         response = await self.querier.send_get_request(
             NormalisedURLPath("/recipe/multitenancy/tenant/list/v2"),
             {},
             user_context=user_context,
         )
 
+        if self.tenant_config_cache is not None:
+            self.tenant_config_cache.set_all(response["tenants"], generation)
+
         tenant_items: List[TenantConfig] = []
 
         for tenant in response["tenants"]:
@@ -213,17 +248,21 @@ class RecipeImplementation(RecipeInterface):
         skip_validation: Optional[bool],
         user_context: Dict[str, Any],
     ) -> CreateOrUpdateThirdPartyConfigOkResult:
-        response = await self.querier.send_put_request(
-            NormalisedURLPath(
-                f"{tenant_id or DEFAULT_TENANT_ID}/recipe/multitenancy/config/thirdparty"
-            ),
-            {
-                "config": config.to_json(),
-                "skipValidation": skip_validation is True,
-            },
-            None,
-            user_context=user_context,
-        )
+        try:
+            response = await self.querier.send_put_request(
+                NormalisedURLPath(
+                    f"{tenant_id or DEFAULT_TENANT_ID}/recipe/multitenancy/config/thirdparty"
+                ),
+                {
+                    "config": config.to_json(),
+                    "skipValidation": skip_validation is True,
+                },
+                None,
+                user_context=user_context,
+            )
+        finally:
+            # Even if the request failed, the core may have applied the write
+            self.invalidate_tenant_config_cache(tenant_id)
 
         return CreateOrUpdateThirdPartyConfigOkResult(
             created_new=response["createdNew"],
@@ -235,15 +274,19 @@ class RecipeImplementation(RecipeInterface):
         third_party_id: str,
         user_context: Dict[str, Any],
     ) -> DeleteThirdPartyConfigOkResult:
-        response = await self.querier.send_post_request(
-            NormalisedURLPath(
-                f"{tenant_id or DEFAULT_TENANT_ID}/recipe/multitenancy/config/thirdparty/remove"
-            ),
-            {
-                "thirdPartyId": third_party_id,
-            },
-            user_context=user_context,
-        )
+        try:
+            response = await self.querier.send_post_request(
+                NormalisedURLPath(
+                    f"{tenant_id or DEFAULT_TENANT_ID}/recipe/multitenancy/config/thirdparty/remove"
+                ),
+                {
+                    "thirdPartyId": third_party_id,
+                },
+                user_context=user_context,
+            )
+        finally:
+            # Even if the request failed, the core may have applied the write
+            self.invalidate_tenant_config_cache(tenant_id)
 
         return DeleteThirdPartyConfigOkResult(
             did_config_exist=response["didConfigExist"],
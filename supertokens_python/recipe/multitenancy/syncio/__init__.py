@@ -63,6 +63,17 @@ def list_all_tenants(user_context: Optional[Dict[str, Any]] = None):
     return sync(list_all_tenants(user_context))
 
 
+def warm_up_tenant_config_cache(user_context: Optional[Dict[str, Any]] = None):
+    if user_context is None:
+        user_context = {}
+
+    from supertokens_python.recipe.multitenancy.asyncio import (
+        warm_up_tenant_config_cache,
+    )
+
+    return sync(warm_up_tenant_config_cache(user_context))
+
+
 def create_or_update_third_party_config(
     tenant_id: str,
     config: ProviderConfig,
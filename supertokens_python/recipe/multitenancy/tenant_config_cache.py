@@ -0,0 +1,89 @@
+# Copyright (c) 2025, VRAI Labs and/or its affiliates. All rights reserved.
+#
+# This software is licensed under the Apache License, Version 2.0 (the
+# "License") as published by the Apache Software Foundation.
+#
+# You may not use this file except in compliance with the License. You may
+# obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+from __future__ import annotations
+
+import time
+from copy import deepcopy
+from typing import Any, Dict, List, Optional, Tuple
+
+
+class TenantConfigCache:
+    """
+    Caches the tenant configs returned by the core, keyed by tenant id. The raw
+    core response is stored (rather than a TenantConfig), and a copy of it is
+    returned, so that every caller gets its own TenantConfig object that it is
+    free to modify. A tenant that does not exist is cached as None.
+    """
+
+    def __init__(self, ttl_sec: int):
+        self.ttl_sec = ttl_sec
+        self._entries: Dict[str, Tuple[Optional[Dict[str, Any]], float]] = {}
+        # Incremented by every invalidation. Each tenant remembers the value
+        # it had when the tenant was last invalidated (or the cache cleared),
+        # so that configs fetched across a write are not stored.
+        self._generation = 0
+        self._invalidated_at: Dict[str, int] = {}
+        self._cleared_at = 0
+
+    def get(self, tenant_id: str) -> Tuple[bool, Optional[Dict[str, Any]]]:
+        """
+        Returns (found, tenant). found is False if the tenant id is not in the
+        cache, or if its entry has expired.
+        """
+        entry = self._entries.get(tenant_id)
+        if entry is None:
+            return False, None
+        tenant, expires_at = entry
+        if expires_at <= time.monotonic():
+            self._entries.pop(tenant_id, None)
+            return False, None
+        return True, deepcopy(tenant)
+
+    def get_generation(self) -> int:
+        """
+        To be read before fetching the configs that are passed to set or
+        set_all.
+        """
+        return self._generation
+
+    def set(self, tenant_id: str, tenant: Optional[Dict[str, Any]], generation: int):
+        # The tenant was written while its config was being fetched, so it
+        # may be out of date
+        if max(self._invalidated_at.get(tenant_id, 0), self._cleared_at) > generation:
+            return
+        if tenant is not None:
+            tenant = {
+                k: deepcopy(v)
+                for k, v in tenant.items()
+                if k not in ("_headers", "status")
+            }
+        self._entries[tenant_id] = (tenant, time.monotonic() + self.ttl_sec)
+
+    def set_all(self, tenants: List[Dict[str, Any]], generation: int):
+        for tenant in tenants:
+            self.set(tenant["tenantId"], tenant, generation)
+
+    def invalidate(self, tenant_id: str):
+        self._generation += 1
+        self._invalidated_at[tenant_id] = self._generation
+        self._entries.pop(tenant_id, None)
+
+    def clear(self):
+        self._generation += 1
+        self._cleared_at = self._generation
+        self._invalidated_at.clear()
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -29,5 +29,9 @@ if TYPE_CHECKING:
 
 def init(
     override: Union[InputOverrideConfig, None] = None,
+    access_token_cache_size: Union[int, None] = None,
+    access_token_cache_max_staleness_sec: Union[int, None] = None,
 ) -> Callable[[AppInfo], RecipeModule]:
-    return recipe.OAuth2ProviderRecipe.init(override)
+    return recipe.OAuth2ProviderRecipe.init(
+        override, access_token_cache_size, access_token_cache_max_staleness_sec
+    )
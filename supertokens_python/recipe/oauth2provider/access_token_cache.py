@@ -0,0 +1,128 @@
+# Copyright (c) 2025, VRAI Labs and/or its affiliates. All rights reserved.
+#
+# This software is licensed under the Apache License, Version 2.0 (the
+# "License") as published by the Apache Software Foundation.
+#
+# You may not use this file except in compliance with the License. You may
+# obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+from __future__ import annotations
+
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Set
+
+from supertokens_python.utils import get_timestamp_ms
+
+
+def _hash_token(token: str) -> str:
+    return hashlib.sha256(token.encode("utf-8")).hexdigest()
+
+
+class _CacheEntry:
+    def __init__(self, payload: Dict[str, Any], expires_at: int):
+        self.payload = payload
+        self.expires_at = expires_at
+        # Set once the core's introspection endpoint has reported the token
+        # as active
+        self.is_active_in_core = False
+
+
+class ValidatedOAuth2TokenCache:
+    """
+    A bounded LRU cache of OAuth2 access tokens that have passed signature
+    verification, keyed by the SHA-256 hash of the token. It also remembers
+    whether the core reported the token as active. An entry is never served
+    after the token's exp, or more than max_staleness_sec after it was added,
+    whichever comes first.
+    """
+
+    def __init__(self, max_size: int, max_staleness_sec: int):
+        self.max_size = max_size
+        self.max_staleness_sec = max_staleness_sec
+        self._entries: OrderedDict[str, _CacheEntry] = OrderedDict()
+        self._hashes_by_client_id: Dict[str, Set[str]] = {}
+        self._hashes_by_session_handle: Dict[str, Set[str]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, token: str) -> Optional[_CacheEntry]:
+        token_hash = _hash_token(token)
+        with self._lock:
+            entry = self._entries.get(token_hash)
+            if entry is None:
+                return None
+            if entry.expires_at <= get_timestamp_ms():
+                self._remove(token_hash)
+                return None
+            self._entries.move_to_end(token_hash)
+            return entry
+
+    def put(self, token: str, payload: Dict[str, Any]) -> Optional[_CacheEntry]:
+        expires_at = get_timestamp_ms() + self.max_staleness_sec * 1000
+        exp = payload.get("exp")
+        if isinstance(exp, (int, float)):
+            expires_at = min(expires_at, int(exp * 1000))
+        if expires_at <= get_timestamp_ms():
+            return None
+
+        token_hash = _hash_token(token)
+        entry = _CacheEntry(payload, expires_at)
+        with self._lock:
+            self._remove(token_hash)
+            self._entries[token_hash] = entry
+            client_id = payload.get("client_id")
+            if isinstance(client_id, str):
+                self._hashes_by_client_id.setdefault(client_id, set()).add(token_hash)
+            session_handle = payload.get("sessionHandle")
+            if isinstance(session_handle, str):
+                self._hashes_by_session_handle.setdefault(session_handle, set()).add(
+                    token_hash
+                )
+            while len(self._entries) > self.max_size:
+                self._remove(next(iter(self._entries)))
+        return entry
+
+    def evict_token(self, token: str):
+        with self._lock:
+            self._remove(_hash_token(token))
+
+    def evict_client_id(self, client_id: str):
+        with self._lock:
+            for token_hash in list(self._hashes_by_client_id.get(client_id, ())):
+                self._remove(token_hash)
+
+    def evict_session_handle(self, session_handle: str):
+        with self._lock:
+            for token_hash in list(
+                self._hashes_by_session_handle.get(session_handle, ())
+            ):
+                self._remove(token_hash)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._hashes_by_client_id.clear()
+            self._hashes_by_session_handle.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _remove(self, token_hash: str):
+        entry = self._entries.pop(token_hash, None)
+        if entry is None:
+            return
+        for index, key in (
+            (self._hashes_by_client_id, entry.payload.get("client_id")),
+            (self._hashes_by_session_handle, entry.payload.get("sessionHandle")),
+        ):
+            hashes = index.get(key) if isinstance(key, str) else None
+            if hashes is not None:
+                hashes.discard(token_hash)
+                if len(hashes) == 0:
+                    del index[key]
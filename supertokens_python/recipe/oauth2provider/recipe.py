@@ -81,10 +81,14 @@ class OAuth2ProviderRecipe(RecipeModule):
         recipe_id: str,
         app_info: AppInfo,
         override: Union[InputOverrideConfig, None] = None,
+        access_token_cache_size: Union[int, None] = None,
+        access_token_cache_max_staleness_sec: Union[int, None] = None,
     ) -> None:
         super().__init__(recipe_id, app_info)
         self.config: OAuth2ProviderConfig = validate_and_normalise_user_input(
             override,
+            access_token_cache_size,
+            access_token_cache_max_staleness_sec,
         )
 
         from .recipe_implementation import RecipeImplementation
@@ -95,6 +99,7 @@ class OAuth2ProviderRecipe(RecipeModule):
             self.get_default_access_token_payload,
             self.get_default_id_token_payload,
             self.get_default_user_info_payload,
+            self.config,
         )
         self.recipe_implementation: RecipeInterface = (
             self.config.override.functions(recipe_implementation)
@@ -269,6 +274,8 @@ class OAuth2ProviderRecipe(RecipeModule):
     @staticmethod
     def init(
         override: Union[InputOverrideConfig, None] = None,
+        access_token_cache_size: Union[int, None] = None,
+        access_token_cache_max_staleness_sec: Union[int, None] = None,
     ):
         def func(app_info: AppInfo):
             if OAuth2ProviderRecipe.__instance is None:
@@ -276,6 +283,8 @@ class OAuth2ProviderRecipe(RecipeModule):
                     OAuth2ProviderRecipe.recipe_id,
                     app_info,
                     override,
+                    access_token_cache_size,
+                    access_token_cache_max_staleness_sec,
                 )
 
                 return OAuth2ProviderRecipe.__instance
@@ -15,11 +15,10 @@ from __future__ import annotations
 
 import base64
 import urllib.parse
+from copy import deepcopy
 from typing import TYPE_CHECKING, Any, Dict, List, Optional, Union
 from urllib.parse import parse_qs, urlparse
 
-import jwt
-
 from supertokens_python.normalised_url_path import NormalisedURLPath
 from supertokens_python.recipe.accountlinking.recipe import AccountLinkingRecipe
 from supertokens_python.recipe.openid.recipe import OpenIdRecipe
@@ -31,6 +30,7 @@ from supertokens_python.recipe.session.jwt import (
 from supertokens_python.recipe.session.recipe import SessionRecipe
 from supertokens_python.types import RecipeUserId, User
 
+from .access_token_cache import ValidatedOAuth2TokenCache
 from .interfaces import (
     ActiveTokenResponse,
     ConsentRequestResponse,
@@ -65,6 +65,8 @@ if TYPE_CHECKING:
     from supertokens_python import AppInfo
     from supertokens_python.querier import Querier
 
+    from .utils import OAuth2ProviderConfig
+
 
 def get_updated_redirect_to(app_info: AppInfo, redirect_to: str) -> str:
     return redirect_to.replace(
@@ -82,6 +84,7 @@ class RecipeImplementation(RecipeInterface):
         get_default_access_token_payload: PayloadBuilderFunction,
         get_default_id_token_payload: PayloadBuilderFunction,
         get_default_user_info_payload: UserInfoBuilderFunction,
+        config: OAuth2ProviderConfig,
     ):
         super().__init__()
         self.querier = querier
@@ -89,6 +92,12 @@ class RecipeImplementation(RecipeInterface):
         self._get_default_access_token_payload = get_default_access_token_payload
         self._get_default_id_token_payload = get_default_id_token_payload
         self._get_default_user_info_payload = get_default_user_info_payload
+        self.access_token_cache: Optional[ValidatedOAuth2TokenCache] = None
+        if config.access_token_cache_size > 0:
+            self.access_token_cache = ValidatedOAuth2TokenCache(
+                config.access_token_cache_size,
+                config.access_token_cache_max_staleness_sec,
+            )
 
     async def get_login_request(
         self, challenge: str, user_context: Dict[str, Any]
@@ -640,38 +649,17 @@ class RecipeImplementation(RecipeInterface):
         check_database: Optional[bool],
         user_context: Dict[str, Any],
     ) -> ValidatedAccessTokenResponse:
-        access_token_obj = parse_jwt_without_signature_verification(token)
-
-        # Verify token signature using session recipe's JWKS
-        session_recipe = SessionRecipe.get_instance()
-        matching_keys = get_latest_keys(session_recipe.config, access_token_obj.kid)
-        err: Optional[Exception] = None
-
-        payload: Dict[str, Any] = {}
-
-        for matching_key in matching_keys:
-            err = None
-            try:
-                payload = jwt.decode(
-                    token,
-                    matching_key.key,
-                    algorithms=["RS256"],
-                    options={
-                        "verify_signature": True,
-                        "verify_exp": True,
-                        "verify_aud": False,
-                    },
-                )
-            except Exception as e:
-                err = e
-                continue
-            break
-
-        if err is not None:
-            raise err
-
-        if payload.get("stt") != 1:
-            raise Exception("Wrong token type")
+        cache_entry = (
+            self.access_token_cache.get(token)
+            if self.access_token_cache is not None
+            else None
+        )
+        if cache_entry is not None:
+            payload = cache_entry.payload
+        else:
+            payload = await self._verify_oauth2_access_token(token)
+            if self.access_token_cache is not None:
+                cache_entry = self.access_token_cache.put(token, deepcopy(payload))
 
         if requirements is not None and requirements.client_id is not None:
             if payload.get("client_id") != requirements.client_id:
@@ -695,7 +683,9 @@ class RecipeImplementation(RecipeInterface):
             if requirements.audience not in aud:
                 raise Exception("The token doesn't belong to the specified audience")
 
-        if check_database:
+        if check_database and (
+            cache_entry is None or not cache_entry.is_active_in_core
+        ):
             response = await self.querier.send_post_request(
                 NormalisedURLPath("/recipe/oauth/introspect"),
                 {
@@ -705,9 +695,56 @@ class RecipeImplementation(RecipeInterface):
             )
 
             if response.get("active") is not True:
+                if self.access_token_cache is not None:
+                    self.access_token_cache.evict_token(token)
                 raise Exception("The token is expired, invalid or has been revoked")
 
-        return ValidatedAccessTokenResponse(payload=payload)
+            if cache_entry is not None:
+                cache_entry.is_active_in_core = True
+
+        # Callers may modify the payload they get (including the scp and aud
+        # lists), so a cached one is copied
+        return ValidatedAccessTokenResponse(payload=deepcopy(payload))
+
+    async def _verify_oauth2_access_token(self, token: str) -> Dict[str, Any]:
+        import jwt
+
+        access_token_obj = parse_jwt_without_signature_verification(token)
+
+        # Verify token signature using session recipe's JWKS
+        session_recipe = SessionRecipe.get_instance()
+        matching_keys = await get_latest_keys(
+            session_recipe.config, access_token_obj.kid
+        )
+        err: Optional[Exception] = None
+
+        payload: Dict[str, Any] = {}
+
+        for matching_key in matching_keys:
+            err = None
+            try:
+                payload = jwt.decode(
+                    token,
+                    matching_key.key,
+                    algorithms=["RS256"],
+                    options={
+                        "verify_signature": True,
+                        "verify_exp": True,
+                        "verify_aud": False,
+                    },
+                )
+            except Exception as e:
+                err = e
+                continue
+            break
+
+        if err is not None:
+            raise err
+
+        if payload.get("stt") != 1:
+            raise Exception("Wrong token type")
+
+        return payload
 
     async def get_requested_scopes(
         self,
@@ -838,6 +875,34 @@ class RecipeImplementation(RecipeInterface):
                 error_description=str(res.get("errorDescription")),
             )
 
+        if self.access_token_cache is not None:
+            if params.token.startswith("st_rt"):
+                # Revoking a refresh token also revokes the access tokens
+                # issued with it, which can't be told apart from the other
+                # tokens of the client
+                client_id: Optional[str] = None
+                if isinstance(params, RevokeTokenUsingClientIDAndClientSecret):
+                    client_id = params.client_id
+                else:
+                    try:
+                        client_id = (
+                            base64.b64decode(
+                                params.authorization_header.replace(
+                                    "Basic ", ""
+                                ).strip()
+                            )
+                            .decode()
+                            .split(":")[0]
+                        )
+                    except Exception:
+                        client_id = None
+                if client_id is not None:
+                    self.access_token_cache.evict_client_id(client_id)
+                else:
+                    self.access_token_cache.clear()
+            else:
+                self.access_token_cache.evict_token(params.token)
+
         return RevokeTokenOkResponse()
 
     async def revoke_tokens_by_client_id(
@@ -850,6 +915,8 @@ class RecipeImplementation(RecipeInterface):
             {"client_id": client_id},
             user_context=user_context,
         )
+        if self.access_token_cache is not None:
+            self.access_token_cache.evict_client_id(client_id)
 
     async def revoke_tokens_by_session_handle(
         self,
@@ -861,6 +928,8 @@ class RecipeImplementation(RecipeInterface):
             {"sessionHandle": session_handle},
             user_context=user_context,
         )
+        if self.access_token_cache is not None:
+            self.access_token_cache.evict_session_handle(session_handle)
 
     async def introspect_token(
         self,
@@ -42,13 +42,40 @@ class OverrideConfig:
 
 
 class OAuth2ProviderConfig:
-    def __init__(self, override: Union[OverrideConfig, None] = None):
+    def __init__(
+        self,
+        override: Union[OverrideConfig, None] = None,
+        access_token_cache_size: int = 0,
+        access_token_cache_max_staleness_sec: int = 60,
+    ):
         self.override = override
+        self.access_token_cache_size = access_token_cache_size
+        self.access_token_cache_max_staleness_sec = access_token_cache_max_staleness_sec
 
 
 def validate_and_normalise_user_input(
     override: Union[InputOverrideConfig, None] = None,
+    access_token_cache_size: Union[int, None] = None,
+    access_token_cache_max_staleness_sec: Union[int, None] = None,
 ):
-    if override is None:
-        return OAuth2ProviderConfig(OverrideConfig())
-    return OAuth2ProviderConfig(OverrideConfig(override.functions, override.apis))
+    if access_token_cache_size is None:
+        access_token_cache_size = 0  # disabled
+
+    if access_token_cache_size < 0:
+        raise ValueError("access_token_cache_size must be a non-negative integer")
+
+    if access_token_cache_max_staleness_sec is None:
+        access_token_cache_max_staleness_sec = 60
+
+    if access_token_cache_max_staleness_sec <= 0:
+        raise ValueError(
+            "access_token_cache_max_staleness_sec must be a positive integer"
+        )
+
+    return OAuth2ProviderConfig(
+        OverrideConfig()
+        if override is None
+        else OverrideConfig(override.functions, override.apis),
+        access_token_cache_size,
+        access_token_cache_max_staleness_sec,
+    )
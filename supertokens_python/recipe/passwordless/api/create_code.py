@@ -13,9 +13,6 @@
 # under the License.
 from typing import Any, Dict, Union
 
-import phonenumbers  # type: ignore
-from phonenumbers import format_number, parse
-
 from supertokens_python.auth_utils import (
     load_session_in_auth_api_if_needed,  # type: ignore
 )
@@ -39,6 +36,12 @@ async def create_code(
     api_options: APIOptions,
     user_context: Dict[str, Any],
 ):
+    from phonenumbers import (  # type: ignore
+        PhoneNumberFormat,
+        format_number,
+        parse,
+    )
+
     if api_implementation.disable_create_code_post:
         return None
 
@@ -110,7 +113,7 @@ async def create_code(
             return api_options.response
         try:
             phone_number_formatted: str = format_number(
-                parse(phone_number, None), phonenumbers.PhoneNumberFormat.E164
+                parse(phone_number, None), PhoneNumberFormat.E164
             )  # type: ignore
             phone_number = phone_number_formatted
         except Exception:
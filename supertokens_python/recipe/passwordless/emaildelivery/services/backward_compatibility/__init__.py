@@ -18,8 +18,6 @@ import json
 from os import environ
 from typing import Any, Dict
 
-from httpx import AsyncClient, HTTPStatusError
-
 from supertokens_python.ingredients.emaildelivery import EmailDeliveryInterface
 from supertokens_python.logger import log_debug_message
 from supertokens_python.recipe.passwordless.types import (
@@ -32,6 +30,8 @@ from supertokens_python.utils import handle_httpx_client_exceptions
 async def create_and_send_email_with_supertokens_service(
     app_info: AppInfo, input_: PasswordlessLoginEmailTemplateVars
 ) -> None:
+    from httpx import AsyncClient, HTTPStatusError
+
     if ("SUPERTOKENS_ENV" in environ) and (environ["SUPERTOKENS_ENV"] == "testing"):
         return
 
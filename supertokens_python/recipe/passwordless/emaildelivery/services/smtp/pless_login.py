@@ -13,15 +13,13 @@
 # under the License.
 from __future__ import annotations
 
-from string import Template
 from typing import TYPE_CHECKING, Union
 
+from supertokens_python.ingredients.emaildelivery.templates import compile_html_template
 from supertokens_python.ingredients.emaildelivery.types import EmailContent
 from supertokens_python.supertokens import Supertokens
 from supertokens_python.utils import humanize_time
 
-from .pless_login_email import magic_link_body, otp_and_magic_link_body, otp_body
-
 if TYPE_CHECKING:
     from supertokens_python.recipe.passwordless.interfaces import (
         PasswordlessLoginEmailTemplateVars,
@@ -50,6 +48,9 @@ def get_pless_email_html(
     url_with_link_code: Union[str, None] = None,
     user_input_code: Union[str, None] = None,
 ):
+    # The templates are only loaded the first time an email is sent
+    from .pless_login_email import magic_link_body, otp_and_magic_link_body, otp_body
+
     if (user_input_code is not None) and (url_with_link_code is not None):
         html_template = otp_and_magic_link_body
     elif user_input_code is not None:
@@ -59,7 +60,7 @@ def get_pless_email_html(
     else:
         raise Exception("This should never be thrown.")
 
-    return Template(html_template).substitute(
+    return compile_html_template(html_template).render(
         appname=app_name,
         time=code_lifetime,
         toEmail=email,
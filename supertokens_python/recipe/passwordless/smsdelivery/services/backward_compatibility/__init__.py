@@ -16,8 +16,6 @@ import json
 from os import environ
 from typing import Any, Dict
 
-from httpx import AsyncClient, HTTPStatusError, Response
-
 from supertokens_python.ingredients.smsdelivery.services.supertokens import (
     SUPERTOKENS_SMS_SERVICE_URL,
 )
@@ -32,6 +30,8 @@ from ....types import PasswordlessLoginSMSTemplateVars
 async def create_and_send_sms_using_supertokens_service(
     app_info: AppInfo, input_: PasswordlessLoginSMSTemplateVars
 ):
+    from httpx import AsyncClient, HTTPStatusError, Response
+
     if ("SUPERTOKENS_ENV" in environ) and (environ["SUPERTOKENS_ENV"] == "testing"):
         return
 
@@ -15,8 +15,6 @@
 
 from typing import Any, Dict
 
-from httpx import AsyncClient
-
 from supertokens_python.ingredients.smsdelivery.services.supertokens import (
     SUPERTOKENS_SMS_SERVICE_URL,
 )
@@ -37,6 +35,8 @@ class SuperTokensSMSService(SMSDeliveryInterface[PasswordlessLoginSMSTemplateVar
         template_vars: PasswordlessLoginSMSTemplateVars,
         user_context: Dict[str, Any],
     ) -> None:
+        from httpx import AsyncClient
+
         supertokens = Supertokens.get_instance()
         app_name = supertokens.app_info.app_name
 
@@ -16,8 +16,6 @@ from __future__ import annotations
 
 from typing import Any, Callable, Dict, TypeVar, Union
 
-from twilio.rest import Client  # type: ignore
-
 from supertokens_python.ingredients.smsdelivery.services.twilio import (
     normalize_twilio_settings,
 )
@@ -45,6 +43,8 @@ class TwilioService(SMSDeliveryInterface[PasswordlessLoginSMSTemplateVars]):
             Callable[[TwilioServiceInterface[_T]], TwilioServiceInterface[_T]], None
         ] = None,
     ) -> None:
+        from twilio.rest import Client  # type: ignore
+
         self.config = normalize_twilio_settings(twilio_settings)
         otps = twilio_settings.opts if twilio_settings.opts else {}
         self.twilio_client = Client(  # type: ignore
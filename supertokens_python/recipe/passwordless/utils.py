@@ -43,8 +43,6 @@ if TYPE_CHECKING:
 
 from re import fullmatch
 
-from phonenumbers import is_valid_number, parse  # type: ignore
-
 from supertokens_python.recipe.passwordless.emaildelivery.services.backward_compatibility import (
     BackwardCompatibilityService,
 )
@@ -54,6 +52,8 @@ from supertokens_python.recipe.passwordless.smsdelivery.services.backward_compat
 
 
 async def default_validate_phone_number(value: str, _tenant_id: str):
+    from phonenumbers import is_valid_number, parse  # type: ignore
+
     try:
         parsed_phone_number: Any = parse(value, None)
         if not is_valid_number(parsed_phone_number):
@@ -53,6 +53,8 @@ def init(
     use_dynamic_access_token_signing_key: Union[bool, None] = None,
     expose_access_token_to_frontend_in_cookie_based_auth: Union[bool, None] = None,
     jwks_refresh_interval_sec: Union[int, None] = None,
+    access_token_cache_size: Union[int, None] = None,
+    access_token_cache_ttl_sec: Union[int, None] = None,
 ) -> Callable[[AppInfo], RecipeModule]:
     return SessionRecipe.init(
         cookie_domain,
@@ -68,4 +70,6 @@ def init(
         use_dynamic_access_token_signing_key,
         expose_access_token_to_frontend_in_cookie_based_auth,
         jwks_refresh_interval_sec,
+        access_token_cache_size,
+        access_token_cache_ttl_sec,
     )
@@ -13,10 +13,8 @@
 # under the License.
 from __future__ import annotations
 
-from typing import Any, Dict, Optional, Union
-
-import jwt
-from jwt.exceptions import DecodeError
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Dict, Optional, Union
 
 from supertokens_python.logger import log_debug_message
 from supertokens_python.recipe.multitenancy.constants import DEFAULT_TENANT_ID
@@ -24,9 +22,20 @@ from supertokens_python.recipe.session.jwks import get_latest_keys
 from supertokens_python.recipe.session.utils import SessionConfig
 from supertokens_python.utils import get_timestamp_ms
 
+from .access_token_cache import VerifiedAccessTokenCache
 from .exceptions import raise_try_refresh_token_exception
 from .jwt import ParsedJWTInfo
 
+if TYPE_CHECKING:
+    from jwt.algorithms import RSAAlgorithm
+
+
+@lru_cache(maxsize=1)
+def get_rs256() -> RSAAlgorithm:
+    from jwt.algorithms import RSAAlgorithm
+
+    return RSAAlgorithm(RSAAlgorithm.SHA256)
+
 
 def sanitize_string(s: Any) -> Union[str, None]:
     if s == "":
@@ -45,90 +54,28 @@ def sanitize_number(n: Any) -> Union[Union[int, float], None]:
     return None
 
 
-def get_info_from_access_token(
+async def get_info_from_access_token(
     config: SessionConfig,
     jwt_info: ParsedJWTInfo,
     do_anti_csrf_check: bool,
+    access_token_cache: Optional[VerifiedAccessTokenCache] = None,
 ):
     try:
-        payload: Optional[Dict[str, Any]] = None
-        decode_algo = (
-            jwt_info.parsed_header["alg"]
-            if jwt_info.parsed_header is not None
-            else "RS256"
-        )
-
-        if jwt_info.version >= 3:
-            matching_keys = get_latest_keys(config, jwt_info.kid)
-            payload = jwt.decode(  # type: ignore
-                jwt_info.raw_token_string,
-                matching_keys[0].key,  # type: ignore
-                algorithms=[decode_algo],
-                options={"verify_signature": True, "verify_exp": True},
-            )
-        else:
-            # It won't have kid. So we'll have to try the token against all the keys from all the jwk_clients
-            # If any of them work, we'll use that payload
-            for k in get_latest_keys(config):
-                try:
-                    payload = jwt.decode(  # type: ignore
-                        jwt_info.raw_token_string,
-                        k.key,  # type: ignore
-                        algorithms=[decode_algo],
-                        options={"verify_signature": True, "verify_exp": True},
-                    )
-                    break
-                except DecodeError:
-                    pass
-
-        if payload is None:
-            raise DecodeError("Could not decode the token")
-
-        validate_access_token_structure(payload, jwt_info.version)
-
-        if jwt_info.version == 2:
-            user_id = sanitize_string(payload.get("userId"))
-            expiry_time = sanitize_number(payload.get("expiryTime"))
-            time_created = sanitize_number(payload.get("timeCreated"))
-            user_data = payload.get("userData")
-        else:
-            user_id = sanitize_string(payload.get("sub"))
-            expiry_time = sanitize_number(payload.get("exp", 0) * 1000)
-            time_created = sanitize_number(payload.get("iat", 0) * 1000)
-            user_data = payload
-
-        session_handle = sanitize_string(payload.get("sessionHandle"))
-        recipe_user_id = sanitize_string(payload.get("rsub", user_id))
-        refresh_token_hash_1 = sanitize_string(payload.get("refreshTokenHash1"))
-        parent_refresh_token_hash_1 = sanitize_string(
-            payload.get("parentRefreshTokenHash1")
-        )
-        anti_csrf_token = sanitize_string(payload.get("antiCsrfToken"))
-        tenant_id = DEFAULT_TENANT_ID
-
-        if jwt_info.version >= 4:
-            tenant_id = sanitize_string(payload.get("tId"))
-
-        if anti_csrf_token is None and do_anti_csrf_check:
+        info = None
+        if access_token_cache is not None:
+            info = access_token_cache.get(jwt_info)
+        if info is None:
+            info = await verify_access_token_and_get_info(config, jwt_info)
+            if access_token_cache is not None:
+                access_token_cache.put(jwt_info, info)
+
+        if info["antiCsrfToken"] is None and do_anti_csrf_check:
             raise Exception("Access token does not contain the anti-csrf token")
 
-        assert isinstance(expiry_time, (float, int))
-
-        if expiry_time < get_timestamp_ms():
+        if info["expiryTime"] < get_timestamp_ms():
             raise Exception("Access token expired")
 
-        return {
-            "sessionHandle": session_handle,
-            "userId": user_id,
-            "refreshTokenHash1": refresh_token_hash_1,
-            "parentRefreshTokenHash1": parent_refresh_token_hash_1,
-            "userData": user_data,
-            "antiCsrfToken": anti_csrf_token,
-            "expiryTime": expiry_time,
-            "timeCreated": time_created,
-            "tenantId": tenant_id,
-            "recipeUserId": recipe_user_id,
-        }
+        return info
     except Exception as e:
         log_debug_message(
             "getInfoFromAccessToken: Returning TRY_REFRESH_TOKEN because access token validation failed - %s",
@@ -137,6 +84,83 @@ def get_info_from_access_token(
         raise_try_refresh_token_exception(e)
 
 
+async def verify_access_token_and_get_info(
+    config: SessionConfig, jwt_info: ParsedJWTInfo
+) -> Dict[str, Any]:
+    import jwt
+    from jwt.exceptions import DecodeError
+    from jwt.utils import base64url_decode
+
+    payload: Optional[Dict[str, Any]] = None
+    decode_algo = (
+        jwt_info.parsed_header["alg"] if jwt_info.parsed_header is not None else "RS256"
+    )
+
+    if jwt_info.version >= 3:
+        matching_keys = await get_latest_keys(config, jwt_info.kid)
+        payload = jwt.decode(  # type: ignore
+            jwt_info.raw_token_string,
+            matching_keys[0].key,  # type: ignore
+            algorithms=[decode_algo],
+            options={"verify_signature": True, "verify_exp": True},
+        )
+    else:
+        # It won't have kid. So we'll have to try the token against all the keys from all the jwk_clients
+        # If any of them work, we'll use that payload.
+        # V2 tokens always use RS256 and have no exp claim, so we only need to check the
+        # signature against each key instead of decoding the whole token every time.
+        signing_input = (jwt_info.header + "." + jwt_info.raw_payload).encode()
+        signature = base64url_decode(jwt_info.signature)
+        rs256 = get_rs256()
+        for k in await get_latest_keys(config):
+            if rs256.verify(signing_input, k.key, signature):  # type: ignore
+                payload = jwt_info.payload
+                break
+
+    if payload is None:
+        raise DecodeError("Could not decode the token")
+
+    validate_access_token_structure(payload, jwt_info.version)
+
+    if jwt_info.version == 2:
+        user_id = sanitize_string(payload.get("userId"))
+        expiry_time = sanitize_number(payload.get("expiryTime"))
+        time_created = sanitize_number(payload.get("timeCreated"))
+        user_data = payload.get("userData")
+    else:
+        user_id = sanitize_string(payload.get("sub"))
+        expiry_time = sanitize_number(payload.get("exp", 0) * 1000)
+        time_created = sanitize_number(payload.get("iat", 0) * 1000)
+        user_data = payload
+
+    session_handle = sanitize_string(payload.get("sessionHandle"))
+    recipe_user_id = sanitize_string(payload.get("rsub", user_id))
+    refresh_token_hash_1 = sanitize_string(payload.get("refreshTokenHash1"))
+    parent_refresh_token_hash_1 = sanitize_string(
+        payload.get("parentRefreshTokenHash1")
+    )
+    anti_csrf_token = sanitize_string(payload.get("antiCsrfToken"))
+    tenant_id = DEFAULT_TENANT_ID
+
+    if jwt_info.version >= 4:
+        tenant_id = sanitize_string(payload.get("tId"))
+
+    assert isinstance(expiry_time, (float, int))
+
+    return {
+        "sessionHandle": session_handle,
+        "userId": user_id,
+        "refreshTokenHash1": refresh_token_hash_1,
+        "parentRefreshTokenHash1": parent_refresh_token_hash_1,
+        "userData": user_data,
+        "antiCsrfToken": anti_csrf_token,
+        "expiryTime": expiry_time,
+        "timeCreated": time_created,
+        "tenantId": tenant_id,
+        "recipeUserId": recipe_user_id,
+    }
+
+
 def validate_access_token_structure(payload: Dict[str, Any], version: int) -> None:
     if version >= 5:
         if (
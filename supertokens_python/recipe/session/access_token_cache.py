@@ -0,0 +1,112 @@
+# Copyright (c) 2025, VRAI Labs and/or its affiliates. All rights reserved.
+#
+# This software is licensed under the Apache License, Version 2.0 (the
+# "License") as published by the Apache Software Foundation.
+#
+# You may not use this file except in compliance with the License. You may
+# obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from copy import deepcopy
+from typing import Any, Dict, List, Optional, Set
+
+from supertokens_python.utils import get_timestamp_ms
+
+from .jwt import ParsedJWTInfo
+
+
+class _CacheEntry:
+    def __init__(self, raw_token: str, info: Dict[str, Any], expires_at: int):
+        self.raw_token = raw_token
+        self.info = info
+        self.expires_at = expires_at
+
+
+class VerifiedAccessTokenCache:
+    """
+    A bounded LRU cache of access tokens that have already passed signature
+    verification, keyed by the token signature. An entry is never served after
+    the token itself expires, or after ttl_sec, whichever comes first.
+    """
+
+    def __init__(self, max_size: int, ttl_sec: int):
+        self.max_size = max_size
+        self.ttl_sec = ttl_sec
+        self._entries: OrderedDict[str, _CacheEntry] = OrderedDict()
+        self._signatures_by_session_handle: Dict[str, Set[str]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, jwt_info: ParsedJWTInfo) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            entry = self._entries.get(jwt_info.signature)
+            if entry is None:
+                return None
+            # The signature alone is not enough, since it could be combined with
+            # a different header or payload.
+            if entry.raw_token != jwt_info.raw_token_string:
+                return None
+            if entry.expires_at <= get_timestamp_ms():
+                self._remove(jwt_info.signature)
+                return None
+            self._entries.move_to_end(jwt_info.signature)
+            # The payload ends up in the session, where claims are added to it
+            # and user code may change it, so each caller gets its own copy
+            return deepcopy(entry.info)
+
+    def put(self, jwt_info: ParsedJWTInfo, info: Dict[str, Any]):
+        expires_at = min(
+            int(info["expiryTime"]), get_timestamp_ms() + self.ttl_sec * 1000
+        )
+        if expires_at <= get_timestamp_ms():
+            return
+        with self._lock:
+            self._remove(jwt_info.signature)
+            self._entries[jwt_info.signature] = _CacheEntry(
+                jwt_info.raw_token_string, deepcopy(info), expires_at
+            )
+            session_handle = info.get("sessionHandle")
+            if session_handle is not None:
+                self._signatures_by_session_handle.setdefault(
+                    session_handle, set()
+                ).add(jwt_info.signature)
+            while len(self._entries) > self.max_size:
+                oldest_signature = next(iter(self._entries))
+                self._remove(oldest_signature)
+
+    def evict_session_handles(self, session_handles: List[str]):
+        with self._lock:
+            for session_handle in session_handles:
+                signatures = self._signatures_by_session_handle.pop(
+                    session_handle, set()
+                )
+                for signature in signatures:
+                    self._entries.pop(signature, None)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._signatures_by_session_handle.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _remove(self, signature: str):
+        entry = self._entries.pop(signature, None)
+        if entry is None:
+            return
+        session_handle = entry.info.get("sessionHandle")
+        if session_handle is None:
+            return
+        signatures = self._signatures_by_session_handle.get(session_handle)
+        if signatures is not None:
+            signatures.discard(signature)
+            if len(signatures) == 0:
+                del self._signatures_by_session_handle[session_handle]
@@ -50,10 +50,11 @@ if TYPE_CHECKING:
         TokenType,
     )
 
-from json import dumps
+from base64 import b64encode
 from typing import Any, Dict
 
-from supertokens_python.utils import get_header, get_timestamp_ms, utf_base64encode
+from supertokens_python.json_backend import json_dumps_bytes
+from supertokens_python.utils import get_header, get_timestamp_ms
 
 
 def build_front_token(
@@ -62,9 +63,9 @@ def build_front_token(
     if access_token_payload is None:
         access_token_payload = {}
     token_info = {"uid": user_id, "ate": at_expiry, "up": access_token_payload}
-    return utf_base64encode(
-        dumps(token_info, separators=(",", ":"), sort_keys=True), urlsafe=False
-    )
+    return b64encode(
+        json_dumps_bytes(token_info, sort_keys=True, ensure_ascii=True)
+    ).decode("utf-8")
 
 
 def _set_front_token_in_headers(
@@ -12,31 +12,72 @@
 # License for the specific language governing permissions and limitations
 # under the License.
 
+from __future__ import annotations
+
+import asyncio
 from os import environ
-from typing import List, Optional
+from typing import TYPE_CHECKING, Dict, List, Optional
 
-import requests
-from jwt import PyJWK, PyJWKSet
 from typing_extensions import TypedDict
 
 from supertokens_python.logger import log_debug_message
 from supertokens_python.querier import Querier
 from supertokens_python.recipe.session.utils import SessionConfig
-from supertokens_python.utils import RWLockContext, RWMutex, get_timestamp_ms
+from supertokens_python.single_flight import SingleFlight
+from supertokens_python.utils import get_timestamp_ms
+
+if TYPE_CHECKING:
+    from jwt import PyJWK
 
 
 class JWKSConfigType(TypedDict):
     request_timeout: int
+    background_refresh_ratio: float
 
 
 JWKSConfig: JWKSConfigType = {
     "request_timeout": 10000,  # 10s
+    # Once this fraction of jwks_refresh_interval_sec has passed, the keys are
+    # refreshed in the background while the cached keys keep being served.
+    "background_refresh_ratio": 0.8,
 }
 
 
-class CachedKeys:
+def get_key_created_time(kid: Optional[str]) -> Optional[int]:
+    # Keys generated by the core have kids like "d-<created time in ms>" (dynamic)
+    # or "s-<created time in ms>" (static)
+    if kid is None or len(kid) < 3 or kid[1] != "-" or kid[0] not in ("d", "s"):
+        return None
+    created_time = kid[2:]
+    if not created_time.isdigit():
+        return None
+    return int(created_time)
+
+
+class KeyStore:
+    """
+    The keys from the last JWKS fetch, indexed by kid. Each PyJWK already holds
+    the parsed public key object, so verifying a token never re-parses the JWK.
+    """
+
     def __init__(self, keys: List[PyJWK], refresh_interval_sec: int):
         self.keys = keys
+        self.keys_by_kid: Dict[str, PyJWK] = {}
+        self.key_created_times: Dict[str, int] = {}
+        for key in keys:
+            kid: Optional[str] = key.key_id  # type: ignore
+            if kid is None:
+                continue
+            self.keys_by_kid[kid] = key
+            created_time = get_key_created_time(kid)
+            if created_time is not None:
+                self.key_created_times[kid] = created_time
+
+        self.oldest_key_created_time: Optional[int] = (
+            min(self.key_created_times.values())
+            if len(self.key_created_times) > 0
+            else None
+        )
         self.last_refresh_time = get_timestamp_ms()
         self.refresh_interval_sec = refresh_interval_sec
 
@@ -46,20 +87,42 @@ class CachedKeys:
             < self.refresh_interval_sec * 1000
         )
 
+    def is_due_for_background_refresh(self):
+        return (
+            get_timestamp_ms() - self.last_refresh_time
+            >= self.refresh_interval_sec * 1000 * JWKSConfig["background_refresh_ratio"]
+        )
+
+    def get_matching_keys(self, kid: Optional[str]) -> Optional[List[PyJWK]]:
+        if kid is None:
+            # return all keys since the token does not have a kid
+            return self.keys
+
+        key = self.keys_by_kid.get(kid)
+        if key is None:
+            return None
+        return [key]
+
 
-cached_keys: Optional[CachedKeys] = None
-mutex = RWMutex()
+key_store: Optional[KeyStore] = None
+
+# Concurrent misses are merged into a single in-flight fetch per event loop
+in_flight_fetches: SingleFlight[KeyStore] = SingleFlight(
+    lambda _, e: log_debug_message("Fetching JWKS failed: %s", e)
+)
+# The key of the fetch in in_flight_fetches, as there is one JWKS
+JWKS_FETCH_KEY = "jwks"
 
 
 # only for testing purposes
 def reset_jwks_cache():
-    with RWLockContext(mutex, read=False):
-        global cached_keys
-        cached_keys = None
+    global key_store
+    key_store = None
+    in_flight_fetches.cancel()
 
 
-def get_cached_keys() -> Optional[List[PyJWK]]:
-    if cached_keys is not None:
+def get_fresh_key_store() -> Optional[KeyStore]:
+    if key_store is not None:
         # This means that we have valid JWKs for the given core path
         # We check if we need to refresh before returning
 
@@ -67,40 +130,31 @@ def get_cached_keys() -> Optional[List[PyJWK]]:
         # Note that this also means that the SDK will not try to query any other core (if there are multiple)
         # if it has a valid cache entry from one of the core URLs. It will only attempt to fetch
         # from the cores again after the entry in the cache is expired
-        if cached_keys.is_fresh():
-            return cached_keys.keys
+        if key_store.is_fresh():
+            return key_store
 
     return None
 
 
-def find_matching_keys(
-    keys: Optional[List[PyJWK]], kid: Optional[str]
-) -> Optional[List[PyJWK]]:
-    if kid is None or keys is None:
-        # return all keys since the token does not have a kid
-        return keys
-
-    # kid has been provided so filter the keys
-    matching_keys = [key for key in keys if key.key_id == kid]  # type: ignore
-    if len(matching_keys) > 0:
-        return matching_keys
+def get_cached_keys() -> Optional[List[PyJWK]]:
+    store = get_fresh_key_store()
+    if store is None:
+        return None
+    return store.keys
 
-    return None
 
+def get_key_store() -> Optional[KeyStore]:
+    """
+    Returns the keys from the last successful fetch, even if they are due for
+    a refresh.
+    """
+    return key_store
 
-def get_latest_keys(config: SessionConfig, kid: Optional[str] = None) -> List[PyJWK]:
-    global cached_keys
 
-    if environ.get("SUPERTOKENS_ENV") == "testing":
-        log_debug_message("Called find_jwk_client")
+async def fetch_and_cache_keys(config: SessionConfig) -> KeyStore:
+    from jwt import PyJWKSet
 
-    with RWLockContext(mutex, read=True):
-        matching_keys = find_matching_keys(get_cached_keys(), kid)
-        if matching_keys is not None:
-            if environ.get("SUPERTOKENS_ENV") == "testing":
-                log_debug_message("Returning JWKS from cache")
-            return matching_keys
-        # otherwise unknown kid, will continue to reload the keys
+    global key_store
 
     core_paths = Querier.get_instance().get_all_core_urls_for_path(
         "./.well-known/jwks.json"
@@ -112,36 +166,66 @@ def get_latest_keys(config: SessionConfig, kid: Optional[str] = None) -> List[Py
         )
 
     last_error: Exception = Exception("No valid JWKS found")
-
-    with RWLockContext(mutex, read=False):
-        # check again if the keys are in cache
-        # because another thread might have fetched the keys while this one was waiting for the lock
-        matching_keys = find_matching_keys(get_cached_keys(), kid)
-        if matching_keys is not None:
-            return matching_keys
-
-        for path in core_paths:
-            if environ.get("SUPERTOKENS_ENV") == "testing":
-                log_debug_message("Attempting to fetch JWKS from path: %s", path)
-
-            cached_jwks: Optional[List[PyJWK]] = None
-            try:
-                log_debug_message("Fetching jwk set from the configured uri")
-                with requests.get(
-                    path, timeout=JWKSConfig["request_timeout"] / 1000
-                ) as response:  # 5 second timeout
-                    response.raise_for_status()
-                    cached_jwks = PyJWKSet.from_dict(response.json()).keys  # type: ignore
-            except Exception as e:
-                last_error = e
-
-            if cached_jwks is not None:  # we found a valid JWKS
-                cached_keys = CachedKeys(cached_jwks, config.jwks_refresh_interval_sec)
-                log_debug_message("Returning JWKS from fetch")
-                matching_keys = find_matching_keys(get_cached_keys(), kid)
-                if matching_keys is not None:
-                    return matching_keys
-
-                raise Exception("No matching JWKS found")
+    client = Querier.get_http_client()
+
+    for path in core_paths:
+        if environ.get("SUPERTOKENS_ENV") == "testing":
+            log_debug_message("Attempting to fetch JWKS from path: %s", path)
+
+        try:
+            log_debug_message("Fetching jwk set from the configured uri")
+            response = await client.get(
+                path, timeout=JWKSConfig["request_timeout"] / 1000
+            )
+            response.raise_for_status()
+            keys: List[PyJWK] = PyJWKSet.from_dict(response.json()).keys  # type: ignore
+        except Exception as e:
+            last_error = e
+            continue
+
+        # we found a valid JWKS
+        key_store = KeyStore(keys, config.jwks_refresh_interval_sec)
+        return key_store
 
     raise last_error
+
+
+def get_or_start_fetch(config: SessionConfig) -> "asyncio.Task[KeyStore]":
+    return in_flight_fetches.get_or_start(
+        JWKS_FETCH_KEY, lambda: fetch_and_cache_keys(config)
+    )
+
+
+def refresh_in_background_if_needed(config: SessionConfig):
+    if key_store is None or not key_store.is_due_for_background_refresh():
+        return
+    if in_flight_fetches.is_in_flight(JWKS_FETCH_KEY):
+        return
+    log_debug_message("Refreshing JWKS in the background")
+    get_or_start_fetch(config)
+
+
+async def get_latest_keys(
+    config: SessionConfig, kid: Optional[str] = None
+) -> List[PyJWK]:
+    if environ.get("SUPERTOKENS_ENV") == "testing":
+        log_debug_message("Called find_jwk_client")
+
+    store = get_fresh_key_store()
+    matching_keys = store.get_matching_keys(kid) if store is not None else None
+    if matching_keys is not None:
+        if environ.get("SUPERTOKENS_ENV") == "testing":
+            log_debug_message("Returning JWKS from cache")
+        refresh_in_background_if_needed(config)
+        return matching_keys
+    # otherwise unknown kid or expired cache, will continue to reload the keys
+
+    store = await in_flight_fetches.run(
+        JWKS_FETCH_KEY, lambda: fetch_and_cache_keys(config)
+    )
+    log_debug_message("Returning JWKS from fetch")
+    matching_keys = store.get_matching_keys(kid)
+    if matching_keys is not None:
+        return matching_keys
+
+    raise Exception("No matching JWKS found")
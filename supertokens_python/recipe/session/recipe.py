@@ -93,6 +93,8 @@ class SessionRecipe(RecipeModule):
         use_dynamic_access_token_signing_key: Union[bool, None] = None,
         expose_access_token_to_frontend_in_cookie_based_auth: Union[bool, None] = None,
         jwks_refresh_interval_sec: Union[int, None] = None,
+        access_token_cache_size: Union[int, None] = None,
+        access_token_cache_ttl_sec: Union[int, None] = None,
     ):
         super().__init__(recipe_id, app_info)
         self.config = validate_and_normalise_user_input(
@@ -110,6 +112,8 @@ class SessionRecipe(RecipeModule):
             use_dynamic_access_token_signing_key,
             expose_access_token_to_frontend_in_cookie_based_auth,
             jwks_refresh_interval_sec,
+            access_token_cache_size,
+            access_token_cache_ttl_sec,
         )
         log_debug_message(
             "session init: anti_csrf: %s", self.config.anti_csrf_function_or_string
@@ -295,6 +299,8 @@ class SessionRecipe(RecipeModule):
         use_dynamic_access_token_signing_key: Union[bool, None] = None,
         expose_access_token_to_frontend_in_cookie_based_auth: Union[bool, None] = None,
         jwks_refresh_interval_sec: Union[int, None] = None,
+        access_token_cache_size: Union[int, None] = None,
+        access_token_cache_ttl_sec: Union[int, None] = None,
     ):
         def func(app_info: AppInfo):
             if SessionRecipe.__instance is None:
@@ -314,6 +320,8 @@ class SessionRecipe(RecipeModule):
                     use_dynamic_access_token_signing_key,
                     expose_access_token_to_frontend_in_cookie_based_auth,
                     jwks_refresh_interval_sec,
+                    access_token_cache_size,
+                    access_token_cache_ttl_sec,
                 )
                 return SessionRecipe.__instance
             raise_general_exception(
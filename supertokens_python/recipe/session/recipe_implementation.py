@@ -13,8 +13,8 @@
 # under the License.
 from __future__ import annotations
 
-import json
-from typing import TYPE_CHECKING, Any, Callable, Dict, Optional
+import asyncio
+from typing import TYPE_CHECKING, Any, Callable, Dict, Optional, Tuple
 
 from supertokens_python.logger import log_debug_message
 from supertokens_python.normalised_url_path import NormalisedURLPath
@@ -23,6 +23,7 @@ from supertokens_python.utils import resolve
 from ...types import MaybeAwaitable, RecipeUserId
 from . import session_functions
 from .access_token import validate_access_token_structure
+from .access_token_cache import VerifiedAccessTokenCache
 from .cookie_and_header import build_front_token
 from .exceptions import UnauthorisedError
 from .interfaces import (
@@ -59,6 +60,11 @@ class RecipeImplementation(RecipeInterface):  # pylint: disable=too-many-public-
         self.querier = querier
         self.config = config
         self.app_info = app_info
+        self.access_token_cache: Optional[VerifiedAccessTokenCache] = None
+        if config.access_token_cache_size > 0:
+            self.access_token_cache = VerifiedAccessTokenCache(
+                config.access_token_cache_size, config.access_token_cache_ttl_sec
+            )
 
     async def create_new_session(
         self,
@@ -115,41 +121,58 @@ class RecipeImplementation(RecipeInterface):  # pylint: disable=too-many-public-
         claim_validators: List[SessionClaimValidator],
         user_context: Dict[str, Any],
     ) -> ClaimsValidationResult:
-        access_token_payload_update = None
-        original_access_token_payload = json.dumps(access_token_payload)
-
+        # A claim is fetched once, even if several validators need it to be
+        # refetched, and the claims are fetched concurrently.
+        claims_to_fetch: Dict[str, Tuple[str, SessionClaim[Any]]] = {}
         for validator in claim_validators:
             log_debug_message(
                 "update_claims_in_payload_if_needed checking should_refetch for %s",
                 validator.id,
             )
-            if validator.claim is not None and validator.should_refetch(
-                access_token_payload, user_context
+            if (
+                validator.claim is not None
+                and validator.claim.key not in claims_to_fetch
+                and validator.should_refetch(access_token_payload, user_context)
             ):
                 log_debug_message(
                     "update_claims_in_payload_if_needed refetching for %s", validator.id
                 )
-                value = await resolve(
-                    validator.claim.fetch_value(
+                claims_to_fetch[validator.claim.key] = (validator.id, validator.claim)
+
+        tenant_id = access_token_payload.get("tId", DEFAULT_TENANT_ID)
+        values = await asyncio.gather(
+            *[
+                resolve(
+                    claim.fetch_value(
                         user_id,
                         recipe_user_id,
-                        access_token_payload.get("tId", DEFAULT_TENANT_ID),
+                        tenant_id,
                         access_token_payload,
                         user_context,
                     )
                 )
-                log_debug_message(
-                    "update_claims_in_payload_if_needed %s refetch result %s",
-                    validator.id,
-                    value,
+                for _, claim in claims_to_fetch.values()
+            ]
+        )
+
+        # add_to_payload_ is the only way the payload is changed here, so
+        # there is no need to compare it against the original
+        is_payload_updated = False
+        for (validator_id, claim), value in zip(claims_to_fetch.values(), values):
+            log_debug_message(
+                "update_claims_in_payload_if_needed %s refetch result %s",
+                validator_id,
+                value,
+            )
+            if value is not None:
+                access_token_payload = claim.add_to_payload_(
+                    access_token_payload, value, user_context
                 )
-                if value is not None:
-                    access_token_payload = validator.claim.add_to_payload_(
-                        access_token_payload, value, user_context
-                    )
+                is_payload_updated = True
 
-        if json.dumps(access_token_payload) != original_access_token_payload:
-            access_token_payload_update = access_token_payload
+        access_token_payload_update = (
+            access_token_payload if is_payload_updated else None
+        )
 
         invalid_claims = await validate_claims_in_payload(
             claim_validators, access_token_payload, user_context
@@ -324,9 +347,11 @@ class RecipeImplementation(RecipeInterface):  # pylint: disable=too-many-public-
     async def revoke_session(
         self, session_handle: str, user_context: Dict[str, Any]
     ) -> bool:
-        return await session_functions.revoke_session(
+        result = await session_functions.revoke_session(
             self, session_handle, user_context
         )
+        self.evict_from_access_token_cache([session_handle])
+        return result
 
     async def revoke_all_sessions_for_user(
         self,
@@ -336,7 +361,7 @@ class RecipeImplementation(RecipeInterface):  # pylint: disable=too-many-public-
         revoke_across_all_tenants: bool,
         user_context: Dict[str, Any],
     ) -> List[str]:
-        return await session_functions.revoke_all_sessions_for_user(
+        revoked_session_handles = await session_functions.revoke_all_sessions_for_user(
             self,
             user_id,
             revoke_sessions_for_linked_accounts,
@@ -344,6 +369,8 @@ class RecipeImplementation(RecipeInterface):  # pylint: disable=too-many-public-
             revoke_across_all_tenants,
             user_context,
         )
+        self.evict_from_access_token_cache(revoked_session_handles)
+        return revoked_session_handles
 
     async def get_all_session_handles_for_user(
         self,
@@ -365,9 +392,19 @@ class RecipeImplementation(RecipeInterface):  # pylint: disable=too-many-public-
     async def revoke_multiple_sessions(
         self, session_handles: List[str], user_context: Dict[str, Any]
     ) -> List[str]:
-        return await session_functions.revoke_multiple_sessions(
+        revoked_session_handles = await session_functions.revoke_multiple_sessions(
             self, session_handles, user_context
         )
+        self.evict_from_access_token_cache(revoked_session_handles)
+        return revoked_session_handles
+
+    def evict_from_access_token_cache(self, session_handles: List[str]):
+        """
+        Drops cached access token verifications for the given session handles.
+        This is a no-op if access_token_cache_size is not set.
+        """
+        if self.access_token_cache is not None:
+            self.access_token_cache.evict_session_handles(session_handles)
 
     async def get_session_information(
         self, session_handle: str, user_context: Dict[str, Any]
@@ -13,13 +13,14 @@
 # under the License.
 from __future__ import annotations
 
-import time
 from typing import TYPE_CHECKING, Any, Dict, List, Optional, Union
 
 from supertokens_python.recipe.session.interfaces import SessionInformationResult
 from supertokens_python.types import RecipeUserId
+from supertokens_python.utils import get_timestamp_ms
 
 from .access_token import get_info_from_access_token
+from .jwks import get_key_store
 from .jwt import ParsedJWTInfo
 
 if TYPE_CHECKING:
@@ -168,10 +169,11 @@ async def get_session(
     access_token_info: Optional[Dict[str, Any]] = None
 
     try:
-        access_token_info = get_info_from_access_token(
+        access_token_info = await get_info_from_access_token(
             config,
             parsed_access_token,
             config.anti_csrf_function_or_string == "VIA_TOKEN" and do_anti_csrf_check,
+            recipe_implementation.access_token_cache,
         )
 
     except Exception as e:
@@ -204,14 +206,23 @@ async def get_session(
             raise e
 
         if parsed_access_token.version < 3:
-            if expiry_time < time.time():
+            if expiry_time < get_timestamp_ms():
                 raise e
 
-            # We check if the token was created since the last time we refreshed the keys from the core
-            # Since we do not know the exact timing of the last refresh, we check against the max age
+            key_store = get_key_store()
+            if key_store is not None:
+                # If the token was created before the oldest key we know of, the key it was signed
+                # with has been rotated out, so calling the core would not help either.
+                if (
+                    key_store.oldest_key_created_time is not None
+                    and time_created < key_store.oldest_key_created_time
+                ):
+                    raise e
 
-            if time_created <= time.time() - config.jwks_refresh_interval_sec:
-                raise e
+                # We check if the token was created since the last time we refreshed the keys from the core.
+                # If it was created before that, the keys we verified it with were already up to date.
+                if time_created <= key_store.last_refresh_time:
+                    raise e
         else:
             # Since v3 (and above) tokens contain a kid we can trust the cache refresh mechanism built on top of the pyjwt lib
             # This means we do not need to call the core since the signature wouldn't pass verification anyway.
@@ -49,7 +49,7 @@ if TYPE_CHECKING:
     )
     from .recipe import SessionRecipe
 
-from supertokens_python.logger import log_debug_message
+from supertokens_python.logger import is_debug_logging_enabled, log_debug_message
 
 
 def normalise_session_scope(session_scope: str) -> str:
@@ -391,6 +391,8 @@ class SessionConfig:
         use_dynamic_access_token_signing_key: bool,
         expose_access_token_to_frontend_in_cookie_based_auth: bool,
         jwks_refresh_interval_sec: int,
+        access_token_cache_size: int,
+        access_token_cache_ttl_sec: int,
     ):
         self.session_expired_status_code = session_expired_status_code
         self.invalid_claim_status_code = invalid_claim_status_code
@@ -411,6 +413,8 @@ class SessionConfig:
         self.framework = framework
         self.mode = mode
         self.jwks_refresh_interval_sec = jwks_refresh_interval_sec
+        self.access_token_cache_size = access_token_cache_size
+        self.access_token_cache_ttl_sec = access_token_cache_ttl_sec
 
 
 def validate_and_normalise_user_input(
@@ -434,6 +438,8 @@ def validate_and_normalise_user_input(
     use_dynamic_access_token_signing_key: Union[bool, None] = None,
     expose_access_token_to_frontend_in_cookie_based_auth: Union[bool, None] = None,
     jwks_refresh_interval_sec: Union[int, None] = None,
+    access_token_cache_size: Union[int, None] = None,
+    access_token_cache_ttl_sec: Union[int, None] = None,
 ):
     _ = cookie_same_site  # we have this otherwise pylint complains that cookie_same_site is unused, but it is being used in the get_cookie_same_site function.
     if anti_csrf not in {"VIA_TOKEN", "VIA_CUSTOM_HEADER", "NONE", None}:
@@ -544,6 +550,15 @@ def validate_and_normalise_user_input(
     if jwks_refresh_interval_sec is None:
         jwks_refresh_interval_sec = 4 * 3600  # 4 hours
 
+    if access_token_cache_size is None:
+        access_token_cache_size = 0  # disabled
+
+    if access_token_cache_size < 0:
+        raise ValueError("access_token_cache_size must be a non-negative integer")
+
+    if access_token_cache_ttl_sec is None:
+        access_token_cache_ttl_sec = 60
+
     return SessionConfig(
         app_info.api_base_path.append(NormalisedURLPath(SESSION_REFRESH)),
         cookie_domain,
@@ -561,6 +576,8 @@ def validate_and_normalise_user_input(
         use_dynamic_access_token_signing_key,
         expose_access_token_to_frontend_in_cookie_based_auth,
         jwks_refresh_interval_sec,
+        access_token_cache_size,
+        access_token_cache_ttl_sec,
     )
 
 
@@ -609,11 +626,12 @@ async def validate_claims_in_payload(
         claim_validation_res = await validator.validate(
             new_access_token_payload, user_context
         )
-        log_debug_message(
-            "validate_claims_in_payload %s validate res %s",
-            validator.id,
-            json.dumps(claim_validation_res.__dict__),
-        )
+        if is_debug_logging_enabled():
+            log_debug_message(
+                "validate_claims_in_payload %s validate res %s",
+                validator.id,
+                json.dumps(claim_validation_res.__dict__),
+            )
         if not claim_validation_res.is_valid:
             validation_errors.append(
                 ClaimValidationError(validator.id, claim_validation_res.reason)
@@ -18,6 +18,7 @@ from typing import TYPE_CHECKING, Callable, Optional, Union
 
 from . import exceptions as ex
 from . import provider, utils
+from .providers import http_client
 from .recipe import ThirdPartyRecipe
 
 InputOverrideConfig = utils.InputOverrideConfig
@@ -25,6 +26,9 @@ SignInAndUpFeature = utils.SignInAndUpFeature
 ProviderInput = provider.ProviderInput
 ProviderConfig = provider.ProviderConfig
 ProviderClientConfig = provider.ProviderClientConfig
+ProviderHttpClientConfig = http_client.ProviderHttpClientConfig
+ProviderLatencyMetrics = http_client.ProviderLatencyMetrics
+get_provider_latency_metrics = http_client.get_provider_latency_metrics
 exceptions = ex
 
 if TYPE_CHECKING:
@@ -36,7 +40,8 @@ if TYPE_CHECKING:
 def init(
     sign_in_and_up_feature: Optional[SignInAndUpFeature] = None,
     override: Union[InputOverrideConfig, None] = None,
+    http_client_config: Optional[ProviderHttpClientConfig] = None,
 ) -> Callable[[AppInfo], RecipeModule]:
     if sign_in_and_up_feature is None:
         sign_in_and_up_feature = SignInAndUpFeature()
-    return ThirdPartyRecipe.init(sign_in_and_up_feature, override)
+    return ThirdPartyRecipe.init(sign_in_and_up_feature, override, http_client_config)
@@ -1,4 +1,5 @@
-from typing import Any, Dict, List, Optional
+from importlib import import_module
+from typing import Any, Dict, List, Optional, Tuple
 
 from supertokens_python.normalised_url_domain import NormalisedURLDomain
 from supertokens_python.normalised_url_path import NormalisedURLPath
@@ -11,21 +12,7 @@ from ..provider import (
     UserFields,
     UserInfoMap,
 )
-from .active_directory import ActiveDirectory
-from .apple import Apple
-from .bitbucket import Bitbucket
-from .boxy_saml import BoxySAML
-from .custom import NewProvider
-from .discord import Discord
-from .facebook import Facebook
-from .github import Github
-from .gitlab import Gitlab
-from .google import Google
-from .google_workspaces import GoogleWorkspaces
-from .linkedin import Linkedin
-from .okta import Okta
-from .twitter import Twitter
-from .utils import do_get_request
+from .provider_cache import oidc_discovery_cache
 
 
 def merge_config(
@@ -186,53 +173,44 @@ def merge_providers_from_core_and_static(
     return merged_providers
 
 
+# (third party id prefix, module, class). The module of a provider is only
+# imported the first time a provider of that type is created. Prefixes are
+# checked in order, so google-workspaces must come before google.
+BUILT_IN_PROVIDERS: List[Tuple[str, str, str]] = [
+    ("active-directory", "active_directory", "ActiveDirectory"),
+    ("apple", "apple", "Apple"),
+    ("bitbucket", "bitbucket", "Bitbucket"),
+    ("discord", "discord", "Discord"),
+    ("facebook", "facebook", "Facebook"),
+    ("github", "github", "Github"),
+    ("gitlab", "gitlab", "Gitlab"),
+    ("google-workspaces", "google_workspaces", "GoogleWorkspaces"),
+    ("google", "google", "Google"),
+    ("okta", "okta", "Okta"),
+    ("linkedin", "linkedin", "Linkedin"),
+    ("twitter", "twitter", "Twitter"),
+    ("boxy-saml", "boxy_saml", "BoxySAML"),
+]
+
+
 def create_provider(provider_input: ProviderInput) -> Provider:
-    if provider_input.config.third_party_id.startswith("active-directory"):
-        return ActiveDirectory(provider_input)
-    if provider_input.config.third_party_id.startswith("apple"):
-        return Apple(provider_input)
-    if provider_input.config.third_party_id.startswith("bitbucket"):
-        return Bitbucket(provider_input)
-    if provider_input.config.third_party_id.startswith("discord"):
-        return Discord(provider_input)
-    if provider_input.config.third_party_id.startswith("facebook"):
-        return Facebook(provider_input)
-    if provider_input.config.third_party_id.startswith("github"):
-        return Github(provider_input)
-    if provider_input.config.third_party_id.startswith("gitlab"):
-        return Gitlab(provider_input)
-    if provider_input.config.third_party_id.startswith("google-workspaces"):
-        return GoogleWorkspaces(provider_input)
-    if provider_input.config.third_party_id.startswith("google"):
-        return Google(provider_input)
-    if provider_input.config.third_party_id.startswith("okta"):
-        return Okta(provider_input)
-    if provider_input.config.third_party_id.startswith("linkedin"):
-        return Linkedin(provider_input)
-    if provider_input.config.third_party_id.startswith("twitter"):
-        return Twitter(provider_input)
-    if provider_input.config.third_party_id.startswith("boxy-saml"):
-        return BoxySAML(provider_input)
-
-    return NewProvider(provider_input)
-
-
-OIDC_INFO_MAP: Dict[str, Any] = {}
-
-
-async def get_oidc_discovery_info(issuer: str):
-    if issuer in OIDC_INFO_MAP:
-        return OIDC_INFO_MAP[issuer]
+    module_name, class_name = "custom", "NewProvider"
+    for prefix, module, cls in BUILT_IN_PROVIDERS:
+        if provider_input.config.third_party_id.startswith(prefix):
+            module_name, class_name = module, cls
+            break
+
+    module = import_module(f".{module_name}", __package__)
+    return getattr(module, class_name)(provider_input)
 
+
+async def get_oidc_discovery_info(issuer: str) -> Dict[str, Any]:
     ndomain = NormalisedURLDomain(issuer)
     npath = NormalisedURLPath(issuer)
 
-    oidc_info = await do_get_request(
+    return await oidc_discovery_cache.get(
         ndomain.get_as_string_dangerous() + npath.get_as_string_dangerous()
     )
-    OIDC_INFO_MAP[issuer] = oidc_info
-
-    return oidc_info
 
 
 async def discover_oidc_endpoints(
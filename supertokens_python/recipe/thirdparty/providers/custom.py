@@ -1,10 +1,8 @@
-from typing import Any, Callable, Dict, List, Optional, Union
+from typing import Any, Callable, Dict, Optional, Union
 from urllib.parse import parse_qs, urlencode, urlparse
 
 import pkce
-from httpx import AsyncClient
-from jwt import decode  # type: ignore
-from jwt.algorithms import RSAAlgorithm
+from jwt import decode, get_unverified_header  # type: ignore
 
 from supertokens_python.recipe.thirdparty.exceptions import ClientTypeNotFoundError
 from supertokens_python.recipe.thirdparty.providers.utils import (
@@ -30,6 +28,7 @@ from ..provider import (
     UserInfoMap,
 )
 from ..types import RawUserInfoFromProvider, UserInfo, UserInfoEmail
+from .provider_cache import get_provider_keys
 
 
 def get_provider_config_for_client(
@@ -154,19 +153,15 @@ def get_supertokens_user_info_result_from_raw_user_info(
 async def verify_id_token_from_jwks_endpoint_and_get_payload(
     id_token: str, jwks_uri: str, audience: str
 ):
-    public_keys: List[RSAAlgorithm] = []
-    async with AsyncClient(timeout=30.0) as client:
-        response = await client.get(jwks_uri)  # type:ignore
-        key_payload = response.json()
-        for key in key_payload["keys"]:
-            public_keys.append(RSAAlgorithm.from_jwk(key))  # type: ignore
+    kid: Optional[str] = get_unverified_header(id_token).get("kid")
+    public_keys = await get_provider_keys(jwks_uri, kid)
 
     err = Exception("id token verification failed")
     for key in public_keys:
         try:
             return decode(
                 jwt=id_token,
-                key=key,  # type: ignore
+                key=key.key,  # type: ignore
                 audience=[audience],
                 algorithms=["RS256"],
             )
@@ -0,0 +1,216 @@
+# Copyright (c) 2025, VRAI Labs and/or its affiliates. All rights reserved.
+#
+# This software is licensed under the Apache License, Version 2.0 (the
+# "License") as published by the Apache Software Foundation.
+#
+# You may not use this file except in compliance with the License. You may
+# obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from collections import deque
+from typing import TYPE_CHECKING, Any, Deque, Dict, MutableMapping, Optional
+from urllib.parse import urlparse
+from weakref import WeakKeyDictionary
+
+from supertokens_python.http_client import HttpClientConfig, PooledAsyncClient
+
+if TYPE_CHECKING:
+    from httpx import Response
+
+
+class ProviderHttpClientConfig(HttpClientConfig):
+    """
+    Configures the client used for requests to third party providers (token
+    exchange, user info, OIDC discovery and JWKS). Connections are pooled per
+    host and reused across sign ins.
+
+    max_concurrent_requests_per_host caps the number of requests in flight to
+    each provider host (per event loop); other requests wait for a slot.
+    """
+
+    def __init__(
+        self,
+        timeout: float = 30.0,
+        connect_timeout: Optional[float] = None,
+        http2: bool = False,
+        max_connections: Optional[int] = 100,
+        max_keepalive_connections: Optional[int] = 20,
+        keepalive_expiry: Optional[float] = 30.0,
+        max_concurrent_requests_per_host: Optional[int] = None,
+    ):
+        super().__init__(
+            timeout=timeout,
+            connect_timeout=connect_timeout,
+            http2=http2,
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+        )
+        if (
+            max_concurrent_requests_per_host is not None
+            and max_concurrent_requests_per_host < 1
+        ):
+            raise ValueError("max_concurrent_requests_per_host must be at least 1")
+        self.max_concurrent_requests_per_host = max_concurrent_requests_per_host
+
+
+class ProviderLatencyMetrics:
+    def __init__(
+        self,
+        host: str,
+        request_count: int,
+        error_count: int,
+        mean_ms: float,
+        p50_ms: float,
+        p99_ms: float,
+        max_ms: float,
+    ):
+        self.host = host
+        self.request_count = request_count
+        # Requests that failed, or got a 5xx response
+        self.error_count = error_count
+        self.mean_ms = mean_ms
+        # p50_ms and p99_ms are computed over the most recent requests
+        self.p50_ms = p50_ms
+        self.p99_ms = p99_ms
+        self.max_ms = max_ms
+
+    def to_json(self) -> Dict[str, Any]:
+        return {
+            "host": self.host,
+            "requestCount": self.request_count,
+            "errorCount": self.error_count,
+            "meanMs": self.mean_ms,
+            "p50Ms": self.p50_ms,
+            "p99Ms": self.p99_ms,
+            "maxMs": self.max_ms,
+        }
+
+
+class _HostStats:
+    RECENT_SAMPLES = 1000
+
+    def __init__(self):
+        self.request_count = 0
+        self.error_count = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+        self.recent_ms: Deque[float] = deque(maxlen=_HostStats.RECENT_SAMPLES)
+
+    def record(self, duration_ms: float, is_error: bool):
+        self.request_count += 1
+        if is_error:
+            self.error_count += 1
+        self.total_ms += duration_ms
+        self.max_ms = max(self.max_ms, duration_ms)
+        self.recent_ms.append(duration_ms)
+
+    def snapshot(self, host: str) -> ProviderLatencyMetrics:
+        recent = sorted(self.recent_ms)
+
+        def percentile(p: float) -> float:
+            if len(recent) == 0:
+                return 0.0
+            return recent[min(len(recent) - 1, int(p / 100 * len(recent)))]
+
+        return ProviderLatencyMetrics(
+            host,
+            self.request_count,
+            self.error_count,
+            self.total_ms / self.request_count if self.request_count > 0 else 0.0,
+            percentile(50),
+            percentile(99),
+            self.max_ms,
+        )
+
+
+config = ProviderHttpClientConfig()
+http_client: Optional[PooledAsyncClient] = None
+host_stats: Dict[str, _HostStats] = {}
+host_stats_lock = threading.Lock()
+# Semaphores are bound to the loop they are used on
+host_semaphores: MutableMapping[
+    asyncio.AbstractEventLoop, Dict[str, asyncio.Semaphore]
+] = WeakKeyDictionary()
+
+
+def set_provider_http_client_config(new_config: Optional[ProviderHttpClientConfig]):
+    global config, http_client
+    config = new_config if new_config is not None else ProviderHttpClientConfig()
+    # The next request creates a client with the new config. Connections of
+    # the old client are closed when it is garbage collected.
+    http_client = None
+    host_semaphores.clear()
+
+
+def get_provider_latency_metrics() -> Dict[str, ProviderLatencyMetrics]:
+    """
+    Returns the latency of the requests made to each third party provider
+    host since the process started.
+    """
+    with host_stats_lock:
+        return {host: stats.snapshot(host) for host, stats in host_stats.items()}
+
+
+# only for testing purposes
+def reset_provider_http_client():
+    set_provider_http_client_config(None)
+    with host_stats_lock:
+        host_stats.clear()
+
+
+async def close_provider_http_client():
+    if http_client is not None:
+        await http_client.aclose()
+
+
+def _get_semaphore(host: str) -> Optional[asyncio.Semaphore]:
+    if config.max_concurrent_requests_per_host is None:
+        return None
+    loop = asyncio.get_running_loop()
+    semaphores = host_semaphores.get(loop)
+    if semaphores is None:
+        semaphores = {}
+        host_semaphores[loop] = semaphores
+    semaphore = semaphores.get(host)
+    if semaphore is None:
+        semaphore = asyncio.Semaphore(config.max_concurrent_requests_per_host)
+        semaphores[host] = semaphore
+    return semaphore
+
+
+async def send_provider_request(method: str, url: str, **kwargs: Any) -> Response:
+    global http_client
+    if http_client is None:
+        http_client = PooledAsyncClient(config)
+    client = http_client.get_client()
+    host = urlparse(url).netloc
+
+    semaphore = _get_semaphore(host)
+    if semaphore is not None:
+        await semaphore.acquire()
+    start = time.perf_counter()
+    is_error = True
+    try:
+        response = await client.request(method, url, **kwargs)
+        is_error = response.status_code >= 500
+        return response
+    finally:
+        duration_ms = (time.perf_counter() - start) * 1000
+        if semaphore is not None:
+            semaphore.release()
+        with host_stats_lock:
+            stats = host_stats.get(host)
+            if stats is None:
+                stats = _HostStats()
+                host_stats[host] = stats
+            stats.record(duration_ms, is_error)
@@ -0,0 +1,232 @@
+# Copyright (c) 2025, VRAI Labs and/or its affiliates. All rights reserved.
+#
+# This software is licensed under the Apache License, Version 2.0 (the
+# "License") as published by the Apache Software Foundation.
+#
+# You may not use this file except in compliance with the License. You may
+# obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+from __future__ import annotations
+
+import asyncio
+import time
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Generic,
+    List,
+    Optional,
+    TypeVar,
+)
+
+from typing_extensions import TypedDict
+
+from supertokens_python.logger import log_debug_message
+from supertokens_python.single_flight import SingleFlight
+
+from .http_client import send_provider_request
+
+if TYPE_CHECKING:
+    from httpx import Headers
+    from jwt import PyJWK
+
+_T = TypeVar("_T")
+
+
+class ProviderCacheConfigType(TypedDict):
+    request_timeout_sec: float
+    # Used when the provider does not send a Cache-Control max-age
+    default_ttl_sec: float
+    # Upper bound on the max-age sent by the provider
+    max_ttl_sec: float
+    # Once this fraction of the ttl has passed, the document is refreshed in
+    # the background while the cached one keeps being served.
+    background_refresh_ratio: float
+    # An id_token with an unknown kid triggers a refetch of the JWKS (the
+    # provider may have rotated its keys), at most this often per JWKS uri.
+    unknown_kid_refetch_interval_sec: float
+
+
+ProviderCacheConfig: ProviderCacheConfigType = {
+    "request_timeout_sec": 30,
+    "default_ttl_sec": 3600,
+    "max_ttl_sec": 86400,
+    "background_refresh_ratio": 0.8,
+    "unknown_kid_refetch_interval_sec": 30,
+}
+
+
+def get_ttl_from_headers(headers: Headers) -> float:
+    cache_control = headers.get("cache-control")
+    if cache_control is None:
+        return ProviderCacheConfig["default_ttl_sec"]
+
+    max_age: Optional[float] = None
+    for directive in cache_control.lower().split(","):
+        name, _, value = directive.strip().partition("=")
+        if name in ("no-store", "no-cache"):
+            return 0
+        if name == "max-age":
+            try:
+                max_age = float(value.strip('"'))
+            except ValueError:
+                pass
+    if max_age is None:
+        return ProviderCacheConfig["default_ttl_sec"]
+
+    # The response may have been served by a cache that already held it for
+    # a while
+    try:
+        max_age -= float(headers.get("age", 0))
+    except ValueError:
+        pass
+    return min(max(max_age, 0), ProviderCacheConfig["max_ttl_sec"])
+
+
+class CachedDocument(Generic[_T]):
+    def __init__(self, value: _T, ttl_sec: float):
+        self.value = value
+        self.ttl_sec = ttl_sec
+        self.fetched_at = time.monotonic()
+
+    def is_fresh(self) -> bool:
+        return time.monotonic() - self.fetched_at < self.ttl_sec
+
+    def is_due_for_background_refresh(self) -> bool:
+        return (
+            time.monotonic() - self.fetched_at
+            >= self.ttl_sec * ProviderCacheConfig["background_refresh_ratio"]
+        )
+
+
+class RemoteDocumentCache(Generic[_T]):
+    """
+    Caches JSON documents fetched from third party providers, keyed by url, for
+    as long as the provider's Cache-Control header allows. parse turns the
+    JSON into the value that is cached, so that it is only done once per
+    fetch. Concurrent misses for a url share a single fetch (per event loop).
+    """
+
+    def __init__(self, name: str, parse: Callable[[Any], _T]):
+        self.name = name
+        self.parse = parse
+        self.entries: Dict[str, CachedDocument[_T]] = {}
+        self.in_flight: SingleFlight[CachedDocument[_T]] = SingleFlight(
+            lambda url, e: log_debug_message(
+                "Fetching %s from %s failed: %s", self.name, url, e
+            )
+        )
+
+    def get_cached(self, url: str) -> Optional[CachedDocument[_T]]:
+        return self.entries.get(url)
+
+    async def get(self, url: str) -> _T:
+        entry = self.entries.get(url)
+        if entry is not None and entry.is_fresh():
+            if entry.is_due_for_background_refresh():
+                self._get_or_start_fetch(url)
+            return entry.value
+        return await self.fetch(url)
+
+    async def fetch(self, url: str) -> _T:
+        entry = await self.in_flight.run(url, lambda: self._fetch_and_cache(url))
+        return entry.value
+
+    def clear(self):
+        self.entries.clear()
+        self.in_flight.cancel()
+
+    async def _fetch_and_cache(self, url: str) -> CachedDocument[_T]:
+        log_debug_message("Fetching %s from %s", self.name, url)
+        response = await send_provider_request(
+            "GET", url, timeout=ProviderCacheConfig["request_timeout_sec"]
+        )
+        response.raise_for_status()
+        entry = CachedDocument(
+            self.parse(response.json()), get_ttl_from_headers(response.headers)
+        )
+        self.entries[url] = entry
+        return entry
+
+    def _get_or_start_fetch(self, url: str) -> "asyncio.Task[CachedDocument[_T]]":
+        return self.in_flight.get_or_start(url, lambda: self._fetch_and_cache(url))
+
+
+class ProviderKeySet:
+    """
+    The keys of a provider's JWKS, indexed by kid. Each PyJWK holds the parsed
+    public key, so verifying an id_token never re-parses the JWK.
+    """
+
+    def __init__(self, keys: List[PyJWK]):
+        self.keys = keys
+        self.keys_by_kid: Dict[str, PyJWK] = {}
+        for key in keys:
+            kid: Optional[str] = key.key_id  # type: ignore
+            if kid is not None:
+                self.keys_by_kid[kid] = key
+
+    @staticmethod
+    def from_json(jwks: Any) -> ProviderKeySet:
+        from jwt import PyJWKSet
+
+        return ProviderKeySet(PyJWKSet.from_dict(jwks).keys)  # type: ignore
+
+    def get_matching_keys(self, kid: Optional[str]) -> Optional[List[PyJWK]]:
+        if kid is None:
+            return self.keys
+        key = self.keys_by_kid.get(kid)
+        if key is not None:
+            return [key]
+        # Some providers publish keys without a kid, while still setting one
+        # in the token header, so the kid cannot be used to pick the key
+        if len(self.keys_by_kid) == 0:
+            return self.keys
+        return None
+
+
+oidc_discovery_cache: RemoteDocumentCache[Dict[str, Any]] = RemoteDocumentCache(
+    "OIDC discovery document", lambda document: document
+)
+jwks_cache: RemoteDocumentCache[ProviderKeySet] = RemoteDocumentCache(
+    "JWKS", ProviderKeySet.from_json
+)
+
+
+# only for testing purposes
+def reset_provider_caches():
+    oidc_discovery_cache.clear()
+    jwks_cache.clear()
+
+
+async def get_provider_keys(jwks_uri: str, kid: Optional[str]) -> List[PyJWK]:
+    """
+    Returns the keys of the JWKS at jwks_uri that can have signed a token with
+    the given kid (all of them if kid is None, or if none of the keys has a
+    kid).
+    """
+    key_set = await jwks_cache.get(jwks_uri)
+    matching_keys = key_set.get_matching_keys(kid)
+    if matching_keys is not None:
+        return matching_keys
+
+    # The provider may have rotated its keys since they were fetched
+    entry = jwks_cache.get_cached(jwks_uri)
+    if (
+        entry is None
+        or time.monotonic() - entry.fetched_at
+        >= ProviderCacheConfig["unknown_kid_refetch_interval_sec"]
+    ):
+        key_set = await jwks_cache.fetch(jwks_uri)
+        matching_keys = key_set.get_matching_keys(kid)
+        if matching_keys is not None:
+            return matching_keys
+
+    raise Exception("No matching key found in the provider's JWKS")
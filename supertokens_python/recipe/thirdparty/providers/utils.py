@@ -1,11 +1,11 @@
 from typing import Any, Dict, Optional, Tuple
 
-from httpx import AsyncClient
-
 from supertokens_python.logger import log_debug_message
 from supertokens_python.normalised_url_domain import NormalisedURLDomain
 from supertokens_python.normalised_url_path import NormalisedURLPath
 
+from .http_client import send_provider_request
+
 DEV_OAUTH_CLIENT_IDS = [
     "1060725074195-kmeum4crr01uirfl2op9kd5acmi9jutn.apps.googleusercontent.com",
     # google client id
@@ -36,14 +36,12 @@ async def do_get_request(
     if headers is None:
         headers = {}
 
-    async with AsyncClient(timeout=30.0) as client:
-        res = await client.get(url, params=query_params, headers=headers)  # type:ignore
-
-        log_debug_message(
-            "Received response with status %s and body %s", res.status_code, res.text
-        )
+    res = await send_provider_request("GET", url, params=query_params, headers=headers)
+    log_debug_message(
+        "Received response with status %s and body %s", res.status_code, res.text
+    )
 
-        return res.json()
+    return res.json()
 
 
 async def do_post_request(
@@ -59,15 +57,14 @@ async def do_post_request(
     headers["content-type"] = "application/x-www-form-urlencoded"
     headers["accept"] = "application/json"
 
-    async with AsyncClient(timeout=30.0) as client:
-        res = await client.post(url, data=body_params, headers=headers)  # type:ignore
-        log_debug_message(
-            "Received response with status %s and body %s", res.status_code, res.text
-        )
-        try:
-            return res.status_code, res.json()
-        except Exception:
-            return res.status_code, {"message": res.text}
+    res = await send_provider_request("POST", url, data=body_params, headers=headers)
+    log_debug_message(
+        "Received response with status %s and body %s", res.status_code, res.text
+    )
+    try:
+        return res.status_code, res.json()
+    except Exception:
+        return res.status_code, {"message": res.text}
 
 
 def normalise_oidc_endpoint_to_include_well_known(url: str) -> str:
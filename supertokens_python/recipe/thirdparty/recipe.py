@@ -14,7 +14,7 @@
 from __future__ import annotations
 
 from os import environ
-from typing import TYPE_CHECKING, Any, Dict, List, Union
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Union
 
 from supertokens_python.normalised_url_path import NormalisedURLPath
 from supertokens_python.querier import Querier
@@ -23,6 +23,12 @@ from supertokens_python.recipe_module import APIHandled, RecipeModule
 from ...post_init_callbacks import PostSTInitCallbacks
 from .api.implementation import APIImplementation
 from .interfaces import APIInterface, APIOptions, RecipeInterface
+from .providers.http_client import (
+    ProviderHttpClientConfig,
+    reset_provider_http_client,
+    set_provider_http_client_config,
+)
+from .providers.provider_cache import reset_provider_caches
 from .recipe_implementation import RecipeImplementation
 
 if TYPE_CHECKING:
@@ -166,9 +172,11 @@ class ThirdPartyRecipe(RecipeModule):
     def init(
         sign_in_and_up_feature: SignInAndUpFeature,
         override: Union[InputOverrideConfig, None] = None,
+        http_client_config: Optional[ProviderHttpClientConfig] = None,
     ):
         def func(app_info: AppInfo):
             if ThirdPartyRecipe.__instance is None:
+                set_provider_http_client_config(http_client_config)
                 ingredients = ThirdPartyIngredients()
                 ThirdPartyRecipe.__instance = ThirdPartyRecipe(
                     ThirdPartyRecipe.recipe_id,
@@ -198,6 +206,8 @@ class ThirdPartyRecipe(RecipeModule):
             environ["SUPERTOKENS_ENV"] != "testing"
         ):
             raise_general_exception("calling testing function in non testing env")
+        reset_provider_caches()
+        reset_provider_http_client()
         ThirdPartyRecipe.__instance = None
 
     # instance functions below...............
@@ -23,8 +23,6 @@ from .interfaces import APIInterface, RecipeInterface
 if TYPE_CHECKING:
     from .provider import ProviderInput
 
-from jwt import PyJWKClient, decode  # type: ignore
-
 
 class SignInAndUpFeature:
     def __init__(self, providers: Optional[List[ProviderInput]] = None):
@@ -100,6 +98,8 @@ def validate_and_normalise_user_input(
 def verify_id_token_from_jwks_endpoint(
     id_token: str, jwks_uri: str, audience: str, issuers: List[str]
 ) -> Dict[str, Any]:
+    from jwt import PyJWKClient, decode  # type: ignore
+
     jwks_client = PyJWKClient(jwks_uri)
     signing_key = jwks_client.get_signing_key_from_jwt(id_token)
 
@@ -26,5 +26,6 @@ if TYPE_CHECKING:
 
 def init(
     override: Union[utils.InputOverrideConfig, None] = None,
+    bulk_fetch_concurrency: Union[int, None] = None,
 ) -> Callable[[AppInfo], RecipeModule]:
-    return UserMetadataRecipe.init(override)
+    return UserMetadataRecipe.init(override, bulk_fetch_concurrency)
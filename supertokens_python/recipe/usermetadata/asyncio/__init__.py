@@ -1,4 +1,4 @@
-from typing import Any, Dict, Union
+from typing import Any, Dict, List, Union
 
 from supertokens_python.recipe.usermetadata.recipe import UserMetadataRecipe
 
@@ -15,6 +15,16 @@ async def get_user_metadata(
     )
 
 
+async def get_users_metadata(
+    user_ids: List[str], user_context: Union[Dict[str, Any], None] = None
+):
+    if user_context is None:
+        user_context = {}
+    return await UserMetadataRecipe.get_instance().recipe_implementation.get_users_metadata(
+        user_ids, user_context
+    )
+
+
 async def update_user_metadata(
     user_id: str,
     metadata_update: Dict[str, Any],
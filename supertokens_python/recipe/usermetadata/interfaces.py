@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Any, Dict
+from typing import Any, Dict, List
 
 
 class MetadataResult(ABC):
@@ -11,6 +11,12 @@ class ClearUserMetadataResult:
     pass
 
 
+class GetUsersMetadataResult:
+    def __init__(self, metadata: Dict[str, Dict[str, Any]]):
+        # Keyed by user id
+        self.metadata = metadata
+
+
 class RecipeInterface(ABC):
     @abstractmethod
     async def get_user_metadata(
@@ -18,6 +24,17 @@ class RecipeInterface(ABC):
     ) -> MetadataResult:
         pass
 
+    async def get_users_metadata(
+        self, user_ids: List[str], user_context: Dict[str, Any]
+    ) -> GetUsersMetadataResult:
+        # Not abstract, so that implementations written before it was added
+        # keep working. They fetch the users one at a time.
+        metadata: Dict[str, Dict[str, Any]] = {}
+        for user_id in dict.fromkeys(user_ids):
+            result = await self.get_user_metadata(user_id, user_context)
+            metadata[user_id] = result.metadata
+        return GetUsersMetadataResult(metadata)
+
     @abstractmethod
     async def update_user_metadata(
         self,
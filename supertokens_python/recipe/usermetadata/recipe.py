@@ -47,10 +47,15 @@ class UserMetadataRecipe(RecipeModule):
         recipe_id: str,
         app_info: AppInfo,
         override: Union[InputOverrideConfig, None] = None,
+        bulk_fetch_concurrency: Union[int, None] = None,
     ):
         super().__init__(recipe_id, app_info)
-        self.config = validate_and_normalise_user_input(self, app_info, override)
-        recipe_implementation = RecipeImplementation(Querier.get_instance(recipe_id))
+        self.config = validate_and_normalise_user_input(
+            self, app_info, override, bulk_fetch_concurrency
+        )
+        recipe_implementation = RecipeImplementation(
+            Querier.get_instance(recipe_id), self.config
+        )
         self.recipe_implementation = (
             recipe_implementation
             if self.config.override.functions is None
@@ -90,11 +95,17 @@ class UserMetadataRecipe(RecipeModule):
         return []
 
     @staticmethod
-    def init(override: Union[InputOverrideConfig, None] = None):
+    def init(
+        override: Union[InputOverrideConfig, None] = None,
+        bulk_fetch_concurrency: Union[int, None] = None,
+    ):
         def func(app_info: AppInfo):
             if UserMetadataRecipe.__instance is None:
                 UserMetadataRecipe.__instance = UserMetadataRecipe(
-                    UserMetadataRecipe.recipe_id, app_info, override
+                    UserMetadataRecipe.recipe_id,
+                    app_info,
+                    override,
+                    bulk_fetch_concurrency,
                 )
                 return UserMetadataRecipe.__instance
             raise Exception(
@@ -13,18 +13,26 @@
 # under the License.
 
 
-from typing import Any, Dict
+import asyncio
+from typing import Any, Dict, List
 
 from supertokens_python.normalised_url_path import NormalisedURLPath
 from supertokens_python.querier import Querier
 
-from .interfaces import ClearUserMetadataResult, MetadataResult, RecipeInterface
+from .interfaces import (
+    ClearUserMetadataResult,
+    GetUsersMetadataResult,
+    MetadataResult,
+    RecipeInterface,
+)
+from .utils import UserMetadataConfig
 
 
 class RecipeImplementation(RecipeInterface):
-    def __init__(self, querier: Querier):
+    def __init__(self, querier: Querier, config: UserMetadataConfig):
         super().__init__()
         self.querier = querier
+        self.config = config
 
     async def get_user_metadata(
         self, user_id: str, user_context: Dict[str, Any]
@@ -37,6 +45,35 @@ class RecipeImplementation(RecipeInterface):
         )
         return MetadataResult(metadata=response["metadata"])
 
+    async def get_users_metadata(
+        self, user_ids: List[str], user_context: Dict[str, Any]
+    ) -> GetUsersMetadataResult:
+        # The core has no bulk metadata endpoint, so the users are fetched one
+        # at a time, with up to bulk_fetch_concurrency requests in flight. A
+        # new request is sent as soon as one completes, rather than in waves.
+        pending = iter(dict.fromkeys(user_ids))
+        metadata: Dict[str, Dict[str, Any]] = {}
+
+        async def worker():
+            for user_id in pending:
+                result = await self.get_user_metadata(user_id, user_context)
+                metadata[user_id] = result.metadata
+
+        workers = [
+            asyncio.ensure_future(worker())
+            for _ in range(min(self.config.bulk_fetch_concurrency, len(user_ids)))
+        ]
+        try:
+            await asyncio.gather(*workers)
+        except BaseException:
+            # Stop the other workers, so that no more users are fetched once
+            # the caller has the error
+            for w in workers:
+                w.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+            raise
+        return GetUsersMetadataResult(metadata)
+
     async def update_user_metadata(
         self,
         user_id: str,
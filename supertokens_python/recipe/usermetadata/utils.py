@@ -37,14 +37,18 @@ class InputOverrideConfig:
 
 
 class UserMetadataConfig:
-    def __init__(self, override: InputOverrideConfig) -> None:
+    def __init__(
+        self, override: InputOverrideConfig, bulk_fetch_concurrency: int
+    ) -> None:
         self.override = override
+        self.bulk_fetch_concurrency = bulk_fetch_concurrency
 
 
 def validate_and_normalise_user_input(
     _recipe: UserMetadataRecipe,
     _app_info: AppInfo,
     override: Union[InputOverrideConfig, None] = None,
+    bulk_fetch_concurrency: Union[int, None] = None,
 ) -> UserMetadataConfig:
     if override is not None and not isinstance(override, InputOverrideConfig):  # type: ignore
         raise ValueError("override must be an instance of InputOverrideConfig or None")
@@ -52,4 +56,12 @@ def validate_and_normalise_user_input(
     if override is None:
         override = InputOverrideConfig()
 
-    return UserMetadataConfig(override=override)
+    if bulk_fetch_concurrency is None:
+        bulk_fetch_concurrency = 10
+
+    if bulk_fetch_concurrency < 1:
+        raise ValueError("bulk_fetch_concurrency must be a positive integer")
+
+    return UserMetadataConfig(
+        override=override, bulk_fetch_concurrency=bulk_fetch_concurrency
+    )
@@ -31,9 +31,11 @@ def init(
     skip_adding_roles_to_access_token: Optional[bool] = None,
     skip_adding_permissions_to_access_token: Optional[bool] = None,
     override: Union[utils.InputOverrideConfig, None] = None,
+    role_permissions_cache_ttl_sec: Union[int, None] = None,
 ) -> Callable[[AppInfo], RecipeModule]:
     return UserRolesRecipe.init(
         skip_adding_roles_to_access_token,
         skip_adding_permissions_to_access_token,
         override,
+        role_permissions_cache_ttl_sec,
     )
@@ -14,6 +14,7 @@
 
 from __future__ import annotations
 
+import asyncio
 from os import environ
 from typing import Any, Dict, List, Optional, Set, Union
 
@@ -49,6 +50,7 @@ class UserRolesRecipe(RecipeModule):
         skip_adding_roles_to_access_token: Optional[bool] = None,
         skip_adding_permissions_to_access_token: Optional[bool] = None,
         override: Union[InputOverrideConfig, None] = None,
+        role_permissions_cache_ttl_sec: Union[int, None] = None,
     ):
         from ..oauth2provider.recipe import OAuth2ProviderRecipe
 
@@ -59,8 +61,11 @@ class UserRolesRecipe(RecipeModule):
             skip_adding_roles_to_access_token,
             skip_adding_permissions_to_access_token,
             override,
+            role_permissions_cache_ttl_sec,
+        )
+        recipe_implementation = RecipeImplementation(
+            Querier.get_instance(recipe_id), self.config
         )
-        recipe_implementation = RecipeImplementation(Querier.get_instance(recipe_id))
         self.recipe_implementation = (
             recipe_implementation
             if self.config.override.functions is None
@@ -106,14 +111,10 @@ class UserRolesRecipe(RecipeModule):
 
                 if "permissions" in scopes:
                     user_permissions: Set[str] = set()
-                    for role in user_roles:
-                        role_permissions = (
-                            await self.recipe_implementation.get_permissions_for_role(
-                                role=role,
-                                user_context=user_context,
-                            )
-                        )
-
+                    permissions_by_role = await self.get_permissions_for_roles(
+                        user_roles, user_context
+                    )
+                    for role_permissions in permissions_by_role.values():
                         if isinstance(role_permissions, UnknownRoleError):
                             raise Exception("Failed to fetch permissions for the role")
 
@@ -156,14 +157,10 @@ class UserRolesRecipe(RecipeModule):
 
                 if "permissions" in scopes:
                     user_permissions: Set[str] = set()
-                    for role in user_roles:
-                        role_permissions = (
-                            await self.recipe_implementation.get_permissions_for_role(
-                                role=role,
-                                user_context=user_context,
-                            )
-                        )
-
+                    permissions_by_role = await self.get_permissions_for_roles(
+                        user_roles, user_context
+                    )
+                    for role_permissions in permissions_by_role.values():
                         if isinstance(role_permissions, UnknownRoleError):
                             raise Exception("Failed to fetch permissions for the role")
 
@@ -180,6 +177,24 @@ class UserRolesRecipe(RecipeModule):
 
         PostSTInitCallbacks.add_post_init_callback(callback)
 
+    async def get_permissions_for_roles(
+        self, roles: List[str], user_context: Dict[str, Any]
+    ) -> Dict[str, Union[GetPermissionsForRoleOkResult, UnknownRoleError]]:
+        """
+        Fetches the permissions of each of the given roles, concurrently and
+        once per distinct role.
+        """
+        unique_roles = list(dict.fromkeys(roles))
+        results = await asyncio.gather(
+            *[
+                self.recipe_implementation.get_permissions_for_role(
+                    role=role, user_context=user_context
+                )
+                for role in unique_roles
+            ]
+        )
+        return dict(zip(unique_roles, results))
+
     def is_error_from_this_recipe_based_on_instance(self, err: Exception) -> bool:
         return isinstance(err, SuperTokensError) and (
             isinstance(err, SuperTokensUserRolesError)
@@ -217,6 +232,7 @@ class UserRolesRecipe(RecipeModule):
         skip_adding_roles_to_access_token: Optional[bool] = None,
         skip_adding_permissions_to_access_token: Optional[bool] = None,
         override: Union[InputOverrideConfig, None] = None,
+        role_permissions_cache_ttl_sec: Union[int, None] = None,
     ):
         def func(app_info: AppInfo):
             if UserRolesRecipe.__instance is None:
@@ -226,6 +242,7 @@ class UserRolesRecipe(RecipeModule):
                     skip_adding_roles_to_access_token,
                     skip_adding_permissions_to_access_token,
                     override,
+                    role_permissions_cache_ttl_sec,
                 )
                 return UserRolesRecipe.__instance
             raise Exception(
@@ -271,14 +288,11 @@ class PermissionClaimClass(PrimitiveArrayClaim[List[str]]):
             )
 
             user_permissions: Set[str] = set()
+            permissions_by_role = await recipe.get_permissions_for_roles(
+                user_roles.roles, user_context
+            )
 
-            for role in user_roles.roles:
-                role_permissions = (
-                    await recipe.recipe_implementation.get_permissions_for_role(
-                        role, user_context
-                    )
-                )
-
+            for role_permissions in permissions_by_role.values():
                 if isinstance(role_permissions, GetPermissionsForRoleOkResult):
                     for permission in role_permissions.permissions:
                         user_permissions.add(permission)
@@ -13,7 +13,7 @@
 # under the License.
 
 
-from typing import Any, Dict, List, Union
+from typing import Any, Dict, List, Optional, Union
 
 from supertokens_python.normalised_url_path import NormalisedURLPath
 from supertokens_python.querier import Querier
@@ -32,12 +32,23 @@ from .interfaces import (
     RemoveUserRoleOkResult,
     UnknownRoleError,
 )
+from .role_permissions_cache import RolePermissionsCache
+from .utils import UserRolesConfig
 
 
 class RecipeImplementation(RecipeInterface):
-    def __init__(self, querier: Querier):
+    def __init__(self, querier: Querier, config: UserRolesConfig):
         super().__init__()
         self.querier = querier
+        self.role_permissions_cache: Optional[RolePermissionsCache] = None
+        if config.role_permissions_cache_ttl_sec > 0:
+            self.role_permissions_cache = RolePermissionsCache(
+                config.role_permissions_cache_ttl_sec
+            )
+
+    def invalidate_role_permissions_cache(self, role: str):
+        if self.role_permissions_cache is not None:
+            self.role_permissions_cache.invalidate(role)
 
     async def add_role_to_user(
         self,
@@ -106,12 +117,16 @@ class RecipeImplementation(RecipeInterface):
         self, role: str, permissions: List[str], user_context: Dict[str, Any]
     ) -> CreateNewRoleOrAddPermissionsOkResult:
         params = {"role": role, "permissions": permissions}
-        response = await self.querier.send_put_request(
-            NormalisedURLPath("/recipe/role"),
-            params,
-            None,
-            user_context=user_context,
-        )
+        try:
+            response = await self.querier.send_put_request(
+                NormalisedURLPath("/recipe/role"),
+                params,
+                None,
+                user_context=user_context,
+            )
+        finally:
+            # Even if the request failed, the core may have applied the write
+            self.invalidate_role_permissions_cache(role)
         return CreateNewRoleOrAddPermissionsOkResult(
             created_new_role=response["createdNewRole"]
         )
@@ -119,6 +134,13 @@ class RecipeImplementation(RecipeInterface):
     async def get_permissions_for_role(
         self, role: str, user_context: Dict[str, Any]
     ) -> Union[GetPermissionsForRoleOkResult, UnknownRoleError]:
+        generation = 0
+        if self.role_permissions_cache is not None:
+            cached = self.role_permissions_cache.get(role)
+            if cached is not None:
+                return GetPermissionsForRoleOkResult(permissions=cached)
+            generation = self.role_permissions_cache.get_generation(role)
+
         params = {"role": role}
         response = await self.querier.send_get_request(
             NormalisedURLPath("/recipe/role/permissions"),
@@ -126,6 +148,10 @@ class RecipeImplementation(RecipeInterface):
             user_context=user_context,
         )
         if response["status"] == "OK":
+            if self.role_permissions_cache is not None:
+                self.role_permissions_cache.set(
+                    role, response["permissions"], generation
+                )
             return GetPermissionsForRoleOkResult(permissions=response["permissions"])
         return UnknownRoleError()
 
@@ -133,11 +159,15 @@ class RecipeImplementation(RecipeInterface):
         self, role: str, permissions: List[str], user_context: Dict[str, Any]
     ) -> Union[RemovePermissionsFromRoleOkResult, UnknownRoleError]:
         params = {"role": role, "permissions": permissions}
-        response = await self.querier.send_post_request(
-            NormalisedURLPath("/recipe/role/permissions/remove"),
-            params,
-            user_context=user_context,
-        )
+        try:
+            response = await self.querier.send_post_request(
+                NormalisedURLPath("/recipe/role/permissions/remove"),
+                params,
+                user_context=user_context,
+            )
+        finally:
+            # Even if the request failed, the core may have applied the write
+            self.invalidate_role_permissions_cache(role)
         if response["status"] == "OK":
             return RemovePermissionsFromRoleOkResult()
         return UnknownRoleError()
@@ -157,11 +187,15 @@ class RecipeImplementation(RecipeInterface):
         self, role: str, user_context: Dict[str, Any]
     ) -> DeleteRoleOkResult:
         params = {"role": role}
-        response = await self.querier.send_post_request(
-            NormalisedURLPath("/recipe/role/remove"),
-            params,
-            user_context=user_context,
-        )
+        try:
+            response = await self.querier.send_post_request(
+                NormalisedURLPath("/recipe/role/remove"),
+                params,
+                user_context=user_context,
+            )
+        finally:
+            # Even if the request failed, the core may have applied the write
+            self.invalidate_role_permissions_cache(role)
         return DeleteRoleOkResult(did_role_exist=response["didRoleExist"])
 
     async def get_all_roles(self, user_context: Dict[str, Any]) -> GetAllRolesOkResult:
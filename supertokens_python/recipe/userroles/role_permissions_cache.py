@@ -0,0 +1,72 @@
+# Copyright (c) 2025, VRAI Labs and/or its affiliates. All rights reserved.
+#
+# This software is licensed under the Apache License, Version 2.0 (the
+# "License") as published by the Apache Software Foundation.
+#
+# You may not use this file except in compliance with the License. You may
+# obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+from __future__ import annotations
+
+import time
+from typing import Dict, List, Optional, Tuple
+
+
+class RolePermissionsCache:
+    """
+    Caches the permissions of each role, as returned by the core. Roles that
+    do not exist are not cached, so that a role created by another process is
+    picked up right away.
+    """
+
+    def __init__(self, ttl_sec: int):
+        self.ttl_sec = ttl_sec
+        self._entries: Dict[str, Tuple[List[str], float]] = {}
+        # Incremented by every invalidation. A role's generation is the value
+        # it had when the role was last invalidated (or the cache cleared),
+        # so that a response fetched across a write is not stored.
+        self._counter = 0
+        self._generations: Dict[str, int] = {}
+        self._cleared_at = 0
+
+    def get(self, role: str) -> Optional[List[str]]:
+        entry = self._entries.get(role)
+        if entry is None:
+            return None
+        permissions, expires_at = entry
+        if expires_at <= time.monotonic():
+            self._entries.pop(role, None)
+            return None
+        return list(permissions)
+
+    def get_generation(self, role: str) -> int:
+        """
+        To be read before fetching the permissions that are passed to set.
+        """
+        return max(self._generations.get(role, 0), self._cleared_at)
+
+    def set(self, role: str, permissions: List[str], generation: int):
+        # The role was written while its permissions were being fetched, so
+        # they may be out of date
+        if generation != self.get_generation(role):
+            return
+        self._entries[role] = (list(permissions), time.monotonic() + self.ttl_sec)
+
+    def invalidate(self, role: str):
+        self._counter += 1
+        self._generations[role] = self._counter
+        self._entries.pop(role, None)
+
+    def clear(self):
+        self._counter += 1
+        self._cleared_at = self._counter
+        self._generations.clear()
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
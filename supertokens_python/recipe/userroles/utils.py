@@ -39,12 +39,14 @@ class UserRolesConfig:
         skip_adding_roles_to_access_token: bool,
         skip_adding_permissions_to_access_token: bool,
         override: InputOverrideConfig,
+        role_permissions_cache_ttl_sec: int,
     ) -> None:
         self.skip_adding_roles_to_access_token = skip_adding_roles_to_access_token
         self.skip_adding_permissions_to_access_token = (
             skip_adding_permissions_to_access_token
         )
         self.override = override
+        self.role_permissions_cache_ttl_sec = role_permissions_cache_ttl_sec
 
 
 def validate_and_normalise_user_input(
@@ -53,6 +55,7 @@ def validate_and_normalise_user_input(
     skip_adding_roles_to_access_token: Optional[bool] = None,
     skip_adding_permissions_to_access_token: Optional[bool] = None,
     override: Union[InputOverrideConfig, None] = None,
+    role_permissions_cache_ttl_sec: Union[int, None] = None,
 ) -> UserRolesConfig:
     if override is not None and not isinstance(override, InputOverrideConfig):  # type: ignore
         raise ValueError("override must be an instance of InputOverrideConfig or None")
@@ -65,8 +68,17 @@ def validate_and_normalise_user_input(
     if skip_adding_permissions_to_access_token is None:
         skip_adding_permissions_to_access_token = False
 
+    if role_permissions_cache_ttl_sec is None:
+        role_permissions_cache_ttl_sec = 0  # disabled
+
+    if role_permissions_cache_ttl_sec < 0:
+        raise ValueError(
+            "role_permissions_cache_ttl_sec must be a non-negative integer"
+        )
+
     return UserRolesConfig(
         skip_adding_roles_to_access_token=skip_adding_roles_to_access_token,
         skip_adding_permissions_to_access_token=skip_adding_permissions_to_access_token,
         override=override,
+        role_permissions_cache_ttl_sec=role_permissions_cache_ttl_sec,
     )
@@ -0,0 +1,127 @@
+# Copyright (c) 2025, VRAI Labs and/or its affiliates. All rights reserved.
+#
+# This software is licensed under the Apache License, Version 2.0 (the
+# "License") as published by the Apache Software Foundation.
+#
+# You may not use this file except in compliance with the License. You may
+# obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Dict, List, Optional
+
+from .core_call_cache import strip_tenant_id
+
+if TYPE_CHECKING:
+    from .types import User
+
+# Writes to the core that cannot change what get_user or
+# list_users_by_account_info return, so they keep the users cached for the
+# request. Any other write drops them.
+USER_NEUTRAL_WRITE_PATH_PREFIXES = [
+    "/recipe/dashboard",
+    "/recipe/jwt",
+    "/recipe/oauth",
+    "/recipe/role",
+    "/recipe/session",
+    "/recipe/totp",
+    "/recipe/user/metadata",
+    "/recipe/user/role",
+]
+USER_NEUTRAL_WRITE_PATHS = {
+    "/recipe/signin",
+    "/recipe/signinup/code",
+    "/recipe/signinup/code/check",
+    "/recipe/signinup/code/remove",
+    "/recipe/signinup/codes/remove",
+    "/recipe/user/email/verify/token",
+    "/recipe/user/email/verify/token/remove",
+    "/recipe/user/password/reset/token",
+}
+# Writes after which the account linking recipe drops only the users they
+# change (see RequestUserCache.invalidate_users)
+ACCOUNT_LINKING_WRITE_PATHS = {
+    "/recipe/accountlinking/user/link",
+    "/recipe/accountlinking/user/primary",
+    "/recipe/accountlinking/user/unlink",
+    "/user/remove",
+}
+
+
+def keeps_request_user_cache(write_path: str) -> bool:
+    path = strip_tenant_id(write_path)
+    return (
+        path in USER_NEUTRAL_WRITE_PATHS
+        or path in ACCOUNT_LINKING_WRITE_PATHS
+        or any(path.startswith(prefix) for prefix in USER_NEUTRAL_WRITE_PATH_PREFIXES)
+    )
+
+
+class RequestUserCache:
+    """
+    The users fetched from the core during one request, so that the many
+    lookups of the same user while signing in (pre and post auth checks,
+    account linking and MFA) share a single core call. A user is cached under
+    its primary user id and the recipe user id of each of its login methods,
+    since get_user returns the same user for any of them.
+
+    Unlike the per request core call cache, this is not cleared by writes that
+    cannot change a user (like creating a session), and linking, unlinking or
+    creating a primary user only drops the users involved.
+    """
+
+    def __init__(self):
+        # None for user ids the core does not know
+        self.users: Dict[str, Optional[User]] = {}
+        self.users_by_account_info: Dict[str, List[User]] = {}
+
+    def has_user(self, user_id: str) -> bool:
+        return user_id in self.users
+
+    def get_user(self, user_id: str) -> Optional[User]:
+        return self.users.get(user_id)
+
+    def set_user(self, user_id: str, user: Optional[User]):
+        self.users[user_id] = user
+        if user is not None:
+            self.users[user.id] = user
+            for login_method in user.login_methods:
+                self.users[login_method.recipe_user_id.get_as_string()] = user
+
+    def get_users_by_account_info(self, key: str) -> Optional[List[User]]:
+        return self.users_by_account_info.get(key)
+
+    def set_users_by_account_info(self, key: str, users: List[User]):
+        self.users_by_account_info[key] = users
+        for user in users:
+            self.set_user(user.id, user)
+
+    def invalidate_users(self, user_ids: List[str]):
+        """
+        Drops the users that have any of these ids, as their primary user id
+        or as one of their recipe user ids. Lookups by account info are all
+        dropped, since linking or unlinking changes which users they return.
+        """
+        users_to_drop = [
+            user
+            for user in self.users.values()
+            if user is not None
+            and (
+                user.id in user_ids
+                or any(
+                    lm.recipe_user_id.get_as_string() in user_ids
+                    for lm in user.login_methods
+                )
+            )
+        ]
+        self.users = {
+            key: user
+            for key, user in self.users.items()
+            if key not in user_ids and not any(user is u for u in users_to_drop)
+        }
+        self.users_by_account_info = {}
@@ -0,0 +1,105 @@
+# Copyright (c) 2025, VRAI Labs and/or its affiliates. All rights reserved.
+#
+# This software is licensed under the Apache License, Version 2.0 (the
+# "License") as published by the Apache Software Foundation.
+#
+# You may not use this file except in compliance with the License. You may
+# obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+from __future__ import annotations
+
+import re
+from typing import Dict, List, Optional, Tuple
+
+from .normalised_url_path import NormalisedURLPath
+from .recipe_module import RecipeModule
+
+TENANT_ID_REGEX = re.compile(r"[a-zA-Z0-9-]+")
+
+
+class RouteMatch:
+    def __init__(
+        self,
+        order: int,
+        recipe: RecipeModule,
+        api_id: str,
+        tenant_id_from_path: Optional[str],
+    ):
+        self.order = order
+        self.recipe = recipe
+        self.api_id = api_id
+        # None if the path did not have a tenant id prefix
+        self.tenant_id_from_path = tenant_id_from_path
+
+
+class RouteTable:
+    """
+    All the APIs handled by the recipes, keyed by (method, path without the api
+    base path). This gives the same result as calling
+    RecipeModule.return_api_id_if_can_handle_request on each recipe in turn,
+    with two dict lookups per request: one for the path as is, and one for the
+    path with its first segment taken as the tenant id.
+    """
+
+    def __init__(self, api_base_path: NormalisedURLPath, recipes: List[RecipeModule]):
+        self.api_base_path = api_base_path.get_as_string_dangerous()
+        # The order is used to pick the same API as the recipe by recipe loop,
+        # which checks the recipes (and the APIs of each recipe) in order.
+        self.routes: Dict[Tuple[str, str], List[Tuple[int, RecipeModule, str]]] = {}
+        order = 0
+        for recipe in recipes:
+            for api in recipe.get_apis_handled():
+                order += 1
+                if api.disabled:
+                    continue
+                key = (
+                    api.method,
+                    api.path_without_api_base_path.get_as_string_dangerous(),
+                )
+                self.routes.setdefault(key, []).append((order, recipe, api.request_id))
+
+    @staticmethod
+    def can_be_used_for(recipes: List[RecipeModule]) -> bool:
+        # Recipes that override return_api_id_if_can_handle_request need to be
+        # asked directly.
+        return all(
+            type(recipe).return_api_id_if_can_handle_request
+            is RecipeModule.return_api_id_if_can_handle_request
+            for recipe in recipes
+        )
+
+    def find(self, path: str, method: str) -> List[RouteMatch]:
+        """
+        Returns the first matching API of each recipe that can handle the
+        request, in recipe order.
+        """
+        if not path.startswith(self.api_base_path):
+            return []
+        path = path[len(self.api_base_path) :]
+
+        matches: List[RouteMatch] = []
+        for order, recipe, api_id in self.routes.get((method, path), []):
+            matches.append(RouteMatch(order, recipe, api_id, None))
+
+        second_slash = path.find("/", 1)
+        if path.startswith("/") and second_slash != -1:
+            tenant_id = path[1:second_slash]
+            if TENANT_ID_REGEX.fullmatch(tenant_id):
+                remaining_path = path[second_slash:]
+                for order, recipe, api_id in self.routes.get(
+                    (method, remaining_path), []
+                ):
+                    matches.append(RouteMatch(order, recipe, api_id, tenant_id))
+
+        if len(matches) <= 1:
+            return matches
+
+        first_match_per_recipe: Dict[int, RouteMatch] = {}
+        for match in sorted(matches, key=lambda m: m.order):
+            first_match_per_recipe.setdefault(id(match.recipe), match)
+        return list(first_match_per_recipe.values())
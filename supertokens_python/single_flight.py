@@ -0,0 +1,103 @@
+# Copyright (c) 2025, VRAI Labs and/or its affiliates. All rights reserved.
+#
+# This software is licensed under the Apache License, Version 2.0 (the
+# "License") as published by the Apache Software Foundation.
+#
+# You may not use this file except in compliance with the License. You may
+# obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+from __future__ import annotations
+
+import asyncio
+from typing import (
+    Any,
+    Callable,
+    Coroutine,
+    Dict,
+    Generic,
+    MutableMapping,
+    Optional,
+    TypeVar,
+)
+from weakref import WeakKeyDictionary
+
+_T = TypeVar("_T")
+
+
+class SingleFlight(Generic[_T]):
+    """
+    Merges concurrent calls with the same key into a single task, so that for
+    example many requests that miss a cache at once share one fetch. Tasks
+    are only shared while they run; nothing is kept once they complete.
+
+    A task is bound to the event loop it was started on, so calls on
+    different loops never share one.
+    """
+
+    def __init__(self, on_error: Optional[Callable[[str, BaseException], None]] = None):
+        # Called with the key when a task fails
+        self.on_error = on_error
+        self._in_flight: MutableMapping[
+            asyncio.AbstractEventLoop, Dict[str, "asyncio.Task[_T]"]
+        ] = WeakKeyDictionary()
+
+    def is_in_flight(self, key: str) -> bool:
+        tasks = self._in_flight.get(asyncio.get_running_loop())
+        return tasks is not None and key in tasks
+
+    def get_or_start(
+        self, key: str, start: Callable[[], Coroutine[Any, Any, _T]]
+    ) -> "asyncio.Task[_T]":
+        """
+        Returns the task in flight for key, or starts one with start. The task
+        keeps running if the caller stops waiting for it.
+        """
+        loop = asyncio.get_running_loop()
+        tasks = self._in_flight.get(loop)
+        if tasks is None:
+            tasks = {}
+            self._in_flight[loop] = tasks
+
+        task = tasks.get(key)
+        if task is not None:
+            return task
+
+        task = loop.create_task(start())
+        tasks[key] = task
+
+        def on_done(t: "asyncio.Task[_T]"):
+            if tasks.get(key) is t:
+                del tasks[key]
+            # Retrieving the exception also stops asyncio from logging it
+            # again if every caller was cancelled
+            if not t.cancelled():
+                error = t.exception()
+                if error is not None and self.on_error is not None:
+                    self.on_error(key, error)
+
+        task.add_done_callback(on_done)
+        return task
+
+    async def run(self, key: str, start: Callable[[], Coroutine[Any, Any, _T]]) -> _T:
+        # shield so that a cancelled caller does not cancel the task that
+        # other callers are waiting on
+        return await asyncio.shield(self.get_or_start(key, start))
+
+    def forget(self):
+        """
+        Makes later calls start new tasks, while the ones in flight complete
+        for the callers already waiting on them.
+        """
+        for tasks in list(self._in_flight.values()):
+            tasks.clear()
+
+    def cancel(self):
+        for tasks in list(self._in_flight.values()):
+            for task in list(tasks.values()):
+                task.cancel()
+        self._in_flight.clear()
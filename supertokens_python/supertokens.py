@@ -26,7 +26,11 @@ from supertokens_python.logger import (
 )
 
 from .constants import FDI_KEY_HEADER, RID_KEY_HEADER, USER_COUNT
+from .core_call_cache import SharedCoreCallCacheConfig
+from .core_concurrency_limiter import CoreConcurrencyLimiterConfig
+from .core_host_health import CoreHostSelectionConfig
 from .exceptions import SuperTokensError
+from .http_client import HttpClientConfig
 from .interfaces import (
     CreateUserIdMappingOkResult,
     DeleteUserIdMappingOkResult,
@@ -37,10 +41,13 @@ from .interfaces import (
     UserIdMappingAlreadyExistsError,
     UserIDTypes,
 )
+from .json_backend import JsonBackendName, set_json_backend
 from .normalised_url_domain import NormalisedURLDomain
 from .normalised_url_path import NormalisedURLPath
 from .post_init_callbacks import PostSTInitCallbacks
 from .querier import Querier
+from .recipe_module import ApiIdWithTenantId, RecipeModule
+from .route_table import RouteTable
 from .utils import (
     get_rid_from_header,
     get_top_level_domain_for_same_site_resolution,
@@ -54,8 +61,6 @@ if TYPE_CHECKING:
     from supertokens_python.framework.response import BaseResponse
     from supertokens_python.recipe.session import SessionContainer
 
-    from .recipe_module import RecipeModule
-
 import json
 
 from .exceptions import BadInputError, GeneralError, raise_general_exception
@@ -86,11 +91,32 @@ class SupertokensConfig:
             ]
         ] = None,
         disable_core_call_cache: bool = False,
+        request_timeout: float = 30.0,
+        connect_timeout: Optional[float] = None,
+        http2: bool = False,
+        max_connections: Optional[int] = 100,
+        max_keepalive_connections: Optional[int] = 20,
+        keepalive_expiry: Optional[float] = 5.0,
+        shared_core_call_cache: Optional[SharedCoreCallCacheConfig] = None,
+        core_host_selection: Optional[CoreHostSelectionConfig] = None,
+        core_concurrency_limiter: Optional[CoreConcurrencyLimiterConfig] = None,
+        json_backend: Optional[JsonBackendName] = None,
     ):  # We keep this = None here because this is directly used by the user.
         self.connection_uri = connection_uri
         self.api_key = api_key
         self.network_interceptor = network_interceptor
         self.disable_core_call_cache = disable_core_call_cache
+        self.request_timeout = request_timeout
+        self.connect_timeout = connect_timeout
+        self.http2 = http2
+        self.max_connections = max_connections
+        self.max_keepalive_connections = max_keepalive_connections
+        self.keepalive_expiry = keepalive_expiry
+        self.shared_core_call_cache = shared_core_call_cache
+        self.core_host_selection = core_host_selection
+        self.core_concurrency_limiter = core_concurrency_limiter
+        # None uses the standard library; orjson and ujson need to be installed
+        self.json_backend = json_backend
 
 
 class Host:
@@ -243,11 +269,23 @@ class Supertokens:
                 filter(lambda x: x != "", supertokens_config.connection_uri.split(";")),
             )
         )
+        set_json_backend(supertokens_config.json_backend)
         Querier.init(
             hosts,
             supertokens_config.api_key,
             supertokens_config.network_interceptor,
             supertokens_config.disable_core_call_cache,
+            HttpClientConfig(
+                timeout=supertokens_config.request_timeout,
+                connect_timeout=supertokens_config.connect_timeout,
+                http2=supertokens_config.http2,
+                max_connections=supertokens_config.max_connections,
+                max_keepalive_connections=supertokens_config.max_keepalive_connections,
+                keepalive_expiry=supertokens_config.keepalive_expiry,
+            ),
+            supertokens_config.shared_core_call_cache,
+            supertokens_config.core_host_selection,
+            supertokens_config.core_concurrency_limiter,
         )
 
         if len(recipe_list) == 0:
@@ -326,6 +364,41 @@ class Supertokens:
             if telemetry is not None
             else (environ.get("TEST_MODE") != "testing")
         )
+        self.route_table: Optional[RouteTable] = None
+
+        # The api base path as it appears in the path of incoming requests, that
+        # is, without the api gateway path. Paths are compared before being URL
+        # encoded by some frameworks, so a base path with a "%" in it disables
+        # the check in can_skip_middleware.
+        api_base_path = self.app_info.api_base_path.get_as_string_dangerous()
+        self.request_path_prefix = api_base_path[
+            len(self.app_info.api_gateway_path.get_as_string_dangerous()) :
+        ]
+        if "%" in self.request_path_prefix:
+            self.request_path_prefix = ""
+
+    def compile_route_table(self):
+        if RouteTable.can_be_used_for(self.recipe_modules):
+            self.route_table = RouteTable(
+                self.app_info.api_base_path, self.recipe_modules
+            )
+        else:
+            self.route_table = None
+
+    def can_skip_middleware(self, request_path: str) -> bool:
+        """
+        A cheap check for the framework middlewares to run before wrapping the
+        request. It returns True only if middleware() would certainly not handle
+        a request with this (not yet normalised) path, because it is outside the
+        api base path.
+        """
+        # Paths starting with "//" may be parsed as having a host by some
+        # frameworks, so they are left to middleware()
+        return (
+            request_path.startswith("/")
+            and not request_path.startswith("//")
+            and not request_path.startswith(self.request_path_prefix)
+        )
 
     @staticmethod
     def init(
@@ -348,6 +421,7 @@ class Supertokens:
                 debug,
             )
             PostSTInitCallbacks.run_post_init_callbacks()
+            Supertokens.__instance.compile_route_table()
 
     @staticmethod
     def reset():
@@ -564,16 +638,9 @@ class Supertokens:
             request_rid = None
 
         async def handle_without_rid():
-            for recipe in self.recipe_modules:
-                log_debug_message(
-                    "middleware: Checking recipe ID for match: %s with path: %s and method: %s",
-                    recipe.get_recipe_id(),
-                    path.get_as_string_dangerous(),
-                    method,
-                )
-                api_and_tenant_id = await recipe.return_api_id_if_can_handle_request(
-                    path, method, user_context
-                )
+            for recipe, api_and_tenant_id in await self.find_apis_for_request(
+                path, method, self.recipe_modules, True, user_context
+            ):
                 if api_and_tenant_id is not None:
                     log_debug_message(
                         "middleware: Request being handled by recipe. ID is: %s",
@@ -626,10 +693,9 @@ class Supertokens:
 
             id_result = None
             final_matched_recipe = None
-            for recipe in matched_recipes:
-                current_id_result = await recipe.return_api_id_if_can_handle_request(
-                    path, method, user_context
-                )
+            for recipe, current_id_result in await self.find_apis_for_request(
+                path, method, matched_recipes, False, user_context
+            ):
                 if current_id_result is not None:
                     if id_result is not None:
                         raise ValueError(
@@ -663,6 +729,47 @@ class Supertokens:
             return request_handled
         return await handle_without_rid()
 
+    async def find_apis_for_request(
+        self,
+        path: NormalisedURLPath,
+        method: str,
+        recipes: List[RecipeModule],
+        first_match_only: bool,
+        user_context: Dict[str, Any],
+    ) -> List[Tuple[RecipeModule, ApiIdWithTenantId]]:
+        if self.route_table is None:
+            result: List[Tuple[RecipeModule, ApiIdWithTenantId]] = []
+            for recipe in recipes:
+                log_debug_message(
+                    "middleware: Checking recipe ID for match: %s with path: %s and method: %s",
+                    recipe.get_recipe_id(),
+                    path.get_as_string_dangerous(),
+                    method,
+                )
+                api_and_tenant_id = await recipe.return_api_id_if_can_handle_request(
+                    path, method, user_context
+                )
+                if api_and_tenant_id is not None:
+                    result.append((recipe, api_and_tenant_id))
+                    if first_match_only:
+                        break
+            return result
+
+        from supertokens_python.recipe.multitenancy.constants import DEFAULT_TENANT_ID
+
+        assert RecipeModule.get_tenant_id is not None
+        result = []
+        for match in self.route_table.find(path.get_as_string_dangerous(), method):
+            if not any(match.recipe is recipe for recipe in recipes):
+                continue
+            tenant_id = await RecipeModule.get_tenant_id(  # pylint: disable=not-callable
+                match.tenant_id_from_path or DEFAULT_TENANT_ID, user_context
+            )
+            result.append((match.recipe, ApiIdWithTenantId(match.api_id, tenant_id)))
+            if first_match_only:
+                break
+        return result
+
     async def handle_supertokens_error(
         self,
         request: BaseRequest,
@@ -177,3 +177,19 @@ def list_users_by_account_info(
             tenant_id, account_info, do_union_of_account_info, user_context
         )
     )
+
+
+def close_connection_pools() -> None:
+    from supertokens_python.asyncio import (
+        close_connection_pools as async_close_connection_pools,
+    )
+
+    return sync(async_close_connection_pools())
+
+
+def flush_delivery_queues(timeout_sec: Optional[float] = None) -> bool:
+    from supertokens_python.asyncio import (
+        flush_delivery_queues as async_flush_delivery_queues,
+    )
+
+    return sync(async_flush_delivery_queues(timeout_sec))
@@ -16,8 +16,6 @@ from __future__ import annotations
 from abc import ABC, abstractmethod
 from typing import TYPE_CHECKING, Any, Awaitable, Dict, List, Optional, TypeVar, Union
 
-import phonenumbers  # type: ignore
-from phonenumbers import format_number, parse  # type: ignore
 from typing_extensions import Literal
 
 _T = TypeVar("_T")
@@ -108,13 +106,19 @@ class LoginMethod(AccountInfo):
         )
 
     def has_same_phone_number_as(self, phone_number: Union[str, None]) -> bool:
+        from phonenumbers import (  # type: ignore
+            PhoneNumberFormat,
+            format_number,  # type: ignore
+            parse,  # type: ignore
+        )
+
         if phone_number is None:
             return False
 
         cleaned_phone = phone_number.strip()
         try:
             cleaned_phone = format_number(
-                parse(phone_number, None), phonenumbers.PhoneNumberFormat.E164
+                parse(phone_number, None), PhoneNumberFormat.E164
             )
         except Exception:
             pass  # here we just use the stripped version
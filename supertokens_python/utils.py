@@ -34,9 +34,6 @@ from typing import (
 )
 from urllib.parse import urlparse
 
-from httpx import HTTPStatusError, Response
-from tldextract import TLDExtract
-
 from supertokens_python.env.base import FLAG_tldextract_disable_http
 from supertokens_python.framework.django.framework import DjangoFramework
 from supertokens_python.framework.fastapi.framework import FastapiFramework
@@ -216,6 +213,8 @@ def deprecated_warn(msg: str):
 def handle_httpx_client_exceptions(
     e: Exception, input_: Union[Dict[str, Any], None] = None
 ):
+    from httpx import HTTPStatusError, Response
+
     if isinstance(e, HTTPStatusError) and isinstance(e.response, Response):  # type: ignore
         res = e.response  # type: ignore
         log_debug_message("Error status: %s", res.status_code)  # type: ignore
@@ -289,6 +288,12 @@ def get_top_level_domain_for_same_site_resolution(url: str) -> str:
     if hostname.startswith("localhost") or is_an_ip_address(hostname):
         return "localhost"
 
+    return _get_registered_domain(hostname)
+
+
+def _get_registered_domain(hostname: str) -> str:
+    from tldextract import TLDExtract
+
     extract = TLDExtract(fallback_to_snapshot=True, include_psl_private_domains=True)
     # Explicitly disable HTTP calls, use snapshot bundled into library
     if FLAG_tldextract_disable_http():
@@ -0,0 +1,224 @@
+# Copyright (c) 2025, VRAI Labs and/or its affiliates. All rights reserved.
+#
+# This software is licensed under the Apache License, Version 2.0 (the
+# "License") as published by the Apache Software Foundation.
+#
+# You may not use this file except in compliance with the License. You may
+# obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+import asyncio
+from typing import Any, Dict
+
+import httpx
+import respx
+from pytest import mark, raises
+from supertokens_python import init
+from supertokens_python.querier import Querier
+from supertokens_python.recipe import multitenancy, session
+from supertokens_python.recipe.multitenancy.asyncio import (
+    create_or_update_tenant,
+    create_or_update_third_party_config,
+    delete_tenant,
+    get_tenant,
+    list_all_tenants,
+    warm_up_tenant_config_cache,
+)
+from supertokens_python.recipe.multitenancy.interfaces import (
+    TenantConfigCreateOrUpdate,
+)
+from supertokens_python.recipe.multitenancy.utils import (
+    validate_and_normalise_user_input,
+)
+from supertokens_python.recipe.thirdparty.provider import (
+    ProviderClientConfig,
+    ProviderConfig,
+)
+
+from tests.utils import get_st_init_args
+
+pytestmark = mark.asyncio
+
+
+def tenant_json(tenant_id: str, core_config: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        "tenantId": tenant_id,
+        "thirdParty": {"providers": []},
+        "coreConfig": core_config,
+        "firstFactors": None,
+        "requiredSecondaryFactors": None,
+    }
+
+
+def init_with_cache(ttl: int = 60):
+    init(
+        **get_st_init_args(
+            url="http://localhost:6789",
+            recipe_list=[
+                session.init(),
+                multitenancy.init(tenant_config_cache_ttl_sec=ttl),
+            ],
+        )
+    )
+    Querier.api_version = "3.0"
+
+
+async def test_get_tenant_is_served_from_cache_until_written():
+    init_with_cache()
+
+    with respx.mock() as mocker:
+        get_t1 = mocker.get(
+            "http://localhost:6789/t1/recipe/multitenancy/tenant/v2"
+        ).mock(
+            side_effect=[
+                httpx.Response(200, json={"status": "OK", **tenant_json("t1", {})}),
+                httpx.Response(
+                    200, json={"status": "OK", **tenant_json("t1", {"a": 1})}
+                ),
+                httpx.Response(
+                    200, json={"status": "OK", **tenant_json("t1", {"a": 2})}
+                ),
+            ]
+        )
+        get_missing = mocker.get(
+            "http://localhost:6789/missing/recipe/multitenancy/tenant/v2"
+        ).mock(httpx.Response(200, json={"status": "TENANT_NOT_FOUND_ERROR"}))
+        mocker.put("http://localhost:6789/recipe/multitenancy/tenant/v2").mock(
+            httpx.Response(200, json={"status": "OK", "createdNew": False})
+        )
+        mocker.put(
+            "http://localhost:6789/t1/recipe/multitenancy/config/thirdparty"
+        ).mock(httpx.Response(200, json={"status": "OK", "createdNew": True}))
+
+        tenant = await get_tenant("t1")
+        assert tenant is not None and tenant.core_config == {}
+        # Callers get their own copy, so changing it does not affect the cache
+        tenant.core_config["changed"] = True
+        tenant = await get_tenant("t1")
+        assert tenant is not None and tenant.core_config == {}
+        assert get_t1.call_count == 1
+
+        assert await get_tenant("missing") is None
+        assert await get_tenant("missing") is None
+        assert get_missing.call_count == 1
+
+        await create_or_update_tenant("t1", TenantConfigCreateOrUpdate({"a": 1}))
+        tenant = await get_tenant("t1")
+        assert tenant is not None and tenant.core_config == {"a": 1}
+        assert get_t1.call_count == 2
+
+        await create_or_update_third_party_config(
+            "t1",
+            ProviderConfig(
+                "google", clients=[ProviderClientConfig(client_id="client-id")]
+            ),
+        )
+        tenant = await get_tenant("t1")
+        assert tenant is not None and tenant.core_config == {"a": 2}
+        assert get_t1.call_count == 3
+
+
+async def test_configs_fetched_during_a_write_are_not_cached():
+    init_with_cache()
+    tenants: Dict[str, Dict[str, Any]] = {"t1": tenant_json("t1", {})}
+    release = asyncio.Event()
+
+    async def slow(response: Dict[str, Any]) -> httpx.Response:
+        # The core reads the tenants before the write, but replies after it
+        await release.wait()
+        return httpx.Response(200, json=response)
+
+    async def get_new_tenant(_: httpx.Request) -> httpx.Response:
+        if "new" in tenants:
+            return httpx.Response(200, json={"status": "OK", **tenants["new"]})
+        return await slow({"status": "TENANT_NOT_FOUND_ERROR"})
+
+    async def list_tenants(_: httpx.Request) -> httpx.Response:
+        return await slow({"status": "OK", "tenants": list(tenants.values())})
+
+    async def create_tenant(_: httpx.Request) -> httpx.Response:
+        tenants["new"] = tenant_json("new", {})
+        return httpx.Response(200, json={"status": "OK", "createdNew": True})
+
+    async def remove_tenant(_: httpx.Request) -> httpx.Response:
+        del tenants["t1"]
+        return httpx.Response(200, json={"status": "OK", "didExist": True})
+
+    with respx.mock() as mocker:
+        mocker.get("http://localhost:6789/new/recipe/multitenancy/tenant/v2").mock(
+            side_effect=get_new_tenant
+        )
+        get_t1 = mocker.get(
+            "http://localhost:6789/t1/recipe/multitenancy/tenant/v2"
+        ).mock(httpx.Response(200, json={"status": "TENANT_NOT_FOUND_ERROR"}))
+        mocker.get("http://localhost:6789/recipe/multitenancy/tenant/list/v2").mock(
+            side_effect=list_tenants
+        )
+        mocker.put("http://localhost:6789/recipe/multitenancy/tenant/v2").mock(
+            side_effect=create_tenant
+        )
+        mocker.post("http://localhost:6789/recipe/multitenancy/tenant/remove").mock(
+            side_effect=remove_tenant
+        )
+
+        in_flight_get = asyncio.ensure_future(get_tenant("new"))
+        in_flight_list = asyncio.ensure_future(list_all_tenants())
+        await asyncio.sleep(0.01)
+        await create_or_update_tenant("new", TenantConfigCreateOrUpdate({}))
+        await delete_tenant("t1")
+        release.set()
+        assert await in_flight_get is None
+        assert len((await in_flight_list).tenants) == 1
+
+        # The tenant that was just created is not served as missing
+        assert await get_tenant("new") is not None
+        # And the one that was just deleted is not served from the list
+        assert await get_tenant("t1") is None
+        assert get_t1.call_count == 1
+
+
+async def test_warm_up_fills_the_tenant_config_cache():
+    init_with_cache()
+
+    with respx.mock(assert_all_called=False) as mocker:
+        mocker.get("http://localhost:6789/recipe/multitenancy/tenant/list/v2").mock(
+            httpx.Response(
+                200,
+                json={
+                    "status": "OK",
+                    "tenants": [
+                        tenant_json(f"t{i}", {"index": i}) for i in range(1000)
+                    ],
+                },
+            )
+        )
+        get_tenant_route = mocker.get(
+            url__regex=r"http://localhost:6789/.*/recipe/multitenancy/tenant/v2"
+        )
+
+        await warm_up_tenant_config_cache()
+
+        for i in range(1000):
+            tenant = await get_tenant(f"t{i}")
+            assert tenant is not None and tenant.core_config == {"index": i}
+        assert get_tenant_route.call_count == 0
+
+
+async def test_tenant_config_cache_is_disabled_by_default():
+    init(
+        **get_st_init_args(
+            url="http://localhost:6789",
+            recipe_list=[session.init(), multitenancy.init()],
+        )
+    )
+    from supertokens_python.recipe.multitenancy.recipe import MultitenancyRecipe
+
+    recipe_implementation = MultitenancyRecipe.get_instance().recipe_implementation
+    assert recipe_implementation.tenant_config_cache is None  # type: ignore
+
+    with raises(ValueError):
+        validate_and_normalise_user_input(None, None, -1)
@@ -0,0 +1,185 @@
+# Copyright (c) 2025, VRAI Labs and/or its affiliates. All rights reserved.
+#
+# This software is licensed under the Apache License, Version 2.0 (the
+# "License") as published by the Apache Software Foundation.
+#
+# You may not use this file except in compliance with the License. You may
+# obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+import time
+from typing import Any, Dict
+
+import httpx
+import jwt
+import respx
+from pytest import fixture, mark, raises
+from supertokens_python import init
+from supertokens_python.querier import Querier
+from supertokens_python.recipe import oauth2provider, session
+from supertokens_python.recipe.oauth2provider.access_token_cache import (
+    ValidatedOAuth2TokenCache,
+)
+from supertokens_python.recipe.oauth2provider.asyncio import (
+    revoke_tokens_by_client_id,
+    revoke_tokens_by_session_handle,
+    validate_oauth2_access_token,
+)
+from supertokens_python.recipe.oauth2provider.interfaces import (
+    OAuth2TokenValidationRequirements,
+    RevokeTokenUsingClientIDAndClientSecret,
+)
+from supertokens_python.recipe.oauth2provider.recipe import OAuth2ProviderRecipe
+from supertokens_python.recipe.session.jwks import reset_jwks_cache
+
+from tests.utils import generate_test_signing_key, get_st_init_args
+
+pytestmark = mark.asyncio
+
+CORE_URL = "http://localhost:6789"
+
+
+@fixture(autouse=True)
+def teardown_function():
+    yield
+    reset_jwks_cache()
+
+
+def create_oauth2_access_token(
+    private_key: Any, session_handle: str, client_id: str, exp: int
+) -> str:
+    payload: Dict[str, Any] = {
+        "sub": "userId",
+        "exp": exp,
+        "iat": int(time.time()),
+        "stt": 1,
+        "client_id": client_id,
+        "sessionHandle": session_handle,
+        "scp": ["profile"],
+    }
+    return jwt.encode(
+        payload, private_key, algorithm="RS256", headers={"kid": "d-test-key"}
+    )
+
+
+def init_oauth2provider(**kwargs: int):
+    init(
+        **get_st_init_args(
+            url=CORE_URL,
+            recipe_list=[session.init(), oauth2provider.init(**kwargs)],
+        )
+    )
+    Querier.api_version = "5.2"
+
+
+async def test_cache_entries_are_capped_by_exp_and_evicted_by_index():
+    private_key, _ = generate_test_signing_key()
+    exp = int(time.time()) + 3600
+    cache = ValidatedOAuth2TokenCache(max_size=2, max_staleness_sec=60)
+
+    tokens = [
+        create_oauth2_access_token(private_key, f"handle-{i}", "client", exp)
+        for i in range(3)
+    ]
+    for token in tokens:
+        cache.put(token, jwt.decode(token, options={"verify_signature": False}))
+    assert len(cache) == 2
+    assert cache.get(tokens[0]) is None
+
+    cache.evict_session_handle("handle-1")
+    assert cache.get(tokens[1]) is None
+    cache.evict_client_id("client")
+    assert len(cache) == 0
+
+    almost_expired = create_oauth2_access_token(
+        private_key, "handle", "client", int(time.time())
+    )
+    assert (
+        cache.put(
+            almost_expired,
+            jwt.decode(almost_expired, options={"verify_signature": False}),
+        )
+        is None
+    )
+
+
+async def test_validated_tokens_and_introspection_results_are_cached():
+    private_key, jwk = generate_test_signing_key()
+    init_oauth2provider(access_token_cache_size=100)
+    token = create_oauth2_access_token(
+        private_key, "handle", "client", int(time.time()) + 3600
+    )
+    recipe_implementation = OAuth2ProviderRecipe.get_instance().recipe_implementation
+
+    with respx.mock() as mocker:
+        jwks_route = mocker.get(f"{CORE_URL}/.well-known/jwks.json").mock(
+            httpx.Response(200, json={"keys": [jwk]})
+        )
+        introspect_route = mocker.post(f"{CORE_URL}/recipe/oauth/introspect").mock(
+            httpx.Response(200, json={"status": "OK", "active": True})
+        )
+        mocker.post(f"{CORE_URL}/recipe/oauth/session/revoke").mock(
+            httpx.Response(200, json={"status": "OK"})
+        )
+        mocker.post(f"{CORE_URL}/recipe/oauth/token/revoke").mock(
+            httpx.Response(200, json={"status": "OK"})
+        )
+
+        for _ in range(3):
+            res = await validate_oauth2_access_token(token, check_database=True)
+            assert res.payload["sessionHandle"] == "handle"
+        assert jwks_route.call_count == 1
+        assert introspect_route.call_count == 1
+
+        await revoke_tokens_by_session_handle("handle")
+        await validate_oauth2_access_token(token, check_database=True)
+        assert introspect_route.call_count == 2
+
+        await revoke_tokens_by_client_id("client")
+        await validate_oauth2_access_token(token, check_database=True)
+        assert introspect_route.call_count == 3
+
+        await recipe_implementation.revoke_token(
+            RevokeTokenUsingClientIDAndClientSecret(token, "client", None), {}
+        )
+        introspect_route.mock(
+            httpx.Response(200, json={"status": "OK", "active": False})
+        )
+        with raises(Exception, match="revoked"):
+            await validate_oauth2_access_token(token, check_database=True)
+        assert introspect_route.call_count == 4
+
+
+async def test_changing_a_validated_payload_does_not_affect_the_cache():
+    private_key, jwk = generate_test_signing_key()
+    init_oauth2provider(access_token_cache_size=100)
+    token = create_oauth2_access_token(
+        private_key, "handle", "client", int(time.time()) + 3600
+    )
+
+    with respx.mock() as mocker:
+        mocker.get(f"{CORE_URL}/.well-known/jwks.json").mock(
+            httpx.Response(200, json={"keys": [jwk]})
+        )
+
+        res = await validate_oauth2_access_token(token)
+        res.payload["scp"].append("admin")
+        res = await validate_oauth2_access_token(token)
+        assert res.payload["scp"] == ["profile"]
+        res.payload["scp"].clear()
+
+        res = await validate_oauth2_access_token(
+            token, requirements=OAuth2TokenValidationRequirements(scopes=["profile"])
+        )
+        assert res.payload["scp"] == ["profile"]
+
+
+async def test_oauth2_access_token_cache_is_disabled_by_default():
+    init_oauth2provider()
+
+    recipe_implementation = OAuth2ProviderRecipe.get_instance().recipe_implementation
+    assert recipe_implementation.access_token_cache is None  # type: ignore
@@ -0,0 +1,93 @@
+# Copyright (c) 2025, VRAI Labs and/or its affiliates. All rights reserved.
+#
+# This software is licensed under the Apache License, Version 2.0 (the
+# "License") as published by the Apache Software Foundation.
+#
+# You may not use this file except in compliance with the License. You may
+# obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+import asyncio
+from typing import Any, Dict, List
+
+from pytest import mark
+from pytest_mock.plugin import MockerFixture
+from supertokens_python import init
+from supertokens_python.recipe import session
+from supertokens_python.recipe.session.claims import BooleanClaim, PrimitiveArrayClaim
+from supertokens_python.recipe.session.recipe import SessionRecipe
+from supertokens_python.types import RecipeUserId
+
+from tests.utils import get_st_init_args
+
+pytestmark = mark.asyncio
+
+
+class FetchTracker:
+    def __init__(self):
+        self.calls: List[str] = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    def fetcher(self, key: str, value: Any):
+        async def fetch_value(*_: Any):
+            self.calls.append(key)
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+            await asyncio.sleep(0.01)
+            self.in_flight -= 1
+            return value
+
+        return fetch_value
+
+
+def init_session():
+    init(**get_st_init_args(url="http://localhost:6789", recipe_list=[session.init()]))
+
+
+async def validate_claims(payload: Dict[str, Any], validators: List[Any]):
+    return await SessionRecipe.get_instance().recipe_implementation.validate_claims(
+        "user", RecipeUserId("user"), payload, validators, {}
+    )
+
+
+async def test_claims_are_refetched_concurrently_and_once_per_claim():
+    init_session()
+    tracker = FetchTracker()
+    roles = PrimitiveArrayClaim("st-role", tracker.fetcher("st-role", ["admin"]))
+    verified = BooleanClaim("st-ev", tracker.fetcher("st-ev", True))
+
+    res = await validate_claims(
+        {"sub": "user"},
+        [
+            roles.validators.includes("admin"),
+            verified.validators.is_true(None),
+            roles.validators.excludes("guest"),
+        ],
+    )
+
+    assert sorted(tracker.calls) == ["st-ev", "st-role"]
+    assert tracker.max_in_flight == 2
+    assert res.invalid_claims == []
+    assert res.access_token_payload_update is not None
+    assert res.access_token_payload_update["st-role"]["v"] == ["admin"]
+    assert res.access_token_payload_update["st-ev"]["v"] is True
+
+
+async def test_payload_is_not_updated_if_nothing_was_refetched(mocker: MockerFixture):
+    init_session()
+    tracker = FetchTracker()
+    verified = BooleanClaim("st-ev", tracker.fetcher("st-ev", None))
+    json_dumps = mocker.patch("supertokens_python.recipe.session.utils.json.dumps")
+
+    res = await validate_claims({"sub": "user"}, [verified.validators.is_true(None)])
+
+    assert tracker.calls == ["st-ev"]
+    assert res.access_token_payload_update is None
+    assert len(res.invalid_claims) == 1
+    # Validation results are only serialised for debug logs
+    json_dumps.assert_not_called()
@@ -0,0 +1,179 @@
+import time
+from typing import Any, Dict
+
+import httpx
+import jwt
+import pytest
+import respx
+from supertokens_python import init
+from supertokens_python.recipe import session
+from supertokens_python.recipe.session.access_token_cache import (
+    VerifiedAccessTokenCache,
+)
+from supertokens_python.recipe.session.asyncio import (
+    get_session_without_request_response,
+)
+from supertokens_python.recipe.session.jwks import reset_jwks_cache
+from supertokens_python.recipe.session.jwt import (
+    parse_jwt_without_signature_verification,
+)
+from supertokens_python.recipe.session.recipe import SessionRecipe
+
+from tests.utils import generate_test_signing_key, get_st_init_args
+
+pytestmark = pytest.mark.asyncio
+
+
+@pytest.fixture(autouse=True)
+def teardown_function():
+    yield
+    reset_jwks_cache()
+
+
+def create_access_token(private_key: Any, session_handle: str, exp: int) -> str:
+    now = int(time.time())
+    payload: Dict[str, Any] = {
+        "sub": "userId",
+        "rsub": "userId",
+        "exp": exp,
+        "iat": now,
+        "sessionHandle": session_handle,
+        "refreshTokenHash1": "hash",
+        "parentRefreshTokenHash1": None,
+        "antiCsrfToken": None,
+        "tId": "public",
+    }
+    return jwt.encode(
+        payload,
+        private_key,
+        algorithm="RS256",
+        headers={"kid": "d-test-key", "version": "5"},
+    )
+
+
+def get_info(session_handle: str, exp: int) -> Dict[str, Any]:
+    return {"sessionHandle": session_handle, "expiryTime": exp, "antiCsrfToken": None}
+
+
+async def test_cache_evicts_least_recently_used_entries():
+    private_key, _ = generate_test_signing_key()
+    exp = int(time.time()) + 3600
+    tokens = [
+        parse_jwt_without_signature_verification(
+            create_access_token(private_key, f"handle-{i}", exp)
+        )
+        for i in range(3)
+    ]
+
+    cache = VerifiedAccessTokenCache(max_size=2, ttl_sec=60)
+    cache.put(tokens[0], get_info("handle-0", exp * 1000))
+    cache.put(tokens[1], get_info("handle-1", exp * 1000))
+    assert cache.get(tokens[0]) is not None
+
+    cache.put(tokens[2], get_info("handle-2", exp * 1000))
+
+    assert len(cache) == 2
+    assert cache.get(tokens[0]) is not None
+    assert cache.get(tokens[1]) is None
+    assert cache.get(tokens[2]) is not None
+
+
+async def test_cache_never_serves_entries_past_token_expiry():
+    private_key, _ = generate_test_signing_key()
+    token = parse_jwt_without_signature_verification(
+        create_access_token(private_key, "handle", int(time.time()) + 3600)
+    )
+
+    cache = VerifiedAccessTokenCache(max_size=10, ttl_sec=60)
+    cache.put(token, get_info("handle", int(time.time() * 1000) + 100))
+    assert cache.get(token) is not None
+
+    time.sleep(0.2)
+    assert cache.get(token) is None
+    assert len(cache) == 0
+
+
+async def test_cache_requires_exact_token_match():
+    private_key, _ = generate_test_signing_key()
+    exp = int(time.time()) + 3600
+    raw_token = create_access_token(private_key, "handle", exp)
+    token = parse_jwt_without_signature_verification(raw_token)
+
+    cache = VerifiedAccessTokenCache(max_size=10, ttl_sec=60)
+    cache.put(token, get_info("handle", exp * 1000))
+
+    header, _, signature = raw_token.split(".")
+    forged_payload = create_access_token(private_key, "other", exp).split(".")[1]
+    forged = parse_jwt_without_signature_verification(
+        ".".join([header, forged_payload, signature])
+    )
+    assert cache.get(forged) is None
+
+
+async def test_get_session_uses_the_access_token_cache():
+    private_key, jwk = generate_test_signing_key()
+    init(
+        **get_st_init_args(
+            url="http://localhost:6789",
+            recipe_list=[
+                session.init(
+                    anti_csrf="NONE",
+                    access_token_cache_size=100,
+                )
+            ],
+        )
+    )
+
+    access_token = create_access_token(private_key, "handle", int(time.time()) + 3600)
+    recipe_implementation = SessionRecipe.get_instance().recipe_implementation
+    cache = recipe_implementation.access_token_cache  # type: ignore
+    assert cache is not None
+
+    with respx.mock() as mocker:
+        jwks_route = mocker.get("http://localhost:6789/.well-known/jwks.json").mock(
+            httpx.Response(200, json={"keys": [jwk]})
+        )
+
+        s = await get_session_without_request_response(access_token)
+        assert s.get_handle() == "handle"
+        assert len(cache) == 1
+        assert jwks_route.call_count == 1
+
+        # Served from the cache, so the keys are not needed to verify it again
+        reset_jwks_cache()
+        s = await get_session_without_request_response(access_token)
+        assert s.get_user_id() == "userId"
+        assert jwks_route.call_count == 1
+
+        recipe_implementation.evict_from_access_token_cache(["handle"])  # type: ignore
+        assert len(cache) == 0
+
+
+async def test_access_token_cache_is_disabled_by_default():
+    init(**get_st_init_args(url="http://localhost:6789", recipe_list=[session.init()]))
+
+    recipe_implementation = SessionRecipe.get_instance().recipe_implementation
+    assert recipe_implementation.access_token_cache is None  # type: ignore
+
+
+async def test_cache_returns_a_copy_of_the_payload():
+    private_key, _ = generate_test_signing_key()
+    exp = int(time.time()) + 3600
+    token = parse_jwt_without_signature_verification(
+        create_access_token(private_key, "handle", exp)
+    )
+
+    cache = VerifiedAccessTokenCache(max_size=10, ttl_sec=60)
+    info = {**get_info("handle", exp * 1000), "userData": {"claim": 1}}
+    cache.put(token, info)
+    info["userData"]["claim"] = 2
+
+    cached = cache.get(token)
+    assert cached is not None
+    assert cached["userData"] == {"claim": 1}
+    # Like the claims added while validating the session
+    cached["userData"]["added"] = True
+
+    cached = cache.get(token)
+    assert cached is not None
+    assert cached["userData"] == {"claim": 1}
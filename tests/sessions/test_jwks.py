@@ -1,13 +1,15 @@
+import asyncio
 import json
 import logging
-import threading
 import time
-from typing import Callable, List
+from typing import List
 
+import httpx
 import pytest
-import requests
+import respx
 from _pytest.logging import LogCaptureFixture
 from fastapi import Depends, FastAPI, Request
+from jwt import PyJWKSet
 from pytest import fixture
 from supertokens_python import init
 from supertokens_python.framework.fastapi import get_middleware
@@ -23,6 +25,7 @@ from supertokens_python.recipe.session.asyncio import (
 from supertokens_python.recipe.session.framework.fastapi import verify_session
 from supertokens_python.recipe.session.jwks import (
     JWKSConfig,
+    KeyStore,
     get_cached_keys,
     get_latest_keys,
     reset_jwks_cache,
@@ -35,6 +38,7 @@ from tests.testclient import TestClientWithNoCookieJar as TestClient
 from tests.utils import (
     get_new_core_app_url,
     get_st_init_args,
+    get_test_jwks,
     min_api_version,
     reset,
 )
@@ -134,19 +138,19 @@ async def test_that_jwks_result_is_refreshed_properly(caplog: LogCaptureFixture)
 
     assert next(jwks_refresh_count) == 0
 
-    keys_before = get_latest_keys(SessionRecipe.get_instance().config)
+    keys_before = await get_latest_keys(SessionRecipe.get_instance().config)
     kids_before: List[str] = [k.key_id for k in keys_before]  # type: ignore
 
     assert next(jwks_refresh_count) == 1
 
-    keys_between = get_latest_keys(SessionRecipe.get_instance().config)
+    keys_between = await get_latest_keys(SessionRecipe.get_instance().config)
     kids_between: List[str] = [k.key_id for k in keys_between]  # type: ignore
 
     time.sleep(3)
 
     assert next(jwks_refresh_count) == 1
 
-    keys_after = get_latest_keys(SessionRecipe.get_instance().config)
+    keys_after = await get_latest_keys(SessionRecipe.get_instance().config)
     kids_after: List[str] = [k.key_id for k in keys_after]  # type: ignore
 
     assert next(jwks_refresh_count) == 2
@@ -344,7 +348,7 @@ async def test_that_combined_jwks_throws_for_invalid_connection(
     )
 
     with pytest.raises(Exception):
-        get_latest_keys(SessionRecipe.get_instance().config)
+        await get_latest_keys(SessionRecipe.get_instance().config)
 
     assert next(jwk_refresh_count) == 1
     JWKSConfig.update(original_jwks_config)
@@ -373,7 +377,7 @@ async def test_that_combined_jwks_doesnot_throw_if_atleast_one_core_url_is_valid
         )
     )
 
-    combined_jwks_res = get_latest_keys(SessionRecipe.get_instance().config)
+    combined_jwks_res = await get_latest_keys(SessionRecipe.get_instance().config)
     assert len(combined_jwks_res) > 0
     assert next(jwk_refresh_count) == 1
 
@@ -395,8 +399,8 @@ async def test_that_combined_jwks_throw_if_all_core_urls_are_invalid(
         )
     )
 
-    with pytest.raises(requests.exceptions.ConnectionError):
-        get_latest_keys(SessionRecipe.get_instance().config)
+    with pytest.raises(httpx.ConnectError):
+        await get_latest_keys(SessionRecipe.get_instance().config)
 
     assert next(jwk_refresh_count) == 3
 
@@ -487,7 +491,7 @@ async def test_that_sdk_tries_fetching_jwks_for_all_core_hosts(
     assert next(urls_attempted_count) == 0
     assert next(get_combined_jwks_count) == 0
 
-    get_latest_keys(SessionRecipe.get_instance().config)
+    await get_latest_keys(SessionRecipe.get_instance().config)
 
     assert next(urls_attempted_count) == 3
     assert next(get_combined_jwks_count) == 1
@@ -514,7 +518,7 @@ async def test_that_sdk_fetches_jwks_from_core_hosts_until_a_valid_response(
 
     assert next(urls_attempted_count) == 0
 
-    get_latest_keys(SessionRecipe.get_instance().config)
+    await get_latest_keys(SessionRecipe.get_instance().config)
 
     assert next(urls_attempted_count) == 2
 
@@ -610,6 +614,7 @@ async def test_that_locking_for_jwks_cache_works(caplog: LogCaptureFixture):
     not_returned_from_cache_count = get_log_occurence_count(
         caplog, "Returning JWKS from fetch"
     )
+    fetch_count = get_log_occurence_count(caplog)
 
     original_jwks_config = JWKSConfig.copy()
 
@@ -626,64 +631,46 @@ async def test_that_locking_for_jwks_cache_works(caplog: LogCaptureFixture):
     )
 
     state = {
-        "should_stop": False,
         "different_key_found_count": 0,
     }
 
-    jwks = get_latest_keys(SessionRecipe.get_instance().config)
+    jwks = await get_latest_keys(SessionRecipe.get_instance().config)
     keys = [k.key_id for k in jwks]  # type: ignore
 
-    def stop_after_11s():
-        time.sleep(11)
-        state["should_stop"] = True
+    stop_at = time.time() + 11
+    task_count = 10
 
-    stop_thread = threading.Thread(target=stop_after_11s)
-    stop_thread.start()
-
-    thread_count = 10
-
-    def jwks_lock_test_routine(i: int, callback: Callable[[], None]):
-        callback()
-        time.sleep(0.1)
-        if state["should_stop"]:
-            return
-        jwks_lock_test_routine(i, callback)
-
-    def callback():
+    async def jwks_lock_test_routine():
         nonlocal keys
-        current_keys: List[str] = [
-            k.key_id for k in get_latest_keys(SessionRecipe.get_instance().config)
-        ]  # type: ignore
-        new_keys = [k for k in current_keys if k not in keys]
-        if len(new_keys) > 0:
-            state["different_key_found_count"] += 1
-            keys = current_keys
-
-    threads: List[threading.Thread] = []
-    for i in range(thread_count):
-        t = threading.Thread(target=jwks_lock_test_routine, args=(i, callback))
-        threads.append(t)
-        t.start()
-
-    stop_thread.join()
-
-    for t in threads:
-        t.join()
+        while time.time() < stop_at:
+            current_keys: List[str] = [
+                k.key_id
+                for k in await get_latest_keys(SessionRecipe.get_instance().config)
+            ]  # type: ignore
+            new_keys = [k for k in current_keys if k not in keys]
+            if len(new_keys) > 0:
+                state["different_key_found_count"] += 1
+                keys = current_keys
+            await asyncio.sleep(0.1)
+
+    await asyncio.gather(*[jwks_lock_test_routine() for _ in range(task_count)])
 
     # We need to test for both:
     # - The keys changing
-    # - The number of times the result is not returned from cache
+    # - The number of times the core is queried
 
     # Because even if the keys change only twice it could still mean that the SDK's cache locking
     # does not work correctly and that it tried to query the core more times than it should have
 
-    # Checking for both the key change count and the cache miss count verifies the locking behaviour properly
-
     # With the signing key interval as 5 seconds, and the test making requests for 11 seconds
     # You expect the keys to change twice
     assert state["different_key_found_count"] == 2
-    # With cache lifetime being 2s, we expect the cache to be missed 5 times
-    assert next(not_returned_from_cache_count) == 1 + 5  # 1 original + 5 misses
+    # The keys are refreshed in the background before the 2s cache lifetime runs out,
+    # so the callers never wait on a fetch after the first one
+    assert next(not_returned_from_cache_count) == 1
+    # Concurrent callers share a single refresh, so the core is only queried once per
+    # background refresh window (1.6s) and not once per caller
+    assert next(fetch_count) <= 1 + int(11 / 1.6) + 1
     JWKSConfig.update(original_jwks_config)
 
 
@@ -752,3 +739,79 @@ async def test_session_verification_of_jwt_with_dynamic_signing_key_mode_works_a
             str(e)
             == "The access token doesn't match the use_dynamic_access_token_signing_key setting"
         )
+
+
+async def test_that_concurrent_jwks_misses_share_a_single_fetch():
+    init(
+        **get_st_init_args(
+            url="http://localhost:6789",
+            recipe_list=[session.init()],
+        )
+    )
+
+    with respx.mock() as mocker:
+        jwks_route = mocker.get("http://localhost:6789/.well-known/jwks.json").mock(
+            httpx.Response(200, json=get_test_jwks())
+        )
+
+        results = await asyncio.gather(
+            *[
+                get_latest_keys(SessionRecipe.get_instance().config, "d-test-key")
+                for _ in range(10)
+            ]
+        )
+
+        assert jwks_route.call_count == 1
+        for keys in results:
+            assert [k.key_id for k in keys] == ["d-test-key"]  # type: ignore
+
+
+async def test_that_jwks_is_refreshed_in_the_background_before_expiry():
+    init(
+        **get_st_init_args(
+            url="http://localhost:6789",
+            recipe_list=[session.init(jwks_refresh_interval_sec=1)],
+        )
+    )
+
+    with respx.mock() as mocker:
+        jwks_route = mocker.get("http://localhost:6789/.well-known/jwks.json").mock(
+            httpx.Response(200, json=get_test_jwks())
+        )
+
+        await get_latest_keys(SessionRecipe.get_instance().config)
+        assert jwks_route.call_count == 1
+
+        await asyncio.sleep(0.85)
+
+        # Served from the cache, while a refresh is started in the background
+        keys = await get_latest_keys(SessionRecipe.get_instance().config)
+        assert len(keys) == 1
+        assert jwks_route.call_count == 1
+
+        await asyncio.sleep(0.2)
+        assert jwks_route.call_count == 2
+
+        # The background refresh extended the lifetime of the cache
+        await asyncio.sleep(0.3)
+        assert get_cached_keys() is not None
+        await get_latest_keys(SessionRecipe.get_instance().config)
+        assert jwks_route.call_count == 2
+
+
+async def test_that_key_store_indexes_keys_by_kid():
+    jwks = get_test_jwks("d-1700000000000")
+    jwks["keys"] += get_test_jwks("s-1600000000000")["keys"]
+    jwks["keys"] += get_test_jwks("custom-kid")["keys"]
+    keys = PyJWKSet.from_dict(jwks).keys
+
+    store = KeyStore(keys, 60)
+
+    assert store.get_matching_keys(None) == keys
+    assert store.get_matching_keys("s-1600000000000") == [keys[1]]
+    assert store.get_matching_keys("unknown-kid") is None
+    assert store.key_created_times == {
+        "d-1700000000000": 1700000000000,
+        "s-1600000000000": 1600000000000,
+    }
+    assert store.oldest_key_created_time == 1600000000000
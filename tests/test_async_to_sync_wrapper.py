@@ -0,0 +1,85 @@
+# Copyright (c) 2025, VRAI Labs and/or its affiliates. All rights reserved.
+#
+# This software is licensed under the Apache License, Version 2.0 (the
+# "License") as published by the Apache Software Foundation.
+#
+# You may not use this file except in compliance with the License. You may
+# obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+import asyncio
+import contextvars
+import threading
+from typing import List
+
+from flask import Flask, request
+from pytest import MonkeyPatch, fixture, raises
+from supertokens_python.async_to_sync_wrapper import get_background_event_loop, sync
+
+request_id: contextvars.ContextVar[str] = contextvars.ContextVar("request_id")
+
+
+@fixture
+def background_event_loop(monkeypatch: MonkeyPatch):
+    monkeypatch.setenv("SUPERTOKENS_BACKGROUND_EVENT_LOOP", "1")
+    yield
+    get_background_event_loop().stop()
+
+
+def test_sync_callers_share_one_background_loop(background_event_loop: None):
+    loops: List[asyncio.AbstractEventLoop] = []
+
+    async def get_loop():
+        return asyncio.get_running_loop()
+
+    def call():
+        loops.append(sync(get_loop()))
+
+    threads = [threading.Thread(target=call) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    loops.append(sync(get_loop()))
+
+    assert len(loops) == 5
+    assert all(loop is loops[0] for loop in loops)
+    assert loops[0].is_running()
+
+
+def test_caller_context_and_exceptions_are_carried_over(
+    background_event_loop: None,
+):
+    async def get_request_id():
+        return request_id.get()
+
+    async def fail():
+        raise ValueError("failed")
+
+    request_id.set("abc")
+    assert sync(get_request_id()) == "abc"
+    with raises(ValueError, match="failed"):
+        sync(fail())
+
+    app = Flask(__name__)
+
+    async def get_path():
+        return request.path
+
+    with app.test_request_context("/auth/session"):
+        assert sync(get_path()) == "/auth/session"
+
+
+def test_sync_from_the_background_loop_is_rejected(background_event_loop: None):
+    async def nothing():
+        pass
+
+    async def nested():
+        sync(nothing())
+
+    with raises(Exception, match="background event loop"):
+        sync(nested())
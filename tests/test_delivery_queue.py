@@ -0,0 +1,172 @@
+# Copyright (c) 2025, VRAI Labs and/or its affiliates. All rights reserved.
+#
+# This software is licensed under the Apache License, Version 2.0 (the
+# "License") as published by the Apache Software Foundation.
+#
+# You may not use this file except in compliance with the License. You may
+# obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+import asyncio
+import threading
+import time
+from typing import Any, Dict, List
+
+from pytest import mark
+from supertokens_python.asyncio import flush_delivery_queues
+from supertokens_python.ingredients.delivery_queue import (
+    DeliveryQueue,
+    DeliveryQueueConfig,
+    RateLimiter,
+)
+from supertokens_python.ingredients.emaildelivery.services.in_memory import (
+    InMemoryEmailDeliveryService,
+)
+from supertokens_python.ingredients.emaildelivery.services.queued import (
+    QueuedEmailDeliveryService,
+)
+from supertokens_python.ingredients.emaildelivery.types import EmailDeliveryInterface
+from supertokens_python.ingredients.smsdelivery.services.in_memory import (
+    InMemorySMSDeliveryService,
+)
+from supertokens_python.ingredients.smsdelivery.services.queued import (
+    QueuedSMSDeliveryService,
+)
+
+pytestmark = mark.asyncio
+
+
+def fast_retry_queue(**kwargs: Any) -> DeliveryQueue:
+    return DeliveryQueue(
+        DeliveryQueueConfig(initial_backoff_sec=0.01, max_backoff_sec=0.02, **kwargs)
+    )
+
+
+class BlockingEmailService(EmailDeliveryInterface[str]):
+    def __init__(self):
+        self.release = threading.Event()
+        self.sent: List[str] = []
+
+    async def send_email(self, template_vars: str, user_context: Dict[str, Any]):
+        while template_vars != "inline" and not self.release.is_set():
+            await asyncio.sleep(0.005)
+        self.sent.append(template_vars)
+
+
+async def test_send_returns_before_delivery():
+    service = BlockingEmailService()
+    queued = QueuedEmailDeliveryService(service, fast_retry_queue())
+
+    await queued.send_email("email", {})
+    assert service.sent == []
+
+    service.release.set()
+    assert await flush_delivery_queues(5)
+    assert service.sent == ["email"]
+
+
+async def test_failed_sends_are_retried():
+    email_service = InMemoryEmailDeliveryService[str](fail_times=2)
+    sms_service = InMemorySMSDeliveryService[str](fail_times=1)
+    queue = fast_retry_queue()
+    await QueuedEmailDeliveryService(email_service, queue).send_email("email", {})
+    await QueuedSMSDeliveryService(sms_service, queue).send_sms("sms", {})
+
+    assert await queue.flush(5)
+    assert email_service.calls == 3
+    assert email_service.sent == ["email"]
+    assert sms_service.calls == 2
+    assert sms_service.sent == ["sms"]
+    assert len(queue) == 0
+
+
+async def test_gives_up_after_max_attempts():
+    service = InMemoryEmailDeliveryService[str](fail_times=10)
+    queue = fast_retry_queue(max_attempts=3)
+    await QueuedEmailDeliveryService(service, queue).send_email("email", {})
+
+    assert await queue.flush(5)
+    assert service.calls == 3
+    assert service.sent == []
+
+
+async def test_sends_inline_when_queue_is_full():
+    service = BlockingEmailService()
+    queued = QueuedEmailDeliveryService(service, fast_retry_queue(max_size=1))
+
+    await queued.send_email("queued", {})
+    # The queue is still busy with the first email, so this one is sent before
+    # send_email returns
+    await queued.send_email("inline", {})
+    assert service.sent == ["inline"]
+
+    service.release.set()
+    assert await queued.queue.flush(5)
+    assert sorted(service.sent) == ["inline", "queued"]
+
+
+async def test_rate_limiter_spaces_out_sends():
+    service = InMemoryEmailDeliveryService[str]()
+    queued = QueuedEmailDeliveryService(
+        service, fast_retry_queue(), RateLimiter(rate_per_sec=50, burst=1)
+    )
+
+    start = time.monotonic()
+    for i in range(5):
+        await queued.send_email(str(i), {})
+    assert await queued.queue.flush(5)
+
+    assert len(service.sent) == 5
+    # The first send uses the initial token, the other 4 wait 20ms each
+    assert time.monotonic() - start >= 0.07
+
+
+class UserContextRecordingEmailService(EmailDeliveryInterface[str]):
+    def __init__(self):
+        self.user_contexts: List[Dict[str, Any]] = []
+
+    async def send_email(self, template_vars: str, user_context: Dict[str, Any]):
+        self.user_contexts.append(user_context)
+
+
+async def test_queued_send_does_not_share_request_state():
+    service = UserContextRecordingEmailService()
+    queued = QueuedEmailDeliveryService(service, fast_retry_queue())
+    core_call_cache: Dict[str, Any] = {}
+    user_context: Dict[str, Any] = {
+        "tenant": "t1",
+        "_default": {
+            "request": object(),
+            "core_call_cache": core_call_cache,
+            "user_cache": object(),
+            "keep_cache_alive": True,
+        },
+    }
+
+    await queued.send_email("email", user_context)
+    assert await queued.queue.flush(5)
+
+    assert service.user_contexts == [
+        {"tenant": "t1", "_default": {"keep_cache_alive": True}}
+    ]
+    assert "request" in user_context["_default"]
+
+
+async def test_flush_timeout_bounds_all_queues():
+    services = [BlockingEmailService() for _ in range(3)]
+    for service in services:
+        await QueuedEmailDeliveryService(service, fast_retry_queue()).send_email(
+            "email", {}
+        )
+
+    start = time.monotonic()
+    assert not await flush_delivery_queues(0.1)
+    assert time.monotonic() - start < 0.25
+
+    for service in services:
+        service.release.set()
+    assert await flush_delivery_queues(5)
@@ -0,0 +1,64 @@
+# Copyright (c) 2025, VRAI Labs and/or its affiliates. All rights reserved.
+#
+# This software is licensed under the Apache License, Version 2.0 (the
+# "License") as published by the Apache Software Foundation.
+#
+# You may not use this file except in compliance with the License. You may
+# obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+import json
+import subprocess
+import sys
+from typing import List
+
+from benchmarks.import_time import SCENARIOS
+from pytest import mark
+
+# Dependencies that are only needed once a request is handled (or an email or
+# SMS is sent), so they must not be imported on startup
+LAZY_DEPENDENCIES = [
+    "aiosmtplib",
+    "asgiref",
+    "httpx",
+    "jwt",
+    "orjson",
+    "phonenumbers",
+    "tldextract",
+    "twilio",
+    "ujson",
+]
+
+
+def get_imported_modules(code: str) -> List[str]:
+    process = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            code + "\nimport json, sys\nprint(json.dumps(list(sys.modules)))",
+        ],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return json.loads(process.stdout.splitlines()[-1])
+
+
+@mark.parametrize("scenario", ["import", "init"])
+def test_heavy_dependencies_are_not_imported_on_startup(scenario: str):
+    modules = get_imported_modules(SCENARIOS[scenario])
+
+    imported = [
+        dependency
+        for dependency in LAZY_DEPENDENCIES
+        if any(m == dependency or m.startswith(dependency + ".") for m in modules)
+    ]
+    assert imported == []
+
+    # Email templates and provider classes are loaded on first use
+    assert not any(m.endswith("_email") for m in modules)
+    assert "supertokens_python.recipe.thirdparty.providers.google" not in modules
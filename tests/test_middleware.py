@@ -12,16 +12,18 @@
 # License for the specific language governing permissions and limitations
 # under the License.
 
+import asyncio
 import json
+from unittest.mock import patch
 
 from fastapi import FastAPI
 from pytest import fixture, mark
-from supertokens_python import InputAppInfo, SupertokensConfig, init
+from supertokens_python import InputAppInfo, Supertokens, SupertokensConfig, init
 from supertokens_python.framework.fastapi import get_middleware
 from supertokens_python.recipe import emailpassword, passwordless, session
 
 from tests.testclient import TestClientWithNoCookieJar as TestClient
-from tests.utils import get_new_core_app_url, sign_up_request
+from tests.utils import get_new_core_app_url, get_st_init_args, sign_up_request
 
 
 @fixture(scope="function")
@@ -261,3 +263,112 @@ async def test_wrong_rid_returns_404_if_recipe_missing(
     )
 
     assert response_2.status_code == 404
+
+
+def get_pass_through_test_init_args():
+    return get_st_init_args(
+        url="http://localhost:6789",
+        recipe_list=[session.init(), emailpassword.init()],
+    )
+
+
+@mark.asyncio
+async def test_fastapi_middleware_skips_requests_outside_api_base_path():
+    init(**get_pass_through_test_init_args())
+
+    app = FastAPI()
+    app.add_middleware(get_middleware())
+
+    @app.get("/hello")
+    def hello():  # type: ignore
+        return {"hello": "world"}
+
+    client = TestClient(app)
+    with patch.object(
+        Supertokens, "middleware", autospec=True, return_value=None
+    ) as st_middleware:
+        response = client.get("/hello")
+        assert response.json() == {"hello": "world"}
+        assert st_middleware.call_count == 0
+
+        response = client.get("/auth/unknown")
+        assert response.status_code == 404
+        assert st_middleware.call_count == 1
+
+
+def test_flask_middleware_skips_requests_outside_api_base_path():
+    from flask import Flask
+    from supertokens_python.framework.flask import Middleware
+
+    args = get_pass_through_test_init_args()
+    args["framework"] = "flask"
+    args["mode"] = "wsgi"
+    init(**args)
+
+    app = Flask(__name__)
+    Middleware(app)
+
+    @app.route("/hello")
+    def hello():  # type: ignore
+        return {"hello": "world"}
+
+    client = app.test_client()
+    with patch.object(
+        Supertokens, "middleware", autospec=True, return_value=None
+    ) as st_middleware:
+        response = client.get("/hello")
+        assert response.json == {"hello": "world"}
+        assert st_middleware.call_count == 0
+
+        response = client.get("/auth/unknown")
+        assert response.status_code == 404
+        assert st_middleware.call_count == 1
+
+
+@mark.asyncio
+async def test_django_middleware_skips_requests_outside_api_base_path():
+    from django.http import HttpRequest, HttpResponse
+    from django.test import RequestFactory
+    from supertokens_python.framework.django import middleware
+
+    args = get_pass_through_test_init_args()
+    args["framework"] = "django"
+    init(**args)
+
+    def view(_: HttpRequest):
+        return HttpResponse("hello")
+
+    async def async_view(_: HttpRequest):
+        return HttpResponse("hello")
+
+    with patch.object(
+        Supertokens, "middleware", autospec=True, return_value=None
+    ) as st_middleware:
+        response = await middleware(async_view)(RequestFactory().get("/hello"))
+        assert response.content == b"hello"
+        assert st_middleware.call_count == 0
+
+        await middleware(async_view)(RequestFactory().get("/auth/unknown"))
+        assert st_middleware.call_count == 1
+
+        st_middleware.reset_mock()
+        sync_middleware = middleware(view)
+
+        def call_sync():
+            return sync_middleware(RequestFactory().get("/hello"))
+
+        response = await asyncio.get_running_loop().run_in_executor(None, call_sync)
+        assert response.content == b"hello"
+        assert st_middleware.call_count == 0
+
+
+def test_can_skip_middleware():
+    init(**get_pass_through_test_init_args())
+    st = Supertokens.get_instance()
+
+    assert st.can_skip_middleware("/hello")
+    assert st.can_skip_middleware("/")
+    assert not st.can_skip_middleware("/auth")
+    assert not st.can_skip_middleware("/auth/signin")
+    assert not st.can_skip_middleware("//auth/signin")
+    assert not st.can_skip_middleware("auth/signin")
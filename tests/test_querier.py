@@ -12,12 +12,39 @@
 # License for the specific language governing permissions and limitations
 # under the License.
 import asyncio
-from typing import Any, Dict, Optional
+import time
+from typing import Any, Dict, List, Optional
 
 import httpx
 import respx
-from pytest import mark
-from supertokens_python import InputAppInfo, SupertokensConfig, init
+from pytest import mark, raises
+from supertokens_python import (
+    InputAppInfo,
+    SupertokensConfig,
+    get_core_concurrency_limiter_stats,
+    get_core_host_stats,
+    init,
+)
+from supertokens_python.asyncio import (
+    close_connection_pools,
+    list_users_by_account_info,
+)
+from supertokens_python.core_call_cache import (
+    CoreCallCachePolicy,
+    LocalInvalidationChannel,
+    SharedCoreCallCache,
+    SharedCoreCallCacheConfig,
+)
+from supertokens_python.core_concurrency_limiter import (
+    CoreConcurrencyLimiter,
+    CoreConcurrencyLimiterConfig,
+    CoreOverloadedError,
+)
+from supertokens_python.core_host_health import (
+    CoreHostHealth,
+    CoreHostSelectionConfig,
+)
+from supertokens_python.http_client import HttpClientConfig, PooledAsyncClient
 from supertokens_python.querier import NormalisedURLPath, Querier
 from supertokens_python.recipe import (
     dashboard,
@@ -26,7 +53,9 @@ from supertokens_python.recipe import (
     session,
     thirdparty,
 )
+from supertokens_python.recipe.accountlinking.asyncio import unlink_account
 from supertokens_python.recipe.emailpassword.asyncio import get_user, sign_up
+from supertokens_python.types import AccountInfo, RecipeUserId
 
 from tests.utils import get_new_core_app_url, get_st_init_args
 
@@ -657,3 +686,651 @@ async def test_caching_gets_clear_with_non_get_if_keep_alive_is_not_set():
 
     assert user is None
     assert called_core
+
+
+async def test_core_calls_reuse_pooled_client():
+    args = get_st_init_args(url="http://localhost:6789", recipe_list=[session.init()])
+    init(**args)
+
+    Querier.api_version = "3.0"
+    q = Querier.get_instance()
+
+    with respx_mock() as mocker:
+        api = mocker.get("http://localhost:6789/api").mock(
+            httpx.Response(200, json={"status": "OK"})
+        )
+        await q.send_get_request(NormalisedURLPath("/api"), None, None)
+        await q.send_get_request(NormalisedURLPath("/api"), None, None)
+        assert api.call_count == 2
+
+        await close_connection_pools()
+
+        # A new pool is created transparently after closing
+        await q.send_get_request(NormalisedURLPath("/api"), None, None)
+        assert api.call_count == 3
+
+
+async def test_pooled_client_is_bound_to_event_loop():
+    pool = PooledAsyncClient(HttpClientConfig(timeout=5.0, max_connections=10))
+
+    client = pool.get_client()
+    assert pool.get_client() is client
+    assert client.timeout.read == 5.0
+
+    def get_client_in_new_loop():
+        async def inner():
+            other = pool.get_client()
+            await pool.aclose()
+            return other
+
+        return asyncio.run(inner())
+
+    other_client = await asyncio.get_running_loop().run_in_executor(
+        None, get_client_in_new_loop
+    )
+    assert other_client is not client
+    assert other_client.is_closed
+
+    await pool.aclose()
+    assert client.is_closed
+    assert pool.get_client() is not client
+    await pool.aclose()
+
+
+async def test_shared_cache_is_used_across_requests():
+    args = get_st_init_args(url="http://localhost:6789", recipe_list=[session.init()])
+    args["supertokens_config"].shared_core_call_cache = SharedCoreCallCacheConfig()
+    init(**args)
+
+    Querier.api_version = "3.0"
+    q = Querier.get_instance()
+    metadata_path = NormalisedURLPath("/recipe/user/metadata")
+
+    with respx_mock() as mocker:
+        get_metadata = mocker.get("http://localhost:6789/recipe/user/metadata").mock(
+            httpx.Response(200, json={"status": "OK", "metadata": {}})
+        )
+        mocker.put("http://localhost:6789/recipe/user/metadata").mock(
+            httpx.Response(200, json={"status": "OK", "metadata": {}})
+        )
+        uncached = mocker.get("http://localhost:6789/recipe/user").mock(
+            httpx.Response(200, json={"status": "OK"})
+        )
+
+        # Different user contexts, so the per request cache does not apply
+        await q.send_get_request(metadata_path, {"userId": "u1"}, {})
+        await q.send_get_request(metadata_path, {"userId": "u1"}, {})
+        await q.send_get_request(metadata_path, {"userId": "u2"}, {})
+        assert get_metadata.call_count == 2
+
+        # Paths without a policy are not cached
+        await q.send_get_request(NormalisedURLPath("/recipe/user"), None, {})
+        await q.send_get_request(NormalisedURLPath("/recipe/user"), None, {})
+        assert uncached.call_count == 2
+
+        # Only the metadata of the updated user is dropped
+        await q.send_put_request(
+            metadata_path, {"userId": "u1", "metadataUpdate": {}}, None, {}
+        )
+        await q.send_get_request(metadata_path, {"userId": "u2"}, {})
+        assert get_metadata.call_count == 2
+        await q.send_get_request(metadata_path, {"userId": "u1"}, {})
+        assert get_metadata.call_count == 3
+
+
+async def test_shared_cache_is_not_used_with_a_network_interceptor():
+    def interceptor(
+        url: str,
+        method: str,
+        headers: Dict[str, Any],
+        params: Optional[Dict[str, Any]],
+        body: Optional[Dict[str, Any]],
+        user_context: Optional[Dict[str, Any]],
+    ):
+        if user_context is not None and "tenant" in user_context:
+            headers = {**headers, "x-tenant": user_context["tenant"]}
+        return url, method, headers, params, body
+
+    args = get_st_init_args(url="http://localhost:6789", recipe_list=[session.init()])
+    args["supertokens_config"].shared_core_call_cache = SharedCoreCallCacheConfig()
+    args["supertokens_config"].network_interceptor = interceptor
+    init(**args)
+
+    Querier.api_version = "3.0"
+    q = Querier.get_instance()
+    path = NormalisedURLPath("/recipe/user/metadata")
+
+    with respx_mock() as mocker:
+        get_metadata = mocker.get("http://localhost:6789/recipe/user/metadata").mock(
+            httpx.Response(200, json={"status": "OK", "metadata": {}})
+        )
+
+        await q.send_get_request(path, {"userId": "u1"}, {"tenant": "t1"})
+        await q.send_get_request(path, {"userId": "u1"}, {"tenant": "t2"})
+        assert get_metadata.call_count == 2
+        assert get_metadata.calls[1].request.headers["x-tenant"] == "t2"
+
+
+async def test_shared_cache_ignores_tenant_id_when_invalidating():
+    args = get_st_init_args(url="http://localhost:6789", recipe_list=[session.init()])
+    args["supertokens_config"].shared_core_call_cache = SharedCoreCallCacheConfig(
+        policies=[
+            CoreCallCachePolicy(
+                "/recipe/multitenancy/tenant",
+                ttl_sec=60,
+                invalidated_by=["/recipe/multitenancy"],
+            )
+        ]
+    )
+    init(**args)
+
+    Querier.api_version = "3.0"
+    q = Querier.get_instance()
+    tenant_path = NormalisedURLPath("/tenant1/recipe/multitenancy/tenant/v2")
+
+    with respx_mock() as mocker:
+        get_tenant = mocker.get(
+            "http://localhost:6789/tenant1/recipe/multitenancy/tenant/v2"
+        ).mock(httpx.Response(200, json={"status": "OK"}))
+        mocker.put(
+            "http://localhost:6789/tenant1/recipe/multitenancy/config/thirdparty"
+        ).mock(httpx.Response(200, json={"status": "OK"}))
+
+        await q.send_get_request(tenant_path, None, {})
+        await q.send_get_request(tenant_path, None, {})
+        assert get_tenant.call_count == 1
+
+        await q.send_put_request(
+            NormalisedURLPath("/tenant1/recipe/multitenancy/config/thirdparty"),
+            {"config": {}},
+            None,
+            {},
+        )
+        await q.send_get_request(tenant_path, None, {})
+        assert get_tenant.call_count == 2
+
+
+async def test_shared_cache_limits_and_invalidation_channel():
+    channel = LocalInvalidationChannel()
+    policy = CoreCallCachePolicy(
+        "/recipe/role/permissions",
+        ttl_sec=60,
+        invalidated_by=["/recipe/role"],
+        key_param="role",
+    )
+    cache = SharedCoreCallCache(
+        SharedCoreCallCacheConfig(
+            policies=[policy], max_entries=2, invalidation_channel=channel
+        )
+    )
+    other_process_cache = SharedCoreCallCache(
+        SharedCoreCallCacheConfig(policies=[policy], invalidation_channel=channel)
+    )
+    published: List[Any] = []
+    channel.subscribe(lambda path, key_params: published.append((path, key_params)))
+    response = httpx.Response(200, json={"status": "OK"})
+
+    for c in [cache, other_process_cache]:
+        c.set(
+            "admin",
+            "/recipe/role/permissions",
+            {"role": "admin"},
+            response,
+            c.get_generation(),
+        )
+        c.set(
+            "user",
+            "/recipe/role/permissions",
+            {"role": "user"},
+            response,
+            c.get_generation(),
+        )
+    cache.set("unknown", "/recipe/unknown", {}, response, cache.get_generation())
+    assert len(cache) == 2
+
+    cache.set(
+        "guest",
+        "/recipe/role/permissions",
+        {"role": "guest"},
+        response,
+        cache.get_generation(),
+    )
+    assert len(cache) == 2
+    assert cache.get("admin") is None
+
+    # A write in this process drops the matching entry in both caches, and the
+    # request body is not published on the channel
+    cache.on_write("/recipe/role", {"role": "user", "permissions": ["write"]})
+    assert cache.get("user") is None
+    assert other_process_cache.get("user") is None
+    assert other_process_cache.get("admin") is not None
+    assert cache.get("guest") is not None
+    assert published == [("/recipe/role", {"role": "user"})]
+
+    expiring_cache = SharedCoreCallCache(
+        SharedCoreCallCacheConfig(
+            policies=[CoreCallCachePolicy("/recipe/roles", 0.1, ["/recipe/role"])]
+        )
+    )
+    expiring_cache.set(
+        "roles", "/recipe/roles", {}, response, expiring_cache.get_generation()
+    )
+    assert expiring_cache.get("roles") is not None
+    await asyncio.sleep(0.2)
+    assert expiring_cache.get("roles") is None
+
+
+async def test_shared_cache_does_not_store_responses_older_than_a_write():
+    args = get_st_init_args(url="http://localhost:6789", recipe_list=[session.init()])
+    args["supertokens_config"].shared_core_call_cache = SharedCoreCallCacheConfig()
+    init(**args)
+
+    Querier.api_version = "3.0"
+    q = Querier.get_instance()
+    path = NormalisedURLPath("/recipe/user/metadata")
+    release = asyncio.Event()
+    metadata = {"version": 1}
+
+    async def slow_response(_: httpx.Request):
+        # The core reads the metadata before the write, but replies after it
+        stale = dict(metadata)
+        await release.wait()
+        return httpx.Response(200, json={"status": "OK", "metadata": stale})
+
+    async def update_metadata(_: httpx.Request):
+        metadata["version"] = 2
+        return httpx.Response(200, json={"status": "OK", "metadata": metadata})
+
+    with respx_mock() as mocker:
+        get_metadata = mocker.get("http://localhost:6789/recipe/user/metadata").mock(
+            side_effect=slow_response
+        )
+        mocker.put("http://localhost:6789/recipe/user/metadata").mock(
+            side_effect=update_metadata
+        )
+        mocker.post("http://localhost:6789/user/remove").mock(
+            httpx.Response(200, json={"status": "OK"})
+        )
+
+        before_write = asyncio.ensure_future(
+            q.send_get_request(path, {"userId": "u1"}, {})
+        )
+        await asyncio.sleep(0.01)
+        await q.send_put_request(path, {"userId": "u1", "metadataUpdate": {}}, None, {})
+        release.set()
+        assert (await before_write)["metadata"] == {"version": 1}
+
+        # The stale response was not cached
+        res = await q.send_get_request(path, {"userId": "u1"}, {})
+        assert res["metadata"] == {"version": 2}
+        assert get_metadata.call_count == 2
+        await q.send_get_request(path, {"userId": "u1"}, {})
+        assert get_metadata.call_count == 2
+
+        # Deleting the user drops their metadata
+        await q.send_post_request(
+            NormalisedURLPath("/user/remove"), {"userId": "u1"}, {}
+        )
+        await q.send_get_request(path, {"userId": "u1"}, {})
+        assert get_metadata.call_count == 3
+
+
+async def test_host_with_open_circuit_is_skipped():
+    args = get_st_init_args(
+        url="http://localhost:6789;http://localhost:6790", recipe_list=[session.init()]
+    )
+    args["supertokens_config"].core_host_selection = CoreHostSelectionConfig(
+        failure_threshold=2, open_duration_sec=0.2
+    )
+    init(**args)
+
+    Querier.api_version = "3.0"
+    q = Querier.get_instance()
+    path = NormalisedURLPath("/recipe/user")
+
+    with respx_mock() as mocker:
+        down = mocker.get("http://localhost:6789/recipe/user").mock(
+            side_effect=httpx.ConnectError("Connection refused")
+        )
+        up = mocker.get("http://localhost:6790/recipe/user").mock(
+            httpx.Response(200, json={"status": "OK"})
+        )
+
+        for _ in range(6):
+            assert (await q.send_get_request(path, None, None))["status"] == "OK"
+        assert up.call_count == 6
+        # Each request tries the failing host until its circuit opens
+        assert down.call_count == 2
+
+        stats = {s.host: s for s in get_core_host_stats()}
+        assert stats["http://localhost:6789"].state == "open"
+        assert stats["http://localhost:6789"].consecutive_failures == 2
+        assert stats["http://localhost:6790"].state == "closed"
+        assert stats["http://localhost:6790"].request_count == 6
+
+        # Once the circuit is half open, a single request probes the host
+        await asyncio.sleep(0.2)
+        down.mock(side_effect=None, return_value=httpx.Response(200, json={}))
+        await q.send_get_request(path, None, None)
+        await q.send_get_request(path, None, None)
+        assert down.call_count == 3
+        stats = {s.host: s for s in get_core_host_stats()}
+        assert stats["http://localhost:6789"].state == "closed"
+
+
+async def test_failed_probe_opens_circuit_again():
+    health = CoreHostHealth(
+        ["http://a", "http://b"],
+        CoreHostSelectionConfig(failure_threshold=1, open_duration_sec=0.1),
+    )
+    health.record_failure("http://a/recipe/user", 5)
+    assert health.select_host() == "http://b"
+    assert health.select_host() == "http://b"
+
+    await asyncio.sleep(0.1)
+    assert health.select_host() == "http://a"
+    # Only one probe is let through at a time
+    assert health.select_host() == "http://b"
+    health.record_failure("http://a/recipe/user", 5)
+    assert health.get_stats()[0].state == "open"
+    assert health.select_host() == "http://b"
+
+    # With every host failing, the one that failed first is still tried
+    health.record_failure("http://b/recipe/user", 5)
+    assert health.select_host() == "http://a"
+    assert health.select_host(["http://a"]) == "http://b"
+
+
+@mark.parametrize("strategy", ["least_latency", "power_of_two_choices"])
+async def test_faster_host_is_preferred(strategy: Any):
+    health = CoreHostHealth(
+        ["http://a", "http://b/core"], CoreHostSelectionConfig(strategy=strategy)
+    )
+    health.record_success("http://a/recipe/user", 100)
+    health.record_success("http://b/core/recipe/user", 10)
+
+    assert all(health.select_host() == "http://b/core" for _ in range(10))
+    assert health.select_host(["http://b/core"]) == "http://a"
+
+    stats = health.get_stats()
+    assert [s.latency_ewma_ms for s in stats] == [100, 10]
+    assert [s.request_count for s in stats] == [1, 1]
+
+
+async def test_concurrent_identical_gets_share_one_core_call():
+    init(**get_st_init_args(url="http://localhost:6789", recipe_list=[session.init()]))
+
+    Querier.api_version = "3.0"
+    q = Querier.get_instance()
+    path = NormalisedURLPath("/recipe/user/metadata")
+    release = asyncio.Event()
+
+    async def slow_response(_: httpx.Request):
+        await release.wait()
+        return httpx.Response(200, json={"status": "OK", "metadata": {}})
+
+    with respx_mock() as mocker:
+        get_metadata = mocker.get("http://localhost:6789/recipe/user/metadata").mock(
+            side_effect=slow_response
+        )
+        mocker.put("http://localhost:6789/recipe/user/metadata").mock(
+            httpx.Response(200, json={"status": "OK", "metadata": {}})
+        )
+
+        requests = [
+            asyncio.ensure_future(q.send_get_request(path, {"userId": "u1"}, {}))
+            for _ in range(10)
+        ]
+        other_user = asyncio.ensure_future(
+            q.send_get_request(path, {"userId": "u2"}, {})
+        )
+        await asyncio.sleep(0.01)
+        # A cancelled caller does not cancel the request the others wait on
+        requests.pop().cancel()
+        release.set()
+
+        results = await asyncio.gather(*requests, other_user)
+        assert all(r["status"] == "OK" for r in results)
+        # Each caller gets its own copy of the response
+        assert len({id(r) for r in results}) == len(results)
+        assert get_metadata.call_count == 2
+
+        # A GET sent after a write does not share the response of one sent
+        # before it
+        release.clear()
+        before_write = asyncio.ensure_future(
+            q.send_get_request(path, {"userId": "u1"}, {})
+        )
+        await asyncio.sleep(0.01)
+        await q.send_put_request(path, {"userId": "u1", "metadataUpdate": {}}, None, {})
+        after_write = asyncio.ensure_future(
+            q.send_get_request(path, {"userId": "u1"}, {})
+        )
+        await asyncio.sleep(0.01)
+        release.set()
+        await asyncio.gather(before_write, after_write)
+        assert get_metadata.call_count == 4
+
+
+async def test_rate_limited_request_honours_retry_after():
+    init(**get_st_init_args(url="http://localhost:6789", recipe_list=[session.init()]))
+
+    Querier.api_version = "3.0"
+    q = Querier.get_instance()
+
+    with respx_mock() as mocker:
+        api = mocker.get("http://localhost:6789/api").mock(
+            side_effect=[
+                httpx.Response(429, headers={"Retry-After": "0.2"}),
+                httpx.Response(200, json={"status": "OK"}),
+            ]
+        )
+        start = time.monotonic()
+        assert (await q.send_get_request(NormalisedURLPath("/api"), None, None))[
+            "status"
+        ] == "OK"
+        assert time.monotonic() - start >= 0.2
+        assert api.call_count == 2
+
+        # A request is not held up for longer than MAX_RETRY_AFTER_SEC
+        too_long = mocker.get("http://localhost:6789/too-long").mock(
+            httpx.Response(429, headers={"Retry-After": "60"})
+        )
+        with raises(Exception, match="with status code: 429"):
+            await q.send_get_request(NormalisedURLPath("/too-long"), None, None)
+        assert too_long.call_count == 1
+
+
+async def test_concurrency_limiter_queues_and_rejects_requests():
+    args = get_st_init_args(url="http://localhost:6789", recipe_list=[session.init()])
+    args["supertokens_config"].core_concurrency_limiter = CoreConcurrencyLimiterConfig(
+        initial_limit=2, max_limit=2, max_queue_size=1, max_queue_wait_sec=0.2
+    )
+    init(**args)
+
+    Querier.api_version = "3.0"
+    q = Querier.get_instance()
+    path = NormalisedURLPath("/recipe/user/metadata")
+    release = asyncio.Event()
+
+    async def slow_response(_: httpx.Request):
+        await release.wait()
+        return httpx.Response(200, json={"status": "OK"})
+
+    with respx_mock() as mocker:
+        mocker.get("http://localhost:6789/recipe/user/metadata").mock(
+            side_effect=slow_response
+        )
+
+        requests = [
+            asyncio.ensure_future(q.send_get_request(path, {"userId": f"u{i}"}, {}))
+            for i in range(3)
+        ]
+        await asyncio.sleep(0.01)
+        stats = get_core_concurrency_limiter_stats()
+        assert stats is not None
+        assert stats.in_flight == 2
+        assert stats.queue_depth == 1
+
+        # The queue is full, so this fails without waiting
+        with raises(CoreOverloadedError):
+            await q.send_get_request(path, {"userId": "u3"}, {})
+
+        release.set()
+        results = await asyncio.gather(*requests)
+        assert all(r["status"] == "OK" for r in results)
+
+        # A request that waits for too long fails
+        release.clear()
+        requests = [
+            asyncio.ensure_future(q.send_get_request(path, {"userId": f"u{i}"}, {}))
+            for i in range(2)
+        ]
+        await asyncio.sleep(0.01)
+        with raises(CoreOverloadedError):
+            await q.send_get_request(path, {"userId": "u2"}, {})
+        release.set()
+        await asyncio.gather(*requests)
+
+        stats = get_core_concurrency_limiter_stats()
+        assert stats is not None
+        assert stats.in_flight == 0
+        assert stats.queue_depth == 0
+        assert stats.waited_count == 1
+        assert stats.rejected_count == 2
+        assert stats.max_wait_ms > 0
+
+
+async def test_concurrency_limit_adapts_to_rate_limiting():
+    limiter = CoreConcurrencyLimiter(
+        CoreConcurrencyLimiterConfig(initial_limit=8, min_limit=2, max_limit=10)
+    )
+
+    # A burst of rate limited requests only decreases the limit once
+    epochs = [await limiter.acquire() for _ in range(8)]
+    for epoch in epochs:
+        limiter.release(epoch, rate_limited=True)
+    assert limiter.get_stats().limit == 4
+
+    limiter.release(await limiter.acquire(), rate_limited=True)
+    limiter.release(await limiter.acquire(), rate_limited=True)
+    assert limiter.get_stats().limit == 2
+
+    # Requests that fail without a response do not change the limit
+    limiter.release(await limiter.acquire(), rate_limited=None)
+    assert limiter.get_stats().limit == 2
+
+    # The limit grows by about one for every `limit` successful requests
+    for _ in range(3):
+        limiter.release(await limiter.acquire(), rate_limited=False)
+    assert limiter.get_stats().limit == 3
+    for _ in range(100):
+        limiter.release(await limiter.acquire(), rate_limited=False)
+    assert limiter.get_stats().limit == 10
+
+
+def get_user_json(user_id: str, recipe_user_ids: List[str]) -> Dict[str, Any]:
+    return {
+        "id": user_id,
+        "isPrimaryUser": len(recipe_user_ids) > 1,
+        "tenantIds": ["public"],
+        "emails": [f"{user_id}@example.com"],
+        "phoneNumbers": [],
+        "thirdParty": [],
+        "loginMethods": [
+            {
+                "recipeId": "emailpassword",
+                "recipeUserId": recipe_user_id,
+                "tenantIds": ["public"],
+                "email": f"{user_id}@example.com",
+                "timeJoined": 0,
+                "verified": True,
+            }
+            for recipe_user_id in recipe_user_ids
+        ],
+        "timeJoined": 0,
+    }
+
+
+async def test_users_are_cached_for_the_request():
+    init(**get_st_init_args(url="http://localhost:6789", recipe_list=[session.init()]))
+
+    Querier.api_version = "3.0"
+    q = Querier.get_instance()
+    # As set up for the user_context of a request
+    user_context: Dict[str, Any] = {"_default": {"keep_cache_alive": True}}
+    account_info = AccountInfo(email="u1@example.com")
+    users = {
+        "u1": get_user_json("u1", ["u1", "r2"]),
+        "u3": get_user_json("u3", ["u3"]),
+        # Once unlinked
+        "r2": get_user_json("r2", ["r2"]),
+    }
+
+    def get_user_response(request: httpx.Request):
+        return httpx.Response(
+            200, json={"status": "OK", "user": users[request.url.params["userId"]]}
+        )
+
+    with respx_mock() as mocker:
+        get_user_mock = mocker.get("http://localhost:6789/user/id").mock(
+            side_effect=get_user_response
+        )
+        list_users_mock = mocker.get(
+            "http://localhost:6789/public/users/by-accountinfo"
+        ).mock(httpx.Response(200, json={"status": "OK", "users": [users["u1"]]}))
+        mocker.post("http://localhost:6789/public/recipe/session").mock(
+            httpx.Response(200, json={"status": "OK"})
+        )
+        mocker.post("http://localhost:6789/recipe/accountlinking/user/unlink").mock(
+            httpx.Response(
+                200,
+                json={"status": "OK", "wasRecipeUserDeleted": False, "wasLinked": True},
+            )
+        )
+        mocker.post("http://localhost:6789/public/recipe/user/email/verify").mock(
+            httpx.Response(200, json={"status": "OK"})
+        )
+
+        user = await get_user("u1", user_context)
+        assert user is not None
+        # A user is also cached under the recipe user ids of its login methods
+        assert await get_user("u1", user_context) is user
+        assert await get_user("r2", user_context) is user
+        assert await get_user("u3", user_context) is not None
+        assert get_user_mock.call_count == 2
+
+        for _ in range(2):
+            assert await list_users_by_account_info(
+                "public", account_info, False, user_context
+            ) == [user]
+        assert list_users_mock.call_count == 1
+
+        # Writes that cannot change a user keep the users cached
+        await q.send_post_request(
+            NormalisedURLPath("/public/recipe/session"), {}, user_context
+        )
+        await get_user("u1", user_context)
+        await list_users_by_account_info("public", account_info, False, user_context)
+        assert get_user_mock.call_count == 2
+        assert list_users_mock.call_count == 1
+
+        # Unlinking only drops the user it changes
+        await unlink_account(RecipeUserId("r2"), user_context)
+        await get_user("u3", user_context)
+        assert get_user_mock.call_count == 2
+        await get_user("r2", user_context)
+        await list_users_by_account_info("public", account_info, False, user_context)
+        assert get_user_mock.call_count == 3
+        assert list_users_mock.call_count == 2
+
+        # Any other write drops all of them
+        await q.send_post_request(
+            NormalisedURLPath("/public/recipe/user/email/verify"), {}, user_context
+        )
+        await get_user("u3", user_context)
+        assert get_user_mock.call_count == 4
+
+        # Each request has its own cache
+        await get_user("u3", {"_default": {"keep_cache_alive": True}})
+        assert get_user_mock.call_count == 5
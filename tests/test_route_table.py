@@ -0,0 +1,128 @@
+# Copyright (c) 2025, VRAI Labs and/or its affiliates. All rights reserved.
+#
+# This software is licensed under the Apache License, Version 2.0 (the
+# "License") as published by the Apache Software Foundation.
+#
+# You may not use this file except in compliance with the License. You may
+# obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+from typing import Any, Dict, List, Optional, Tuple
+
+from pytest import mark
+from supertokens_python import Supertokens, init
+from supertokens_python.normalised_url_path import NormalisedURLPath
+from supertokens_python.recipe import (
+    dashboard,
+    emailpassword,
+    emailverification,
+    passwordless,
+    session,
+    thirdparty,
+    userroles,
+)
+from supertokens_python.recipe_module import RecipeModule
+
+from tests.utils import get_st_init_args
+
+pytestmark = mark.asyncio
+
+
+async def find_by_looping_over_recipes(
+    path: NormalisedURLPath, method: str, user_context: Dict[str, Any]
+) -> Optional[Tuple[str, str, str]]:
+    for recipe in Supertokens.get_instance().recipe_modules:
+        result = await recipe.return_api_id_if_can_handle_request(
+            path, method, user_context
+        )
+        if result is not None:
+            return recipe.get_recipe_id(), result.api_id, result.tenant_id
+    return None
+
+
+async def find_with_route_table(
+    path: NormalisedURLPath, method: str, user_context: Dict[str, Any]
+) -> Optional[Tuple[str, str, str]]:
+    st = Supertokens.get_instance()
+    matches = await st.find_apis_for_request(
+        path, method, st.recipe_modules, True, user_context
+    )
+    if len(matches) == 0:
+        return None
+    recipe, result = matches[0]
+    return recipe.get_recipe_id(), result.api_id, result.tenant_id
+
+
+async def test_route_table_matches_recipe_by_recipe_lookup():
+    init(
+        **get_st_init_args(
+            url="http://localhost:6789",
+            recipe_list=[
+                session.init(),
+                emailpassword.init(),
+                emailverification.init(mode="OPTIONAL"),
+                thirdparty.init(),
+                passwordless.init(
+                    flow_type="USER_INPUT_CODE",
+                    contact_config=passwordless.ContactEmailOnlyConfig(),
+                ),
+                dashboard.init(),
+                userroles.init(),
+            ],
+        )
+    )
+    st = Supertokens.get_instance()
+    assert st.route_table is not None
+
+    base_path = st.app_info.api_base_path.get_as_string_dangerous()
+    requests: List[Tuple[str, str]] = []
+    for recipe in st.recipe_modules:
+        for api in recipe.get_apis_handled():
+            api_path = api.path_without_api_base_path.get_as_string_dangerous()
+            for method in [api.method, "post", "get"]:
+                requests += [
+                    (base_path + api_path, method),
+                    (base_path + "/tenant-1" + api_path, method),
+                    (base_path + "/public" + api_path, method),
+                    (base_path + "/not_a_tenant" + api_path, method),
+                    (base_path + "/a/b" + api_path, method),
+                ]
+    requests += [
+        (base_path, "get"),
+        (base_path + "/unknown", "get"),
+        ("/other" + base_path + "/signin", "post"),
+    ]
+
+    for path, method in requests:
+        normalised_path = NormalisedURLPath(path)
+        assert await find_with_route_table(
+            normalised_path, method, {}
+        ) == await find_by_looping_over_recipes(normalised_path, method, {}), (
+            path,
+            method,
+        )
+
+
+async def test_route_table_is_not_used_with_custom_recipe_lookup():
+    class CustomSession(session.SessionRecipe):
+        async def return_api_id_if_can_handle_request(
+            self, path: NormalisedURLPath, method: str, user_context: Dict[str, Any]
+        ):
+            return await RecipeModule.return_api_id_if_can_handle_request(
+                self, path, method, user_context
+            )
+
+    init(**get_st_init_args(url="http://localhost:6789", recipe_list=[session.init()]))
+    st = Supertokens.get_instance()
+    assert st.route_table is not None
+
+    st.recipe_modules[0].__class__ = CustomSession
+    st.compile_route_table()
+    assert st.route_table is None
+    assert await find_with_route_table(
+        NormalisedURLPath("/auth/session/refresh"), "post", {}
+    ) == ("session", "/session/refresh", "public")
@@ -0,0 +1,192 @@
+# Copyright (c) 2025, VRAI Labs and/or its affiliates. All rights reserved.
+#
+# This software is licensed under the Apache License, Version 2.0 (the
+# "License") as published by the Apache Software Foundation.
+#
+# You may not use this file except in compliance with the License. You may
+# obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+import asyncio
+from email.mime.text import MIMEText
+from string import Template
+from typing import Any, List
+from unittest.mock import AsyncMock, MagicMock
+
+import aiosmtplib
+from pytest import mark, raises
+from supertokens_python.ingredients.emaildelivery.services.smtp import Transporter
+from supertokens_python.ingredients.emaildelivery.templates import (
+    CompiledTemplate,
+    compile_html_template,
+    minify_html,
+)
+from supertokens_python.ingredients.emaildelivery.types import (
+    EmailContent,
+    SMTPSettings,
+    SMTPSettingsFrom,
+)
+
+pytestmark = mark.asyncio
+
+
+def make_transporter(**kwargs: Any):
+    transporter = Transporter(
+        SMTPSettings(
+            host="localhost",
+            port=1025,
+            from_=SMTPSettingsFrom("ST", "st@example.com"),
+            **kwargs,
+        )
+    )
+    connections: List[MagicMock] = []
+
+    async def connect():
+        connection = MagicMock()
+        connection.is_connected = True
+        connection.sendmail = AsyncMock()
+        connection.quit = AsyncMock()
+        connections.append(connection)
+        return connection
+
+    transporter._connect = connect  # type: ignore
+    return transporter, connections
+
+
+def content(to_email: str = "user@example.com"):
+    return EmailContent("body", "subject", to_email, is_html=False)
+
+
+async def test_connection_is_reused_across_emails():
+    transporter, connections = make_transporter()
+
+    await transporter.send_email(content(), {})
+    await transporter.send_email(content(), {})
+
+    assert len(connections) == 1
+    assert connections[0].sendmail.await_count == 2
+    connections[0].quit.assert_not_awaited()
+
+    await transporter.close()
+    connections[0].quit.assert_awaited_once()
+
+
+async def test_connection_is_closed_after_each_email_without_idle_timeout():
+    transporter, connections = make_transporter(idle_timeout_sec=0)
+
+    await transporter.send_email(content(), {})
+    await transporter.send_email(content(), {})
+
+    assert len(connections) == 2
+    for connection in connections:
+        connection.quit.assert_awaited_once()
+
+
+async def test_idle_connections_are_closed_after_idle_timeout():
+    transporter, connections = make_transporter(idle_timeout_sec=0.05)
+
+    await transporter.send_email(content(), {})
+    pool = transporter._get_pool()  # type: ignore
+    await asyncio.sleep(0.2)
+
+    connections[0].quit.assert_awaited_once()
+    assert pool._idle == []  # type: ignore
+    assert pool._idle_check is None  # type: ignore
+    assert pool._idle_check_task is None  # type: ignore
+
+
+async def test_concurrent_emails_are_limited_by_max_connections():
+    transporter, connections = make_transporter(max_connections=2)
+    in_flight = 0
+    max_in_flight = 0
+
+    async def sendmail(*_: Any):
+        nonlocal in_flight, max_in_flight
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+
+    original_connect = transporter._connect  # type: ignore
+
+    async def connect():
+        connection = await original_connect()
+        connection.sendmail = AsyncMock(side_effect=sendmail)
+        return connection
+
+    transporter._connect = connect  # type: ignore
+
+    await asyncio.gather(*[transporter.send_email(content(), {}) for _ in range(10)])
+
+    assert max_in_flight == 2
+    assert len(connections) == 2
+    assert sum(c.sendmail.await_count for c in connections) == 10
+
+
+async def test_reconnects_when_idle_connection_was_closed_by_server():
+    transporter, connections = make_transporter()
+    await transporter.send_email(content(), {})
+
+    connections[0].sendmail.side_effect = aiosmtplib.SMTPServerDisconnected(
+        "Connection lost"
+    )
+    await transporter.send_email(content("other@example.com"), {})
+
+    assert len(connections) == 2
+    connections[0].close.assert_called_once()
+    connections[1].sendmail.assert_awaited_once()
+    assert connections[1].sendmail.await_args.args[1] == "other@example.com"
+
+
+@mark.parametrize(
+    "body, to_email",
+    [
+        ("<p>\n  Hello\n</p>\n", "user@example.com"),
+        ("<p>no trailing newline</p>", "user@example.com"),
+        ("<p>H\u00e9llo</p>", "user@example.com"),
+        ("<p>Hello</p>", "us\u00e9r@example.com"),
+    ],
+)
+async def test_html_message_matches_mime_text(body: str, to_email: str):
+    transporter, _ = make_transporter()
+    from_addr = "ST <st@example.com>"
+
+    expected = MIMEText(body, "html")
+    expected["From"] = from_addr
+    expected["To"] = to_email
+    expected["Subject"] = "subject"
+
+    for _ in range(2):
+        message = transporter._get_html_message(  # type: ignore
+            from_addr, EmailContent(body, "subject", to_email, is_html=True)
+        )
+        assert message == expected.as_string()
+
+
+async def test_compiled_template_matches_string_template():
+    template = """
+        <html>
+            <p>Hi ${name}, $name costs $$5 (${missing_dollar}$$)</p>
+
+            <a href="${link}">${link}</a>
+        </html>
+    """
+    values = {"name": "Jo", "link": "http://a/?x=$y", "missing_dollar": None}
+
+    minified = minify_html(template)
+    assert minified == (
+        "<html>\n"
+        "<p>Hi ${name}, $name costs $$5 (${missing_dollar}$$)</p>\n"
+        '<a href="${link}">${link}</a>\n'
+        "</html>"
+    )
+    assert compile_html_template(template).render(**values) == Template(
+        minified
+    ).substitute(**values)
+
+    with raises(KeyError):
+        CompiledTemplate(template).render(name="Jo")
@@ -1,10 +1,21 @@
+import json
 import os
 import threading
 from contextlib import ExitStack
+from datetime import datetime
 from typing import Any, Dict, List, Union
 from unittest.mock import patch
+from uuid import uuid4
 
-from pytest import mark, param, raises
+from pytest import importorskip, mark, param, raises
+from supertokens_python import init
+from supertokens_python.json_backend import (
+    get_json_backend,
+    json_dumps,
+    json_loads,
+    set_json_backend,
+)
+from supertokens_python.recipe import session
 from supertokens_python.utils import (
     RWMutex,
     get_top_level_domain_for_same_site_resolution,
@@ -12,7 +23,7 @@ from supertokens_python.utils import (
     is_version_gte,
 )
 
-from tests.utils import is_subset, outputs
+from tests.utils import get_st_init_args, is_subset, outputs
 
 
 @mark.parametrize(
@@ -237,3 +248,51 @@ def test_tldextract_http_toggle(
     with stack, expectation as expected_output:
         output = get_top_level_domain_for_same_site_resolution("https://google.com")
         assert output == expected_output
+
+
+@mark.parametrize("backend", ["orjson", "ujson", "json"])
+def test_json_backends_match_the_standard_library(backend: str):
+    if backend != "json":
+        importorskip(backend)
+    set_json_backend(backend)  # type: ignore
+    try:
+        obj: Dict[str, Any] = {
+            "b": [1, 2.5, None, True, "/path", 2**70],
+            "a": {"nested": "é ✓"},
+        }
+        for sort_keys in (False, True):
+            for ensure_ascii in (False, True):
+                assert json_dumps(
+                    obj, sort_keys=sort_keys, ensure_ascii=ensure_ascii
+                ) == json.dumps(
+                    obj,
+                    sort_keys=sort_keys,
+                    ensure_ascii=ensure_ascii,
+                    separators=(",", ":"),
+                )
+
+        assert json_loads(b'{"a": ["\\u00e9", 1.5, null]}') == {"a": ["é", 1.5, None]}
+        with raises(json.JSONDecodeError):
+            json_loads("{invalid")
+
+        # Integers that do not fit in 64 bits are not turned into floats
+        for big_int in (2**53 + 1, 2**64, -(2**63) - 1, 10**30):
+            assert json_loads(str(big_int)) == big_int
+            assert json_loads(f'{{"n":{big_int}}}'.encode("utf-8")) == {"n": big_int}
+            assert json_dumps([big_int]) == f"[{big_int}]"
+
+        for value in (float("nan"), float("inf"), -float("inf")):
+            with raises(ValueError):
+                json_dumps({"a": None, "b": [value]})
+        with raises(TypeError):
+            json_dumps({"at": datetime.now()})
+        if backend != "orjson":
+            with raises(TypeError):
+                json_dumps({"id": uuid4()})
+    finally:
+        set_json_backend(None)
+
+
+def test_json_backend_is_the_standard_library_by_default():
+    init(**get_st_init_args(url="http://localhost:6789", recipe_list=[session.init()]))
+    assert get_json_backend() == "json"
@@ -0,0 +1,148 @@
+# Copyright (c) 2025, VRAI Labs and/or its affiliates. All rights reserved.
+#
+# This software is licensed under the Apache License, Version 2.0 (the
+# "License") as published by the Apache Software Foundation.
+#
+# You may not use this file except in compliance with the License. You may
+# obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+from typing import Any, Dict
+
+import jwt
+import respx
+from httpx import Headers, Response
+from pytest import fixture, mark, raises
+from supertokens_python.recipe.thirdparty.providers import provider_cache
+from supertokens_python.recipe.thirdparty.providers.config_utils import (
+    get_oidc_discovery_info,
+)
+from supertokens_python.recipe.thirdparty.providers.custom import (
+    verify_id_token_from_jwks_endpoint_and_get_payload,
+)
+from supertokens_python.recipe.thirdparty.providers.provider_cache import (
+    get_ttl_from_headers,
+    reset_provider_caches,
+)
+
+from tests.utils import generate_test_signing_key
+
+pytestmark = mark.asyncio
+
+JWKS_URI = "https://provider.example.com/jwks"
+
+
+@fixture(autouse=True)
+def clear_caches():
+    reset_provider_caches()
+    yield
+    reset_provider_caches()
+
+
+def make_id_token(private_key: Any, kid: str) -> str:
+    payload: Dict[str, Any] = {"sub": "user", "aud": "client-id"}
+    return jwt.encode(payload, private_key, algorithm="RS256", headers={"kid": kid})
+
+
+async def test_jwks_is_fetched_once_and_keys_are_looked_up_by_kid():
+    key1, jwk1 = generate_test_signing_key("key-1")
+    _, jwk2 = generate_test_signing_key("key-2")
+
+    with respx.mock() as mock:
+        route = mock.get(JWKS_URI).mock(
+            Response(
+                200,
+                json={"keys": [jwk2, jwk1]},
+                headers={"cache-control": "public, max-age=3600"},
+            )
+        )
+        for _ in range(3):
+            payload = await verify_id_token_from_jwks_endpoint_and_get_payload(
+                make_id_token(key1, "key-1"), JWKS_URI, "client-id"
+            )
+            assert payload["sub"] == "user"
+
+    assert route.call_count == 1
+    entry = provider_cache.jwks_cache.get_cached(JWKS_URI)
+    assert entry is not None and entry.ttl_sec == 3600
+
+
+async def test_unknown_kid_refetches_jwks_at_most_once_per_interval():
+    old_key, old_jwk = generate_test_signing_key("old")
+    new_key, new_jwk = generate_test_signing_key("new")
+
+    with respx.mock() as mock:
+        route = mock.get(JWKS_URI).mock(
+            side_effect=[
+                Response(200, json={"keys": [old_jwk]}),
+                Response(200, json={"keys": [old_jwk, new_jwk]}),
+            ]
+        )
+        await verify_id_token_from_jwks_endpoint_and_get_payload(
+            make_id_token(old_key, "old"), JWKS_URI, "client-id"
+        )
+        # The provider rotated its keys
+        provider_cache.jwks_cache.entries[JWKS_URI].fetched_at -= 60
+        await verify_id_token_from_jwks_endpoint_and_get_payload(
+            make_id_token(new_key, "new"), JWKS_URI, "client-id"
+        )
+        assert route.call_count == 2
+
+        # A kid that is still unknown right after a refetch does not cause
+        # another one
+        with raises(Exception, match="No matching key"):
+            await verify_id_token_from_jwks_endpoint_and_get_payload(
+                make_id_token(new_key, "unknown"), JWKS_URI, "client-id"
+            )
+        assert route.call_count == 2
+
+
+async def test_keys_without_kid_are_tried_for_a_token_with_kid():
+    _, other_jwk = generate_test_signing_key("other")
+    key, jwk = generate_test_signing_key("key")
+    del other_jwk["kid"]
+    del jwk["kid"]
+
+    with respx.mock() as mock:
+        route = mock.get(JWKS_URI).mock(Response(200, json={"keys": [other_jwk, jwk]}))
+        for _ in range(2):
+            payload = await verify_id_token_from_jwks_endpoint_and_get_payload(
+                make_id_token(key, "key"), JWKS_URI, "client-id"
+            )
+            assert payload["sub"] == "user"
+
+    # The token's kid is not treated as unknown, so the JWKS is not refetched
+    assert route.call_count == 1
+
+
+async def test_oidc_discovery_document_is_cached():
+    with respx.mock() as mock:
+        route = mock.get(
+            "https://issuer.example.com/.well-known/openid-configuration"
+        ).mock(Response(200, json={"jwks_uri": JWKS_URI}))
+        for _ in range(2):
+            info = await get_oidc_discovery_info(
+                "https://issuer.example.com/.well-known/openid-configuration"
+            )
+            assert info["jwks_uri"] == JWKS_URI
+
+    assert route.call_count == 1
+
+
+async def test_ttl_from_cache_control():
+    default_ttl = provider_cache.ProviderCacheConfig["default_ttl_sec"]
+    max_ttl = provider_cache.ProviderCacheConfig["max_ttl_sec"]
+
+    assert get_ttl_from_headers(Headers({})) == default_ttl
+    assert get_ttl_from_headers(Headers({"cache-control": "public"})) == default_ttl
+    assert get_ttl_from_headers(Headers({"cache-control": "max-age=120"})) == 120
+    assert (
+        get_ttl_from_headers(Headers({"cache-control": "max-age=120", "age": "20"}))
+        == 100
+    )
+    assert get_ttl_from_headers(Headers({"cache-control": "no-store"})) == 0
+    assert get_ttl_from_headers(Headers({"cache-control": "max-age=999999"})) == max_ttl
@@ -0,0 +1,99 @@
+# Copyright (c) 2025, VRAI Labs and/or its affiliates. All rights reserved.
+#
+# This software is licensed under the Apache License, Version 2.0 (the
+# "License") as published by the Apache Software Foundation.
+#
+# You may not use this file except in compliance with the License. You may
+# obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+import asyncio
+
+import respx
+from httpx import Request, Response
+from pytest import fixture, mark, raises
+from supertokens_python.recipe.thirdparty.providers import http_client
+from supertokens_python.recipe.thirdparty.providers.http_client import (
+    ProviderHttpClientConfig,
+    get_provider_latency_metrics,
+    reset_provider_http_client,
+    set_provider_http_client_config,
+)
+from supertokens_python.recipe.thirdparty.providers.utils import (
+    do_get_request,
+    do_post_request,
+)
+
+pytestmark = mark.asyncio
+
+TOKEN_URL = "https://oauth2.provider.example.com/token"
+USER_INFO_URL = "https://api.provider.example.com/userinfo"
+
+
+@fixture(autouse=True)
+def reset_client():
+    reset_provider_http_client()
+    yield
+    reset_provider_http_client()
+
+
+async def test_requests_share_a_pooled_client_and_record_latency_per_host():
+    with respx.mock() as mock:
+        mock.post(TOKEN_URL).mock(Response(200, json={"access_token": "token"}))
+        mock.get(USER_INFO_URL).mock(
+            side_effect=[Response(200, json={"sub": "user"}), Response(503, json={})]
+        )
+
+        status, body = await do_post_request(TOKEN_URL, {"code": "code"})
+        assert status == 200 and body == {"access_token": "token"}
+        assert http_client.http_client is not None
+        client = http_client.http_client.get_client()
+
+        assert await do_get_request(USER_INFO_URL) == {"sub": "user"}
+        await do_get_request(USER_INFO_URL)
+        assert http_client.http_client.get_client() is client
+
+    metrics = get_provider_latency_metrics()
+    assert set(metrics) == {"oauth2.provider.example.com", "api.provider.example.com"}
+    token_metrics = metrics["oauth2.provider.example.com"]
+    assert token_metrics.request_count == 1 and token_metrics.error_count == 0
+    user_info_metrics = metrics["api.provider.example.com"]
+    assert user_info_metrics.request_count == 2
+    assert user_info_metrics.error_count == 1
+    assert 0 <= user_info_metrics.p50_ms <= user_info_metrics.max_ms
+
+
+async def test_concurrent_requests_are_capped_per_host():
+    set_provider_http_client_config(
+        ProviderHttpClientConfig(max_concurrent_requests_per_host=2)
+    )
+    in_flight = 0
+    max_in_flight = 0
+
+    async def user_info(_: Request) -> Response:
+        nonlocal in_flight, max_in_flight
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return Response(200, json={"sub": "user"})
+
+    with respx.mock() as mock:
+        mock.get(USER_INFO_URL).mock(side_effect=user_info)
+        mock.post(TOKEN_URL).mock(Response(200, json={}))
+        await asyncio.gather(
+            *[do_get_request(USER_INFO_URL) for _ in range(6)],
+            *[do_post_request(TOKEN_URL) for _ in range(3)],
+        )
+
+    assert max_in_flight == 2
+    assert get_provider_latency_metrics()["api.provider.example.com"].request_count == 6
+
+
+async def test_invalid_concurrency_cap_is_rejected():
+    with raises(ValueError):
+        ProviderHttpClientConfig(max_concurrent_requests_per_host=0)
@@ -0,0 +1,138 @@
+# Copyright (c) 2025, VRAI Labs and/or its affiliates. All rights reserved.
+#
+# This software is licensed under the Apache License, Version 2.0 (the
+# "License") as published by the Apache Software Foundation.
+#
+# You may not use this file except in compliance with the License. You may
+# obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+import asyncio
+from typing import Any, Dict, List
+
+import httpx
+import respx
+from pytest import mark, raises
+from supertokens_python import init
+from supertokens_python.querier import Querier
+from supertokens_python.recipe import session, usermetadata
+from supertokens_python.recipe.usermetadata.asyncio import get_users_metadata
+from supertokens_python.recipe.usermetadata.interfaces import (
+    ClearUserMetadataResult,
+    MetadataResult,
+    RecipeInterface,
+)
+from tests.utils import get_st_init_args
+
+pytestmark = mark.asyncio
+
+CORE_URL = "http://localhost:6789"
+
+
+def init_usermetadata(**kwargs: int):
+    init(
+        **get_st_init_args(
+            url=CORE_URL,
+            recipe_list=[session.init(), usermetadata.init(**kwargs)],
+        )
+    )
+    Querier.api_version = "3.0"
+
+
+async def test_users_metadata_is_fetched_with_a_sliding_window():
+    init_usermetadata(bulk_fetch_concurrency=2)
+    started: List[str] = []
+    in_flight = 0
+    max_in_flight = 0
+
+    async def get_metadata(request: httpx.Request) -> httpx.Response:
+        nonlocal in_flight, max_in_flight
+        user_id = request.url.params["userId"]
+        started.append(user_id)
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        # "slow" is still in flight while the other users are fetched
+        await asyncio.sleep(0.1 if user_id == "slow" else 0.01)
+        in_flight -= 1
+        return httpx.Response(
+            200, json={"status": "OK", "metadata": {"first_name": user_id}}
+        )
+
+    with respx.mock() as mocker:
+        route = mocker.get(f"{CORE_URL}/recipe/user/metadata").mock(
+            side_effect=get_metadata
+        )
+        result = await get_users_metadata(["slow", "a", "b", "c", "a"])
+
+    assert route.call_count == 4
+    assert max_in_flight == 2
+    assert started == ["slow", "a", "b", "c"]
+    assert result.metadata == {
+        user_id: {"first_name": user_id} for user_id in ["slow", "a", "b", "c"]
+    }
+
+
+async def test_remaining_users_are_not_fetched_after_a_failure():
+    init_usermetadata(bulk_fetch_concurrency=2)
+    started: List[str] = []
+
+    async def get_metadata(request: httpx.Request) -> httpx.Response:
+        user_id = request.url.params["userId"]
+        started.append(user_id)
+        if user_id == "failing":
+            return httpx.Response(500, text="error")
+        await asyncio.sleep(0.05)
+        return httpx.Response(200, json={"status": "OK", "metadata": {}})
+
+    with respx.mock() as mocker:
+        mocker.get(f"{CORE_URL}/recipe/user/metadata").mock(side_effect=get_metadata)
+        with raises(Exception):
+            await get_users_metadata(["slow", "failing", "a", "b", "c"])
+        await asyncio.sleep(0.1)
+
+    assert started == ["slow", "failing"]
+
+
+async def test_empty_list_of_users_does_not_query_the_core():
+    init_usermetadata()
+
+    with respx.mock(assert_all_called=False) as mocker:
+        route = mocker.get(f"{CORE_URL}/recipe/user/metadata")
+        result = await get_users_metadata([])
+
+    assert not route.called
+    assert result.metadata == {}
+
+
+async def test_invalid_bulk_fetch_concurrency_is_rejected():
+    with raises(ValueError):
+        init_usermetadata(bulk_fetch_concurrency=0)
+
+
+class MetadataOnlyRecipeInterface(RecipeInterface):
+    async def get_user_metadata(
+        self, user_id: str, user_context: Dict[str, Any]
+    ) -> MetadataResult:
+        return MetadataResult({"id": user_id})
+
+    async def update_user_metadata(
+        self,
+        user_id: str,
+        metadata_update: Dict[str, Any],
+        user_context: Dict[str, Any],
+    ) -> MetadataResult:
+        return MetadataResult(metadata_update)
+
+    async def clear_user_metadata(
+        self, user_id: str, user_context: Dict[str, Any]
+    ) -> ClearUserMetadataResult:
+        return ClearUserMetadataResult()
+
+
+async def test_recipe_interface_without_get_users_metadata_still_works():
+    result = await MetadataOnlyRecipeInterface().get_users_metadata(["a", "b", "a"], {})
+    assert result.metadata == {"a": {"id": "a"}, "b": {"id": "b"}}
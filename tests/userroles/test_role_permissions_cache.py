@@ -0,0 +1,189 @@
+# Copyright (c) 2025, VRAI Labs and/or its affiliates. All rights reserved.
+#
+# This software is licensed under the Apache License, Version 2.0 (the
+# "License") as published by the Apache Software Foundation.
+#
+# You may not use this file except in compliance with the License. You may
+# obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+import asyncio
+from typing import List
+
+import httpx
+import respx
+from pytest import mark, raises
+from supertokens_python import init
+from supertokens_python.querier import Querier
+from supertokens_python.recipe import session, userroles
+from supertokens_python.recipe.userroles import PermissionClaim
+from supertokens_python.recipe.userroles.asyncio import (
+    create_new_role_or_add_permissions,
+    delete_role,
+    get_permissions_for_role,
+    remove_permissions_from_role,
+)
+from supertokens_python.recipe.userroles.interfaces import (
+    GetPermissionsForRoleOkResult,
+)
+from supertokens_python.types import RecipeUserId
+
+from tests.utils import get_st_init_args
+
+pytestmark = mark.asyncio
+
+CORE_URL = "http://localhost:6789"
+PERMISSIONS = {"admin": ["read", "write"], "editor": ["write"], "viewer": ["read"]}
+
+
+def init_userroles(**kwargs: int):
+    init(
+        **get_st_init_args(
+            url=CORE_URL,
+            recipe_list=[session.init(), userroles.init(**kwargs)],
+        )
+    )
+    Querier.api_version = "3.0"
+
+
+def mock_core(mocker: respx.MockRouter, roles: List[str]):
+    in_flight = 0
+    max_in_flight = 0
+
+    async def get_permissions(request: httpx.Request) -> httpx.Response:
+        nonlocal in_flight, max_in_flight
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        role = request.url.params["role"]
+        return httpx.Response(
+            200, json={"status": "OK", "permissions": PERMISSIONS[role]}
+        )
+
+    mocker.get(f"{CORE_URL}/public/recipe/user/roles").mock(
+        httpx.Response(200, json={"status": "OK", "roles": roles})
+    )
+    permissions_route = mocker.get(f"{CORE_URL}/recipe/role/permissions").mock(
+        side_effect=get_permissions
+    )
+    return permissions_route, lambda: max_in_flight
+
+
+async def fetch_permissions() -> List[str]:
+    permissions = await PermissionClaim.fetch_value(
+        "user", RecipeUserId("user"), "public", {}, {}
+    )
+    assert permissions is not None
+    return sorted(permissions)
+
+
+async def test_permissions_of_distinct_roles_are_fetched_concurrently():
+    init_userroles()
+
+    with respx.mock() as mocker:
+        permissions_route, max_in_flight = mock_core(
+            mocker, ["admin", "editor", "viewer", "admin"]
+        )
+
+        assert await fetch_permissions() == ["read", "write"]
+        assert permissions_route.call_count == 3
+        assert max_in_flight() == 3
+
+        # Without the cache, every fetch goes to the core
+        await fetch_permissions()
+        assert permissions_route.call_count == 6
+
+
+async def test_role_permissions_are_cached_until_the_role_is_written():
+    init_userroles(role_permissions_cache_ttl_sec=60)
+
+    with respx.mock() as mocker:
+        permissions_route, _ = mock_core(mocker, ["admin", "editor"])
+        mocker.put(f"{CORE_URL}/recipe/role").mock(
+            httpx.Response(200, json={"status": "OK", "createdNewRole": False})
+        )
+        mocker.post(f"{CORE_URL}/recipe/role/permissions/remove").mock(
+            httpx.Response(200, json={"status": "OK"})
+        )
+        mocker.post(f"{CORE_URL}/recipe/role/remove").mock(
+            httpx.Response(200, json={"status": "OK", "didRoleExist": True})
+        )
+
+        await fetch_permissions()
+        await fetch_permissions()
+        assert permissions_route.call_count == 2
+
+        await create_new_role_or_add_permissions("admin", ["delete"])
+        await fetch_permissions()
+        assert permissions_route.call_count == 3
+
+        await remove_permissions_from_role("editor", ["write"])
+        await fetch_permissions()
+        assert permissions_route.call_count == 4
+
+        await delete_role("admin")
+        await fetch_permissions()
+        assert permissions_route.call_count == 5
+
+
+async def test_permissions_fetched_during_a_write_are_not_cached():
+    init_userroles(role_permissions_cache_ttl_sec=60)
+    permissions = {"admin": ["read", "write"]}
+    release = asyncio.Event()
+
+    async def get_permissions(request: httpx.Request) -> httpx.Response:
+        # The core reads the permissions before the write, but replies after it
+        stale = list(permissions["admin"])
+        await release.wait()
+        return httpx.Response(200, json={"status": "OK", "permissions": stale})
+
+    async def remove_permissions(request: httpx.Request) -> httpx.Response:
+        permissions["admin"] = ["read"]
+        return httpx.Response(200, json={"status": "OK"})
+
+    with respx.mock() as mocker:
+        permissions_route = mocker.get(f"{CORE_URL}/recipe/role/permissions").mock(
+            side_effect=get_permissions
+        )
+        mocker.post(f"{CORE_URL}/recipe/role/permissions/remove").mock(
+            side_effect=remove_permissions
+        )
+
+        in_flight = asyncio.ensure_future(get_permissions_for_role("admin"))
+        await asyncio.sleep(0.01)
+        await remove_permissions_from_role("admin", ["write"])
+        release.set()
+        await in_flight
+
+        result = await get_permissions_for_role("admin")
+        assert isinstance(result, GetPermissionsForRoleOkResult)
+        assert result.permissions == ["read"]
+        assert permissions_route.call_count == 2
+
+
+async def test_failed_write_drops_the_cached_permissions():
+    init_userroles(role_permissions_cache_ttl_sec=60)
+
+    with respx.mock() as mocker:
+        permissions_route = mocker.get(f"{CORE_URL}/recipe/role/permissions").mock(
+            httpx.Response(200, json={"status": "OK", "permissions": ["read"]})
+        )
+        mocker.post(f"{CORE_URL}/recipe/role/permissions/remove").mock(
+            side_effect=httpx.ConnectError("connection reset")
+        )
+
+        await get_permissions_for_role("admin")
+        with raises(Exception):
+            await remove_permissions_from_role("admin", ["read"])
+        await get_permissions_for_role("admin")
+        assert permissions_route.call_count == 2
+
+
+async def test_negative_role_permissions_cache_ttl_is_rejected():
+    with raises(ValueError):
+        init_userroles(role_permissions_cache_ttl_sec=-1)
@@ -22,7 +22,7 @@ from functools import lru_cache
 from http.cookies import SimpleCookie
 from os import environ
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union, cast
+from typing import Any, Dict, List, Optional, Tuple, Union, cast
 from unittest.mock import MagicMock
 from urllib.parse import unquote
 from uuid import uuid4
@@ -421,6 +421,24 @@ else:
             return super().__call__(*args, **kwargs)
 
 
+def generate_test_signing_key(kid: str = "d-test-key") -> Tuple[Any, Dict[str, Any]]:
+    """
+    Returns an RSA private key, and the public JWK for it with the given kid
+    """
+    from cryptography.hazmat.primitives.asymmetric import rsa
+    from jwt.algorithms import RSAAlgorithm
+
+    private_key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    jwk = json.loads(RSAAlgorithm.to_jwk(private_key.public_key()))
+    jwk.update({"kid": kid, "alg": "RS256", "use": "sig"})
+    return private_key, jwk
+
+
+def get_test_jwks(kid: str = "d-test-key") -> Dict[str, Any]:
+    _, jwk = generate_test_signing_key(kid)
+    return {"keys": [jwk]}
+
+
 def get_st_init_args(*, url: str, recipe_list: List[Any]) -> Dict[str, Any]:
     return {
         "supertokens_config": SupertokensConfig(url),